@@ -0,0 +1,275 @@
+"""
+NumPy helpers for summarizing and decimating numeric series.
+
+Used to return compact views of large series (parameter history, arrays)
+to MCP clients without sending every point.
+"""
+
+import base64
+import logging
+import math
+import os
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# How array-valued parameter results are returned (see encode_value)
+ARRAY_MODES = ("summary", "preview", "full", "base64", "npy")
+
+# Arrays with at most this many elements are always returned inline
+INLINE_ARRAY_SIZE = 32
+
+# Directory for .npy exports, and how long exported files are kept
+ARRAY_EXPORT_DIR = Path(tempfile.gettempdir()) / "instrmcp_arrays"
+ARRAY_EXPORT_TTL_S = 3600.0
+
+
+def minmax_decimate(
+    x: np.ndarray, y: np.ndarray, max_points: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Decimate a series keeping the minimum and maximum of each bucket.
+
+    Preserves spikes and envelopes, which plain subsampling loses. Points
+    are split into ``max_points // 2`` equal-count buckets; each bucket
+    contributes its min and max point in their original order. NaN values
+    are never selected unless a bucket has nothing else.
+
+    Args:
+        x: Sorted x values (e.g. timestamps)
+        y: Values, same length as x
+        max_points: Maximum number of points to return (>= 2)
+
+    Returns:
+        (x, y) of the selected points, in order
+    """
+    n = len(y)
+    if n <= max_points or max_points < 2:
+        return x, y
+
+    size = -(-n // (max_points // 2))
+    buckets = -(-n // size)
+    pad = buckets * size - n
+    y_low = np.where(np.isnan(y), np.inf, y)
+    y_high = np.where(np.isnan(y), -np.inf, y)
+    if pad:
+        y_low = np.concatenate([y_low, np.full(pad, np.inf)])
+        y_high = np.concatenate([y_high, np.full(pad, -np.inf)])
+
+    offsets = np.arange(buckets) * size
+    i_min = offsets + np.argmin(y_low.reshape(buckets, size), axis=1)
+    i_max = offsets + np.argmax(y_high.reshape(buckets, size), axis=1)
+    indices = np.unique(np.concatenate([i_min, i_max]))
+    return x[indices], y[indices]
+
+
+def lttb(
+    x: np.ndarray, y: np.ndarray, max_points: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Decimate a series with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last point and, from each of ``max_points - 2``
+    equal-count buckets, the point forming the largest triangle with the
+    previously selected point and the mean of the next bucket. The result
+    keeps the visual shape of the series. Triangle areas are computed per
+    bucket with NumPy; only the walk over buckets is sequential.
+
+    Args:
+        x: Sorted x values (e.g. timestamps)
+        y: Values, same length as x (NaN values are dropped)
+        max_points: Maximum number of points to return (>= 3)
+
+    Returns:
+        (x, y) of the selected points, in order
+    """
+    finite = ~np.isnan(y)
+    if not finite.all():
+        x, y = x[finite], y[finite]
+
+    n = len(y)
+    if n <= max_points or max_points < 3:
+        return x, y
+
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    # Mean point of each bucket, plus the last point as the final "next bucket"
+    sums_x = np.add.reduceat(x[1 : n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(y[1 : n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    mean_x = np.append(sums_x / counts, x[-1])
+    mean_y = np.append(sums_y / counts, y[-1])
+
+    previous = 0
+    for bucket in range(max_points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        ax, ay = x[previous], y[previous]
+        cx, cy = mean_x[bucket + 1], mean_y[bucket + 1]
+        area = np.abs((ax - cx) * (y[start:end] - ay) - (ax - x[start:end]) * (cy - ay))
+        previous = start + int(np.argmax(area))
+        selected[bucket + 1] = previous
+
+    return x[selected], y[selected]
+
+
+def as_numeric_array(value: Any) -> Optional[np.ndarray]:
+    """Return value as a numeric ndarray (ndim >= 1), or None if it is not one."""
+    if isinstance(value, np.ndarray):
+        array = value
+    elif isinstance(value, (list, tuple)) and value:
+        try:
+            array = np.asarray(value)
+        except ValueError:
+            # Ragged sequences
+            return None
+    else:
+        return None
+    if array.ndim == 0 or array.dtype.kind not in "biufc":
+        return None
+    return array
+
+
+def array_summary(array: np.ndarray) -> Dict[str, Any]:
+    """Shape, dtype and statistics of the finite values of an array.
+
+    NaN and infinite values are left out of the statistics and counted in
+    nan_count and inf_count, so the summary is valid strict JSON. Complex
+    arrays are summarized by magnitude ("stats_of": "abs").
+    """
+    summary: Dict[str, Any] = {
+        "shape": list(array.shape),
+        "dtype": array.dtype.str,
+        "size": int(array.size),
+    }
+    data = array
+    if array.dtype.kind == "c":
+        data = np.abs(array)
+        summary["stats_of"] = "abs"
+    if data.dtype.kind == "f":
+        valid = data[np.isfinite(data)]
+        nan_count = int(np.count_nonzero(np.isnan(data)))
+        summary["nan_count"] = nan_count
+        summary["inf_count"] = int(data.size - valid.size) - nan_count
+    else:
+        valid = data
+    if valid.size:
+        summary.update(
+            {
+                "min": valid.min().item(),
+                "max": valid.max().item(),
+                "mean": float(valid.mean()),
+                "std": float(valid.std()),
+            }
+        )
+    return summary
+
+
+def array_preview(array: np.ndarray, max_points: int) -> Dict[str, Any]:
+    """Decimated preview of an array.
+
+    1D arrays use min-max decimation (spikes are kept) and return the kept
+    indices; higher-dimensional arrays are subsampled with a stride per axis.
+    Complex values are previewed by magnitude.
+    """
+    data = np.abs(array) if array.dtype.kind == "c" else array
+    if data.ndim == 1:
+        index, values = minmax_decimate(
+            np.arange(data.size), data.astype(np.float64, copy=False), max_points
+        )
+        return {
+            "method": "minmax",
+            "index": index.tolist(),
+            "values": _to_json_list(values),
+        }
+
+    per_axis = max(1, int(max_points ** (1.0 / data.ndim)))
+    step = [max(1, math.ceil(n / per_axis)) for n in data.shape]
+    sampled = data[tuple(slice(None, None, s) for s in step)]
+    return {
+        "method": "stride",
+        "step": step,
+        "shape": list(sampled.shape),
+        "values": _to_json_list(sampled),
+    }
+
+
+def export_npy(array: np.ndarray) -> Dict[str, Any]:
+    """Write an array to a temporary .npy file and describe it.
+
+    Files older than ARRAY_EXPORT_TTL_S are removed on each export.
+    """
+    ARRAY_EXPORT_DIR.mkdir(parents=True, exist_ok=True)
+    cutoff = time.time() - ARRAY_EXPORT_TTL_S
+    for old in ARRAY_EXPORT_DIR.glob("*.npy"):
+        try:
+            if old.stat().st_mtime < cutoff:
+                old.unlink()
+        except OSError:
+            pass
+
+    path = ARRAY_EXPORT_DIR / f"{uuid.uuid4().hex}.npy"
+    np.save(path, array, allow_pickle=False)
+    return {"path": str(path), "bytes": os.path.getsize(path)}
+
+
+def encode_value(value: Any, mode: str = "summary", max_points: int = 200) -> Any:
+    """Encode a parameter value for a JSON result.
+
+    Numeric arrays with more than INLINE_ARRAY_SIZE elements are not returned
+    as lists unless mode is "full":
+
+    - "summary": shape, dtype and statistics
+    - "preview": summary plus a decimated preview of at most max_points
+    - "base64": summary plus the raw C-order buffer, base64 encoded
+    - "npy": summary plus the path of a temporary .npy file
+
+    Smaller arrays are returned as lists and NumPy scalars as Python scalars;
+    other values are returned unchanged.
+
+    Raises:
+        ValueError: If mode is unknown
+    """
+    if mode not in ARRAY_MODES:
+        raise ValueError(
+            f"Unknown array mode '{mode}', expected one of {list(ARRAY_MODES)}"
+        )
+    if isinstance(value, np.generic):
+        return value.item()
+
+    array = as_numeric_array(value)
+    if array is None:
+        return value
+    if mode == "full" or array.size <= INLINE_ARRAY_SIZE:
+        return _to_json_list(array)
+
+    encoded = array_summary(array)
+    encoded["encoding"] = mode
+    if mode == "preview":
+        encoded["preview"] = array_preview(array, max_points)
+    elif mode == "base64":
+        contiguous = np.ascontiguousarray(array)
+        encoded["order"] = "C"
+        # b64encode reads the array's buffer directly, without a bytes copy
+        encoded["data"] = base64.b64encode(contiguous).decode()
+    elif mode == "npy":
+        encoded.update(export_npy(array))
+    return encoded
+
+
+def _to_json_list(array: np.ndarray) -> list:
+    """Convert an array to nested lists for strict JSON.
+
+    Complex values become [real, imag] pairs; NaN and infinities become None.
+    """
+    if array.dtype.kind == "c":
+        array = np.stack([array.real, array.imag], axis=-1)
+    if array.dtype.kind == "f" and not np.isfinite(array).all():
+        array = np.where(np.isfinite(array), array, None)
+    return array.tolist()
@@ -9,8 +9,11 @@ import threading
 from dataclasses import dataclass, field
 from typing import Any, Optional, TYPE_CHECKING
 
+from ..instrument_io import InstrumentIO
+
 if TYPE_CHECKING:
     from ..cache import ReadCache, RateLimiter, ParameterPoller
+    from ..warm_start import WarmStartStore
 
 
 @dataclass
@@ -18,7 +21,8 @@ class SharedState:
     """Shared state passed to all backends.
 
     Contains all shared resources that multiple backends need access to,
-    including the IPython instance, cache, rate limiter, and cell capture state.
+    including the IPython instance, cache, rate limiter, instrument I/O
+    executors, and cell capture state.
     """
 
     ipython: Any
@@ -27,6 +31,10 @@ class SharedState:
     rate_limiter: "RateLimiter"
     poller: "ParameterPoller"
     min_interval_s: float = 0.2
+    # Per-instrument executors for blocking hardware calls
+    instrument_io: InstrumentIO = field(default_factory=InstrumentIO)
+    # Optional warm-start persistence (None unless enabled in instruments.yaml)
+    warm_start: Optional["WarmStartStore"] = None
 
     # Current cell capture state (modified by pre_run_cell callback)
     current_cell_content: Optional[str] = field(default=None)
@@ -87,6 +95,16 @@ class BaseBackend:
         """Access the parameter poller."""
         return self.state.poller
 
+    @property
+    def instrument_io(self):
+        """Access the per-instrument I/O executors."""
+        return self.state.instrument_io
+
+    @property
+    def warm_start(self):
+        """Access the warm-start store (None if persistence is disabled)."""
+        return self.state.warm_start
+
     @property
     def min_interval_s(self):
         """Access the minimum interval setting."""
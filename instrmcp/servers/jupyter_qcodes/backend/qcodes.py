@@ -4,6 +4,7 @@ QCodes backend for instrument operations.
 Handles all QCodes-related operations including:
 - Instrument discovery and information
 - Parameter reading with caching and rate limiting
+- Background parameter subscriptions
 - Station snapshot
 - Cleanup
 """
@@ -12,12 +13,79 @@ import asyncio
 import time
 import logging
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Union, Set
+from collections.abc import Sequence
+from fnmatch import fnmatchcase
+from typing import Dict, List, Any, Optional, Union, Set, Tuple
 
 from .base import BaseBackend, SharedState
+from ..array_utils import ARRAY_MODES, encode_value
+from ..cache import ParameterIndex, structure_fingerprint
+from ..snapshot import STATION_PART, SnapshotStore, select_path
+from ..warm_start import InstrumentState
+from ..instrument_io import (
+    InstrumentQueueFull,
+    InstrumentUnavailable,
+    detect_bus,
+)
 
 logger = logging.getLogger(__name__)
 
+# Characters that make an instrument or parameter name a glob pattern
+_GLOB_CHARS = frozenset("*?[")
+
+# Maximum number of parameters a single pattern may expand to
+MAX_PATTERN_MATCHES = 256
+
+
+# Attribute names checked for channels on objects without QCoDeS structure
+_CHANNEL_ATTRS = (
+    "ch01",
+    "ch02",
+    "ch03",
+    "ch04",
+    "ch05",
+    "ch06",
+    "ch07",
+    "ch08",
+    "ch1",
+    "ch2",
+    "ch3",
+    "ch4",
+    "ch5",
+    "ch6",
+    "ch7",
+    "ch8",
+    "channel",
+    "channels",
+    "gate",
+    "gates",
+    "source",
+    "drain",
+)
+
+
+def _is_glob(name: Any) -> bool:
+    return isinstance(name, str) and not _GLOB_CHARS.isdisjoint(name)
+
+
+def _channel_sequence(obj: Any) -> Optional[List[Any]]:
+    """Channels of a QCoDeS channel list (ChannelList/ChannelTuple), else None."""
+    if isinstance(obj, Sequence) and not isinstance(obj, (str, bytes)):
+        return [channel for channel in obj if hasattr(channel, "parameters")]
+    return None
+
+
+def _channel_by_name(obj: Any, name: str) -> Any:
+    """Channel of a channel list with the given short name, or None."""
+    for channel in _channel_sequence(obj) or ():
+        if getattr(channel, "short_name", None) == name:
+            return channel
+    return None
+
+
+def _class_name(obj: Any) -> str:
+    return f"{type(obj).__module__}.{type(obj).__qualname__}"
+
 
 class QCodesBackend(BaseBackend):
     """Backend for QCodes instrument operations and cache management."""
@@ -31,6 +99,21 @@ class QCodesBackend(BaseBackend):
             state: SharedState instance containing shared resources
         """
         super().__init__(state)
+        # cache key -> future resolving to (value, timestamp) of the live read
+        # currently in flight for that parameter (single-flight coalescing)
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        # instrument name -> indexed parameter paths (see _get_parameter)
+        self._param_index = ParameterIndex()
+        # instrument name -> versioned structural snapshot (see get_station_snapshot)
+        self._snapshots = SnapshotStore()
+        # Instrument names in the namespace, refreshed by sync_instruments();
+        # None until the first scan
+        self._instrument_names: Optional[List[str]] = None
+        # Saved warm-start state not yet restored, by instrument name;
+        # None until the warm-start file is loaded (see _restore_warm_start)
+        self._warm_pending: Optional[Dict[str, InstrumentState]] = None
+        self._warm_lock = asyncio.Lock()
+        self._warm_save_task: Optional[asyncio.Task] = None
 
     def _get_instrument(self, name: str):
         """Get instrument from namespace."""
@@ -54,6 +137,13 @@ class QCodesBackend(BaseBackend):
     def _get_parameter(self, instrument_name: str, parameter_name: str):
         """Get parameter object from instrument, supporting hierarchical paths.
 
+        Paths are resolved through the per-instrument parameter index, which is
+        built once from parameter discovery. Paths the index does not cover
+        (e.g. IDN or beyond the discovery depth) fall back to a hierarchy walk.
+
+        Discovery runs on the calling thread, so this is for callers already on
+        an instrument executor; on the event loop use _resolve_parameter.
+
         Args:
             instrument_name: Name of the instrument in namespace
             parameter_name: Parameter name or hierarchical path (e.g., "ch01.voltage", "submodule.param")
@@ -63,6 +153,57 @@ class QCodesBackend(BaseBackend):
         """
         instr = self._get_instrument(instrument_name)
 
+        entry = self._param_index.get(instrument_name, instr)
+        if entry is None:
+            entry = self._build_parameter_index(instrument_name, instr)
+
+        return self._lookup_parameter(instr, parameter_name, entry.parameters)
+
+    async def _resolve_parameter(self, instrument_name: str, parameter_name: str):
+        """Get parameter object from instrument without blocking the event loop.
+
+        Like _get_parameter, but a missing index is built through
+        _get_index_entry (on the instrument's executor, with a timeout). If
+        discovery times out, the path is resolved by a hierarchy walk.
+        """
+        instr = self._get_instrument(instrument_name)
+
+        entry = await self._get_index_entry(instrument_name, instr)
+        indexed = entry.parameters if entry is not None else {}
+
+        return self._lookup_parameter(instr, parameter_name, indexed)
+
+    def _lookup_parameter(self, instr, parameter_name: str, indexed: Dict[str, Any]):
+        """Resolve a parameter path from the index, falling back to a hierarchy walk."""
+        param = indexed.get(parameter_name)
+        if param is not None:
+            return param
+
+        return self._walk_parameter_path(instr, parameter_name, indexed)
+
+    def _build_parameter_index(self, instrument_name: str, instr, max_depth: int = 4):
+        """Discover all parameters of an instrument and store them in the index.
+
+        Args:
+            instrument_name: Name of the instrument in namespace
+            instr: The instrument object
+            max_depth: Maximum hierarchy depth to search
+
+        Returns:
+            The stored IndexEntry
+        """
+        objects: Dict[str, Any] = {}
+        self._discover_parameters_recursive(instr, max_depth=max_depth, objects=objects)
+        return self._param_index.store(instrument_name, instr, objects, max_depth)
+
+    def _walk_parameter_path(self, instr, parameter_name: str, indexed: Dict[str, Any]):
+        """Resolve a parameter path by walking submodules and channel attributes.
+
+        Args:
+            instr: The instrument object
+            parameter_name: Hierarchical parameter path
+            indexed: Indexed parameters of the instrument, used for error messages
+        """
         # Split parameter path for hierarchical access
         path_parts = parameter_name.split(".")
         current_obj = instr
@@ -78,11 +219,7 @@ class QCodesBackend(BaseBackend):
                     )
 
                 if part not in current_obj.parameters:
-                    available_params = (
-                        list(current_obj.parameters.keys())
-                        if hasattr(current_obj, "parameters")
-                        else []
-                    )
+                    available_params = list(current_obj.parameters.keys())
                     raise ValueError(
                         f"Parameter '{part}' not found in '{'.'.join(path_parts[: i + 1])}'. Available parameters: {available_params}"
                     )
@@ -95,42 +232,32 @@ class QCodesBackend(BaseBackend):
                     and part in current_obj.submodules
                 ):
                     current_obj = current_obj.submodules[part]
+                elif _channel_by_name(current_obj, part) is not None:
+                    # Channel of a channel list (e.g., channels.ChA)
+                    current_obj = _channel_by_name(current_obj, part)
                 elif hasattr(current_obj, part):
                     # Direct attribute access (e.g., ch01, ch02)
                     current_obj = getattr(current_obj, part)
                 else:
-                    # Look in submodules for the part
+                    # List submodules plus indexed channels at this level
                     available_subs = []
                     if hasattr(current_obj, "submodules"):
                         available_subs.extend(current_obj.submodules.keys())
-                    # Add direct attributes that look like channels/submodules
-                    for attr_name in dir(current_obj):
-                        if not attr_name.startswith("_"):
-                            attr_obj = getattr(current_obj, attr_name, None)
-                            if (
-                                hasattr(attr_obj, "parameters")
-                                and attr_name not in available_subs
-                            ):
-                                available_subs.append(attr_name)
+                    for path in indexed:
+                        segments = path.split(".")
+                        if (
+                            len(segments) > i + 1
+                            and segments[:i] == path_parts[:i]
+                            and segments[i] not in available_subs
+                        ):
+                            available_subs.append(segments[i])
 
                     raise ValueError(
                         f"Submodule/channel '{part}' not found in '{'.'.join(path_parts[: i + 1])}'. Available: {available_subs}"
                     )
 
-        # If we get here with no path parts, it's a direct parameter
-        if not hasattr(instr, "parameters"):
-            raise ValueError(f"Instrument '{instrument_name}' has no parameters")
-
-        if parameter_name not in instr.parameters:
-            available_params = list(instr.parameters.keys())
-            raise ValueError(
-                f"Parameter '{parameter_name}' not found in '{instrument_name}'. Available parameters: {available_params}"
-            )
-
-        return instr.parameters[parameter_name]
-
     def _discover_parameters_recursive(
-        self, obj, prefix="", depth=0, max_depth=4, visited=None
+        self, obj, prefix="", depth=0, max_depth=4, visited=None, objects=None
     ):
         """Recursively discover all parameters in an object hierarchy with cycle protection.
 
@@ -140,6 +267,7 @@ class QCodesBackend(BaseBackend):
             depth: Current recursion depth
             max_depth: Maximum recursion depth to prevent infinite loops
             visited: Set of already visited object IDs
+            objects: Optional dict filled with path -> Parameter object
 
         Returns:
             List of parameter paths
@@ -168,69 +296,50 @@ class QCodesBackend(BaseBackend):
         try:
             # Add direct parameters
             if hasattr(obj, "parameters"):
-                for param_name in obj.parameters.keys():
+                for param_name, param in obj.parameters.items():
                     if param_name in exclude_params:
                         continue
                     full_path = f"{prefix}.{param_name}" if prefix else param_name
                     parameters.append(full_path)
-
-            # Recursively check submodules
-            if hasattr(obj, "submodules"):
-                for sub_name, sub_obj in obj.submodules.items():
-                    if sub_obj is not None:
-                        sub_prefix = f"{prefix}.{sub_name}" if prefix else sub_name
-                        sub_params = self._discover_parameters_recursive(
-                            sub_obj, sub_prefix, depth + 1, max_depth, visited
-                        )
-                        parameters.extend(sub_params)
-
-            # Check common channel/submodule attribute names (whitelist approach)
-            channel_attrs = [
-                "ch01",
-                "ch02",
-                "ch03",
-                "ch04",
-                "ch05",
-                "ch06",
-                "ch07",
-                "ch08",
-                "ch1",
-                "ch2",
-                "ch3",
-                "ch4",
-                "ch5",
-                "ch6",
-                "ch7",
-                "ch8",
-                "channel",
-                "channels",
-                "gate",
-                "gates",
-                "source",
-                "drain",
-            ]
-
-            for attr_name in channel_attrs:
-                if hasattr(obj, attr_name):
-                    try:
-                        attr_obj = getattr(obj, attr_name, None)
-                        if attr_obj is not None and hasattr(attr_obj, "parameters"):
-                            # Skip if already covered by submodules
-                            if (
-                                hasattr(obj, "submodules")
-                                and attr_name in obj.submodules
-                            ):
-                                continue
-                            attr_prefix = (
-                                f"{prefix}.{attr_name}" if prefix else attr_name
-                            )
-                            attr_params = self._discover_parameters_recursive(
-                                attr_obj, attr_prefix, depth + 1, max_depth, visited
+                    if objects is not None:
+                        objects[full_path] = param
+
+            # Child modules are found from the instrument's own structure:
+            # submodules, the channels of channel lists, and channels whose
+            # parent is this object under any attribute name
+            children = self._child_modules(obj)
+            for child_name, child in children:
+                child_prefix = f"{prefix}.{child_name}" if prefix else child_name
+                child_params = self._discover_parameters_recursive(
+                    child, child_prefix, depth + 1, max_depth, visited, objects
+                )
+                parameters.extend(child_params)
+
+            # Fallback for objects without QCoDeS structure: check common
+            # channel/submodule attribute names (whitelist approach)
+            if not children:
+                for attr_name in _CHANNEL_ATTRS:
+                    if hasattr(obj, attr_name):
+                        try:
+                            attr_obj = getattr(obj, attr_name, None)
+                            if attr_obj is not None and hasattr(attr_obj, "parameters"):
+                                attr_prefix = (
+                                    f"{prefix}.{attr_name}" if prefix else attr_name
+                                )
+                                attr_params = self._discover_parameters_recursive(
+                                    attr_obj,
+                                    attr_prefix,
+                                    depth + 1,
+                                    max_depth,
+                                    visited,
+                                    objects,
+                                )
+                                parameters.extend(attr_params)
+                        except Exception as e:
+                            logger.debug(
+                                f"Error accessing attribute '{attr_name}': {e}"
                             )
-                            parameters.extend(attr_params)
-                    except Exception as e:
-                        logger.debug(f"Error accessing attribute '{attr_name}': {e}")
-                        continue
+                            continue
 
         except Exception as e:
             logger.error(f"Error in parameter discovery at prefix '{prefix}': {e}")
@@ -240,6 +349,59 @@ class QCodesBackend(BaseBackend):
 
         return parameters
 
+    def _child_modules(self, obj) -> List[Tuple[str, Any]]:
+        """List (path segment, module) of the child modules of an instrument.
+
+        Submodules come first. A channel list submodule (ChannelList or
+        ChannelTuple) contributes the channels not registered as submodules
+        themselves, as "<list name>.<channel short name>". Public attributes
+        holding a channel or channel list whose parent is obj are included too,
+        so drivers that keep channels outside submodules are still covered.
+        """
+        children: List[Tuple[str, Any]] = []
+        seen: Set[int] = set()
+
+        def add(name: str, module: Any):
+            if id(module) not in seen:
+                seen.add(id(module))
+                children.append((name, module))
+
+        submodules = getattr(obj, "submodules", None)
+        lists: List[Tuple[str, List[Any]]] = []
+        if isinstance(submodules, dict):
+            for sub_name, sub_obj in submodules.items():
+                if sub_obj is None:
+                    continue
+                channels = _channel_sequence(sub_obj)
+                if channels is not None:
+                    lists.append((sub_name, channels))
+                elif hasattr(sub_obj, "parameters"):
+                    add(sub_name, sub_obj)
+
+        try:
+            attributes = list(vars(obj).items())
+        except TypeError:
+            attributes = []
+        for attr_name, value in attributes:
+            if attr_name.startswith("_") or id(value) in seen:
+                continue
+            channels = _channel_sequence(value)
+            if channels is not None:
+                owned = [c for c in channels if getattr(c, "_parent", None) is obj]
+                if owned:
+                    lists.append((attr_name, owned))
+            elif getattr(value, "_parent", None) is obj and hasattr(
+                value, "parameters"
+            ):
+                add(attr_name, value)
+
+        for list_name, channels in lists:
+            for channel in channels:
+                short_name = getattr(channel, "short_name", None)
+                if short_name:
+                    add(f"{list_name}.{short_name}", channel)
+        return children
+
     def _make_cache_key(self, instrument_name: str, parameter_path: str) -> tuple:
         """Create a cache key for a parameter.
 
@@ -287,83 +449,200 @@ class QCodesBackend(BaseBackend):
             instrument_name: Name of the instrument
             parameter_name: Parameter path (supports hierarchical paths like "ch01.voltage")
         """
-        param = self._get_parameter(instrument_name, parameter_name)
+        param = await self._resolve_parameter(instrument_name, parameter_name)
+
+        # Run on the instrument's executor to avoid blocking the event loop
+        return await self._run_io(instrument_name, param.get)
+
+    def _cache_source(self, key: Tuple[str, str]) -> str:
+        """Source reported for a read-cache entry ("restored" or "cache")."""
+        return "restored" if self.cache.is_restored(key) else "cache"
+
+    async def _driver_cache_entry(
+        self, instrument_name: str, parameter_name: str
+    ) -> Optional[Tuple[Any, float]]:
+        """Get (value, timestamp) from the parameter's own QCoDeS cache.
+
+        Never touches hardware. Returns None if the parameter cannot be
+        resolved or its cache was never filled, was invalidated or has
+        expired (max_val_age).
+        """
+        try:
+            param = await self._resolve_parameter(instrument_name, parameter_name)
+            cache = param.cache
+            timestamp = cache.timestamp
+            if timestamp is None or not cache.valid:
+                return None
+            # Checked here too: not every QCoDeS version expires valid by age
+            max_val_age = getattr(cache, "max_val_age", None)
+            if (
+                max_val_age is not None
+                and time.time() - timestamp.timestamp() > max_val_age
+            ):
+                return None
+            return cache.get(get_if_invalid=False), timestamp.timestamp()
+        except Exception:
+            return None
+
+    def _assign_io_group(self, instrument_name: str) -> None:
+        """Route an instrument to a shared bus executor if it is on GPIB.
+
+        Groups configured in ~/.instrmcp/instruments.yaml take precedence.
+        """
+        if instrument_name in self.instrument_io.groups:
+            return
+        bus = detect_bus(self.namespace.get(instrument_name))
+        self.instrument_io.assign(instrument_name, bus or instrument_name)
+
+    async def _run_io(self, instrument_name: str, func, *args, **kwargs) -> Any:
+        """Run a blocking hardware call on the instrument's executor."""
+        self._assign_io_group(instrument_name)
+        return await self.instrument_io.run(instrument_name, func, *args, **kwargs)
+
+    def _scan_instrument_names(self) -> List[str]:
+        """Scan the namespace for QCoDeS instruments, in namespace order."""
+        try:
+            from qcodes.instrument import InstrumentBase
+        except ImportError:
+            return []
+
+        # Copy items: the kernel thread may mutate the namespace concurrently
+        return [
+            name
+            for name, obj in list(self.namespace.items())
+            if isinstance(obj, InstrumentBase)
+        ]
+
+    def sync_instruments(self) -> Dict[str, List[str]]:
+        """Reconcile the discovery cache with the instruments in the namespace.
+
+        Called from post_run_cell on the kernel thread. Only rescans names;
+        discovery of new or rebound instruments is deferred to the next
+        listing, and entries of removed instruments are dropped.
+
+        Returns:
+            Dict with "added" and "removed" instrument names
+        """
+        previous = self._instrument_names
+        names = self._scan_instrument_names()
+        self._instrument_names = names
+
+        if previous is None:
+            return {"added": names, "removed": []}
+
+        current = set(names)
+        removed = [name for name in previous if name not in current]
+        for name in removed:
+            self._param_index.invalidate(name)
+            self._snapshots.invalidate(name)
+        known = set(previous)
+        added = [name for name in names if name not in known]
+        if added or removed:
+            logger.debug(f"Instruments changed: added={added}, removed={removed}")
+        return {"added": added, "removed": removed}
+
+    async def _get_index_entry(self, name: str, obj, max_depth: int = 4):
+        """Get the cached index entry for an instrument, discovering it if needed.
+
+        Discovery runs on the instrument's executor with a 5 second timeout.
+
+        Returns:
+            IndexEntry, or None if discovery timed out
+        """
+        entry = self._param_index.get(name, obj, max_depth)
+        if entry is not None:
+            return entry
+
+        try:
+            return await asyncio.wait_for(
+                self._run_io(name, self._build_parameter_index, name, obj, max_depth),
+                timeout=5.0,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Parameter discovery timed out for instrument '{name}', using basic parameters"
+            )
+            return None
+        except (InstrumentUnavailable, InstrumentQueueFull) as e:
+            logger.warning(f"Skipping parameter discovery for '{name}': {e}")
+            return None
 
-        # Use asyncio.to_thread to avoid blocking the event loop
-        return await asyncio.to_thread(param.get)
+    def _summarize_instrument(
+        self, name: str, obj, all_parameters: List[str]
+    ) -> Dict[str, Any]:
+        """Build the list_instruments summary of one instrument."""
+        # Group parameters by hierarchy level
+        direct_params = []
+        channel_params: Dict[str, List[str]] = {}
+
+        for param_path in all_parameters:
+            if "." not in param_path:
+                direct_params.append(param_path)
+            else:
+                channel = param_path.split(".")[0]
+                channel_params.setdefault(channel, []).append(param_path)
+
+        return {
+            "name": name,
+            "type": obj.__class__.__name__,
+            "module": obj.__class__.__module__,
+            "label": getattr(obj, "label", name),
+            "address": getattr(obj, "address", None),
+            "parameters": direct_params,
+            "all_parameters": all_parameters,
+            "channel_parameters": channel_params,
+            "has_channels": len(channel_params) > 0,
+            "parameter_count": len(all_parameters),
+        }
 
     async def list_instruments(self, max_depth: int = 4) -> List[Dict[str, Any]]:
         """List all QCoDeS instruments in the namespace with hierarchical parameter discovery.
 
+        Discovery results and summaries are cached per instrument and reused
+        while the instrument object and its structure fingerprint are unchanged,
+        so repeated listings are served from memory.
+
         Args:
             max_depth: Maximum hierarchy depth to search (default: 4, prevents infinite loops)
         """
-        instruments = []
+        try:
+            from qcodes.instrument import InstrumentBase
+        except ImportError:
+            # QCoDeS not available
+            return []
 
-        for name, obj in self.namespace.items():
-            try:
-                from qcodes.instrument import InstrumentBase
+        await self._restore_warm_start()
 
-                if isinstance(obj, InstrumentBase):
-                    # Parameters to exclude (internal/special parameters)
-                    exclude_params = {"IDN", "idn"}
+        names = self._instrument_names
+        if names is None:
+            names = self._instrument_names = self._scan_instrument_names()
 
-                    # Discover all parameters recursively with depth limit and timeout
-                    try:
-                        # Add timeout protection (5 seconds max)
-                        all_parameters = await asyncio.wait_for(
-                            asyncio.to_thread(
-                                self._discover_parameters_recursive,
-                                obj,
-                                max_depth=max_depth,
-                            ),
-                            timeout=5.0,
-                        )
-                    except asyncio.TimeoutError:
-                        logger.warning(
-                            f"Parameter discovery timed out for instrument '{name}', using basic parameters"
-                        )
-                        # Fall back to direct parameters only (excluding IDN)
-                        all_parameters = (
-                            [
-                                p
-                                for p in obj.parameters.keys()
-                                if p not in exclude_params
-                            ]
-                            if hasattr(obj, "parameters")
-                            else []
-                        )
-
-                    # Group parameters by hierarchy level
-                    direct_params = []
-                    channel_params = {}
-
-                    for param_path in all_parameters:
-                        if "." not in param_path:
-                            direct_params.append(param_path)
-                        else:
-                            parts = param_path.split(".")
-                            channel = parts[0]
-                            if channel not in channel_params:
-                                channel_params[channel] = []
-                            channel_params[channel].append(param_path)
+        instruments = []
 
+        for name in names:
+            obj = self.namespace.get(name)
+            if not isinstance(obj, InstrumentBase):
+                continue
+
+            try:
+                entry = await self._get_index_entry(name, obj, max_depth)
+                if entry is None:
+                    # Fall back to direct parameters only (excluding IDN)
+                    exclude_params = {"IDN", "idn"}
+                    all_parameters = [
+                        p for p in obj.parameters.keys() if p not in exclude_params
+                    ]
                     instruments.append(
-                        {
-                            "name": name,
-                            "type": obj.__class__.__name__,
-                            "module": obj.__class__.__module__,
-                            "label": getattr(obj, "label", name),
-                            "address": getattr(obj, "address", None),
-                            "parameters": direct_params,
-                            "all_parameters": all_parameters,
-                            "channel_parameters": channel_params,
-                            "has_channels": len(channel_params) > 0,
-                            "parameter_count": len(all_parameters),
-                        }
+                        self._summarize_instrument(name, obj, all_parameters)
+                    )
+                    continue
+
+                if entry.summary is None:
+                    entry.summary = self._summarize_instrument(
+                        name, obj, list(entry.parameters)
                     )
-            except (ImportError, AttributeError):
-                # Not a QCoDeS instrument or QCoDeS not available
+                instruments.append(dict(entry.summary))
+            except AttributeError:
                 continue
 
         logger.debug(f"Found {len(instruments)} QCoDeS instruments")
@@ -379,6 +658,8 @@ class QCodesBackend(BaseBackend):
             with_values: Include cached parameter values
             max_depth: Maximum hierarchy depth to search (default: 4, prevents infinite loops)
         """
+        await self._restore_warm_start()
+
         # Handle wildcard to list all instruments
         if name == "*":
             instruments = await self.list_instruments(max_depth=max_depth)
@@ -393,30 +674,28 @@ class QCodesBackend(BaseBackend):
         # Parameters to exclude (internal/special parameters)
         exclude_params = {"IDN", "idn"}
 
-        # Get basic snapshot
-        snapshot = await asyncio.to_thread(instr.snapshot, update=False)
+        # Get basic snapshot; without values the cached structural one is reused
+        if with_values:
+            snapshot = await self._run_io(name, instr.snapshot, update=False)
+        else:
+            snapshot = (await self._structural_snapshot(name, instr)).snapshot
 
-        # Remove IDN from snapshot parameters if present
+        # Remove IDN from snapshot parameters (copied: the snapshot may be cached)
         if "parameters" in snapshot:
-            for param_name in exclude_params:
-                snapshot["parameters"].pop(param_name, None)
-
-        if not with_values:
-            self._strip_parameter_values(snapshot)
+            snapshot = {
+                **snapshot,
+                "parameters": {
+                    param_name: param
+                    for param_name, param in snapshot["parameters"].items()
+                    if param_name not in exclude_params
+                },
+            }
 
-        # Enhance with hierarchical information with depth limit and timeout
-        try:
-            # Add timeout protection (5 seconds max)
-            all_parameters = await asyncio.wait_for(
-                asyncio.to_thread(
-                    self._discover_parameters_recursive, instr, max_depth=max_depth
-                ),
-                timeout=5.0,
-            )
-        except asyncio.TimeoutError:
-            logger.warning(
-                f"Parameter discovery timed out for instrument '{name}', using basic parameters"
-            )
+        # Enhance with hierarchical information (cached discovery)
+        entry = await self._get_index_entry(name, instr, max_depth)
+        if entry is not None:
+            all_parameters = list(entry.parameters)
+        else:
             # Fall back to direct parameters only (excluding IDN)
             all_parameters = (
                 [p for p in instr.parameters.keys() if p not in exclude_params]
@@ -444,7 +723,7 @@ class QCodesBackend(BaseBackend):
         if with_values:
             for param_path in all_parameters:
                 key = self._make_cache_key(name, param_path)
-                cached = await self.cache.get(key)
+                cached = self.cache.peek(key)
                 if cached:
                     value, timestamp = cached
                     cached_values[param_path] = {
@@ -452,6 +731,8 @@ class QCodesBackend(BaseBackend):
                         "timestamp": timestamp,
                         "age_seconds": time.time() - timestamp,
                     }
+                    if self.cache.is_restored(key):
+                        cached_values[param_path]["restored"] = True
 
         # Enhance snapshot with hierarchy info
         enhanced_snapshot = {
@@ -484,7 +765,7 @@ class QCodesBackend(BaseBackend):
         Returns:
             Dictionary with parameter metadata
         """
-        param = self._get_parameter(instrument_name, parameter_name)
+        param = await self._resolve_parameter(instrument_name, parameter_name)
 
         # Core metadata (always returned)
         info: Dict[str, Any] = {
@@ -557,7 +838,11 @@ class QCodesBackend(BaseBackend):
         return info
 
     async def _get_single_parameter_value(
-        self, instrument_name: str, parameter_name: str, fresh: bool = False
+        self,
+        instrument_name: str,
+        parameter_name: str,
+        fresh: bool = False,
+        max_age_s: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Internal method to get a single parameter value with caching and rate limiting.
 
@@ -565,22 +850,93 @@ class QCodesBackend(BaseBackend):
             instrument_name: Name of the instrument
             parameter_name: Parameter path (supports hierarchical paths like "ch01.voltage")
             fresh: Force fresh read from hardware
+            max_age_s: Serve from cache only if the entry is at most this old;
+                defaults to the parameter's cache TTL (no limit if none is set)
+
+        Concurrent live reads of the same parameter are coalesced: callers that
+        arrive while a read is in flight share its value and timestamp and are
+        reported with source "coalesced".
+
+        When an age limit applies (max_age_s or a TTL), the parameter's own
+        QCoDeS cache is consulted too: values set or read elsewhere in the
+        kernel (e.g. by a running sweep) are served with source "driver_cache"
+        if they are newer than our cached entry and within the limit, and are
+        adopted into the read cache.
+
+        Values restored from a warm start are reported with source
+        "restored" and stale until the parameter is read again.
+
+        Live reads are bounded by the instrument's deadline. While the
+        instrument's circuit breaker is open, no read is attempted: the cached
+        value is returned marked stale, with the breaker state under "circuit".
         """
         key = self._make_cache_key(instrument_name, parameter_name)
         now = time.time()
 
-        # Check cache first (fast path for non-fresh reads)
-        cached = await self.cache.get(key)
+        # Check cache first (fast path for non-fresh reads within max age)
+        if not fresh:
+            hit = await self.cache.get(key, max_age_s)
+            limit = max_age_s if max_age_s is not None else self.cache.get_ttl(key)
+            if limit is not None:
+                driver = await self._driver_cache_entry(
+                    instrument_name, parameter_name
+                )
+                if (
+                    driver is not None
+                    and now - driver[1] <= limit
+                    and (hit is None or driver[1] > hit[1])
+                ):
+                    value, timestamp = driver
+                    await self.cache.set(key, value, timestamp)
+                    return {
+                        "value": value,
+                        "timestamp": timestamp,
+                        "age_seconds": now - timestamp,
+                        "source": "driver_cache",
+                        "stale": False,
+                    }
+            if hit:
+                value, timestamp = hit
+                # Values restored from a warm start were not read since the
+                # restart, so they are served marked stale
+                restored = self.cache.is_restored(key)
+                return {
+                    "value": value,
+                    "timestamp": timestamp,
+                    "age_seconds": now - timestamp,
+                    "source": "restored" if restored else "cache",
+                    "stale": restored,
+                }
 
-        if not fresh and cached:
-            value, timestamp = cached
-            return {
-                "value": value,
-                "timestamp": timestamp,
-                "age_seconds": now - timestamp,
-                "source": "cache",
-                "stale": False,
-            }
+        # Entry of any age, used as fallback when the live read is not possible
+        cached = self.cache.peek(key)
+
+        # Fail fast while the instrument's circuit breaker is open
+        if not self.instrument_io.is_available(instrument_name):
+            breaker = self.instrument_io.breaker_state(instrument_name)
+            message = (
+                f"Instrument '{instrument_name}' is unavailable "
+                f"(circuit {breaker['state']}: {breaker['last_error']})"
+            )
+            if cached:
+                value, timestamp = cached
+                return {
+                    "value": value,
+                    "timestamp": timestamp,
+                    "age_seconds": now - timestamp,
+                    "source": self._cache_source(key),
+                    "stale": True,
+                    "circuit": breaker,
+                    "message": message,
+                }
+            raise InstrumentUnavailable(message, breaker)
+
+        # Attach to an identical live read that is already in flight
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await self._await_inflight_read(
+                instrument_name, parameter_name, inflight, cached
+            )
 
         # Check rate limiting BEFORE any live read (applies to all live reads)
         can_access = await self.rate_limiter.can_access(instrument_name)
@@ -589,53 +945,134 @@ class QCodesBackend(BaseBackend):
             # Rate limited - return cached value if available
             if cached:
                 value, timestamp = cached
+                rate_hz, burst = self.rate_limiter.get_policy(instrument_name)
                 return {
                     "value": value,
                     "timestamp": timestamp,
                     "age_seconds": now - timestamp,
-                    "source": "cache",
+                    "source": self._cache_source(key),
                     "stale": True,
                     "rate_limited": True,
-                    "message": f"Rate limited (min interval: {self.min_interval_s}s)",
+                    "rate_limit": {"rate_hz": rate_hz, "burst": burst},
+                    "message": f"Rate limited ({rate_hz:g} reads/s, burst {burst})",
                 }
             # No cache - must wait for rate limit before reading
             # (fall through to live read which will wait_if_needed)
 
+        # Another caller may have started the read while we checked the limiter
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await self._await_inflight_read(
+                instrument_name, parameter_name, inflight, cached
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+
         # Read fresh value from hardware
         try:
-            async with self.rate_limiter.get_instrument_lock(instrument_name):
-                await self.rate_limiter.wait_if_needed(instrument_name)
-
-                value = await self._read_parameter_live(instrument_name, parameter_name)
-                read_time = time.time()
+            # Queue for a read token before the instrument lock, so the
+            # limiter (not lock order) decides who reads next
+            await self.rate_limiter.wait_if_needed(instrument_name)
+            try:
+                async with self.rate_limiter.get_instrument_lock(instrument_name):
+                    value = await self._read_parameter_live(
+                        instrument_name, parameter_name
+                    )
+                    read_time = time.time()
+                    future.set_result((value, read_time))
 
-                await self.cache.set(key, value, read_time)
+                    await self.cache.set(key, value, read_time)
+            finally:
+                # Settle the token even if the read failed
                 await self.rate_limiter.record_access(instrument_name)
 
-                return {
-                    "value": value,
-                    "timestamp": read_time,
-                    "age_seconds": 0,
-                    "source": "live",
-                    "stale": False,
-                }
+            return {
+                "value": value,
+                "timestamp": read_time,
+                "age_seconds": 0,
+                "source": "live",
+                "stale": False,
+            }
 
         except Exception as e:
             logger.error(f"Error reading {instrument_name}.{parameter_name}: {e}")
+            if not future.done():
+                future.set_exception(e)
+                # Mark retrieved so a read without followers does not log a warning
+                future.exception()
 
             # Fall back to cached value if available
             if cached:
                 value, timestamp = cached
-                return {
+                result = {
                     "value": value,
                     "timestamp": timestamp,
                     "age_seconds": now - timestamp,
-                    "source": "cache",
+                    "source": self._cache_source(key),
                     "stale": True,
                     "error": str(e),
                 }
+                if not self.instrument_io.is_available(instrument_name):
+                    result["circuit"] = self.instrument_io.breaker_state(
+                        instrument_name
+                    )
+                return result
             else:
                 raise
+        finally:
+            if not future.done():
+                # Cancelled mid-read: release any callers attached to this read
+                future.set_exception(
+                    RuntimeError(
+                        f"Read of {instrument_name}.{parameter_name} cancelled"
+                    )
+                )
+                future.exception()
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def _await_inflight_read(
+        self,
+        instrument_name: str,
+        parameter_name: str,
+        inflight: asyncio.Future,
+        cached: Optional[tuple],
+    ) -> Dict[str, Any]:
+        """Share the result of a live read started by another caller.
+
+        Args:
+            instrument_name: Name of the instrument
+            parameter_name: Parameter path
+            inflight: Future of the in-flight read for the same parameter
+            cached: Cached (value, timestamp) to fall back to if the read fails
+        """
+        key = self._make_cache_key(instrument_name, parameter_name)
+        try:
+            # Shield so a cancelled follower does not cancel the shared read
+            value, read_time = await asyncio.shield(inflight)
+        except Exception as e:
+            if cached:
+                value, timestamp = cached
+                return {
+                    "value": value,
+                    "timestamp": timestamp,
+                    "age_seconds": time.time() - timestamp,
+                    "source": self._cache_source(key),
+                    "stale": True,
+                    "error": str(e),
+                }
+            raise
+
+        self.cache.record_coalesced()
+        logger.debug(f"Coalesced read of {instrument_name}.{parameter_name}")
+        return {
+            "value": value,
+            "timestamp": read_time,
+            "age_seconds": time.time() - read_time,
+            "source": "coalesced",
+            "stale": False,
+        }
 
     async def get_parameter_values(
         self, queries: Union[List[Dict[str, Any]], Dict[str, Any]]
@@ -646,71 +1083,658 @@ class QCodesBackend(BaseBackend):
             queries: Single query dict or list of query dicts
                     Single: {"instrument": "name", "parameter": "param", "fresh": false}
                     Batch: [{"instrument": "name1", "parameter": "param1"}, ...]
+                    Optional "max_age_s" per query: serve from cache only if the
+                    cached value is at most that old, otherwise read live
+                    Patterns: "instrument" and "parameter" may be glob patterns
+                    (e.g. {"instrument": "dac", "parameter": "ch*.voltage"}), or
+                    a query may give {"pattern": "*.temperature"} instead
+
+        Pattern queries are expanded against the parameter index into one query
+        per matching parameter, in place, carrying the pattern's other options.
+        A pattern that matches nothing yields a single error result.
+
+        Batch queries are grouped by instrument. Different instruments are read
+        concurrently while reads on the same instrument remain serialized by the
+        instrument lock. Results are returned in request order.
 
         Returns:
-            Single result dict or list of result dicts
+            Single result dict (list of result dicts for a single pattern query)
+            or list of result dicts
         """
+        await self._restore_warm_start()
+
         # Handle single query case
         if isinstance(queries, dict):
-            try:
-                result = await self._get_single_parameter_value(
-                    queries["instrument"],
-                    queries["parameter"],
-                    queries.get("fresh", False),
-                )
-                result["query"] = queries
-                return result
-            except Exception as e:
-                return {"query": queries, "error": str(e), "source": "error"}
+            if self._pattern_of(queries) is None:
+                return await self._get_query_result(queries)
+            queries = [queries]
+
+        # Expand patterns; unmatched patterns come back as ready error results
+        expanded = await self._expand_queries(queries)
+
+        # Handle batch query case: group by instrument, run instruments concurrently
+        results: List[Optional[Dict[str, Any]]] = [error for _, error in expanded]
+        groups: Dict[Any, List[int]] = {}
+        for index, (query, error) in enumerate(expanded):
+            if error is not None:
+                continue
+            instrument = query.get("instrument") if isinstance(query, dict) else None
+            groups.setdefault(instrument, []).append(index)
 
-        # Handle batch query case
-        results = []
-        for query in queries:
-            try:
-                result = await self._get_single_parameter_value(
-                    query["instrument"], query["parameter"], query.get("fresh", False)
-                )
-                result["query"] = query
-                results.append(result)
+        async def run_group(indices: List[int]) -> None:
+            # Reads on the same instrument stay serialized, in request order
+            for index in indices:
+                results[index] = await self._get_query_result(expanded[index][0])
 
-            except Exception as e:
-                results.append({"query": query, "error": str(e), "source": "error"})
+        await asyncio.gather(*(run_group(indices) for indices in groups.values()))
 
         return results
 
-    async def get_station_snapshot(self) -> Dict[str, Any]:
-        """Get full station snapshot without parameter values."""
-        station = None
+    @staticmethod
+    def _pattern_of(query: Any) -> Optional[Tuple[str, str]]:
+        """Get the (instrument, parameter) globs of a pattern query, else None."""
+        if not isinstance(query, dict):
+            return None
+        pattern = query.get("pattern")
+        if isinstance(pattern, str):
+            instrument, _, parameter = pattern.partition(".")
+            return instrument, parameter or "*"
+        instrument = query.get("instrument")
+        parameter = query.get("parameter")
+        if isinstance(instrument, str) and isinstance(parameter, str):
+            if _is_glob(instrument) or _is_glob(parameter):
+                return instrument, parameter
+        return None
 
-        # Look for QCoDeS Station in namespace
-        for name, obj in self.namespace.items():
-            try:
-                from qcodes.station import Station
+    async def _expand_queries(
+        self, queries: List[Any]
+    ) -> List[Tuple[Any, Optional[Dict[str, Any]]]]:
+        """Expand pattern queries into concrete ones.
 
-                if isinstance(obj, Station):
-                    station = obj
-                    break
-            except ImportError:
+        Returns:
+            (query, error_result) pairs in request order; error_result is set
+            for patterns that match nothing or too many parameters
+        """
+        expanded: List[Tuple[Any, Optional[Dict[str, Any]]]] = []
+        for query in queries:
+            pattern = self._pattern_of(query)
+            if pattern is None:
+                expanded.append((query, None))
                 continue
 
-        if station is None:
-            # No station found, return basic info
-            instruments = await self.list_instruments()
-            return {
-                "station": None,
-                "instruments": instruments,
-                "message": "No QCoDeS Station found in namespace",
+            matches = await self._match_parameters(*pattern)
+            label = ".".join(pattern)
+            error = None
+            if not matches:
+                error = f"No parameters match pattern '{label}'"
+            elif len(matches) > MAX_PATTERN_MATCHES:
+                error = (
+                    f"Pattern '{label}' matches {len(matches)} parameters, more "
+                    f"than the limit of {MAX_PATTERN_MATCHES}; narrow the pattern"
+                )
+            if error is not None:
+                expanded.append(
+                    (query, {"query": query, "error": error, "source": "error"})
+                )
+                continue
+
+            options = {
+                key: value
+                for key, value in query.items()
+                if key not in ("instrument", "parameter", "pattern")
             }
+            for instrument_name, parameter_name in matches:
+                concrete = {
+                    "instrument": instrument_name,
+                    "parameter": parameter_name,
+                    **options,
+                    "pattern": label,
+                }
+                expanded.append((concrete, None))
+        return expanded
+
+    async def _match_parameters(
+        self, instrument_glob: str, parameter_glob: str
+    ) -> List[Tuple[str, str]]:
+        """Match (instrument, parameter path) pairs against glob patterns.
+
+        Parameter paths come from the cached parameter index; instruments not
+        yet indexed are discovered concurrently on their executors.
+        """
+        try:
+            from qcodes.instrument import InstrumentBase
+        except ImportError:
+            return []
 
-        # Get station snapshot
+        names = self._instrument_names
+        if names is None:
+            names = self._instrument_names = self._scan_instrument_names()
+        candidates = [
+            (name, self.namespace.get(name))
+            for name in names
+            if fnmatchcase(name, instrument_glob)
+        ]
+        candidates = [
+            (name, obj) for name, obj in candidates if isinstance(obj, InstrumentBase)
+        ]
+        entries = await asyncio.gather(
+            *(self._get_index_entry(name, obj) for name, obj in candidates)
+        )
+
+        matches = []
+        for (name, obj), entry in zip(candidates, entries):
+            if entry is not None:
+                paths = list(entry.parameters)
+            else:
+                # Fall back to direct parameters only (excluding IDN)
+                paths = [p for p in obj.parameters if p not in ("IDN", "idn")]
+            matches.extend(
+                (name, path) for path in paths if fnmatchcase(path, parameter_glob)
+            )
+        return matches
+
+    async def _get_query_result(self, query: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a single value query, converting failures to error results.
+
+        Array values are encoded according to the query's "array" mode
+        (default "summary", see encode_value) and "max_points".
+        """
         try:
-            snapshot = await asyncio.to_thread(station.snapshot, update=False)
-            return snapshot
+            array_mode = query.get("array", "summary")
+            if array_mode not in ARRAY_MODES:
+                raise ValueError(
+                    f"Unknown array mode '{array_mode}', "
+                    f"expected one of {list(ARRAY_MODES)}"
+                )
+            result = await self._get_single_parameter_value(
+                query["instrument"],
+                query["parameter"],
+                query.get("fresh", False),
+                query.get("max_age_s"),
+            )
+            if "value" in result:
+                result["value"] = encode_value(
+                    result["value"], array_mode, query.get("max_points", 200)
+                )
+            result["query"] = query
+            return result
         except Exception as e:
-            logger.error(f"Error getting station snapshot: {e}")
-            raise
+            return {"query": query, "error": str(e), "source": "error"}
+
+    def _read_parameter_sync(self, instrument_name: str, parameter_name: str) -> Any:
+        """Read a parameter from hardware on the calling thread (for the poller)."""
+        return self._get_parameter(instrument_name, parameter_name).get()
+
+    async def subscribe_parameter(
+        self, instrument_name: str, parameter_name: str, interval_s: float = 1.0
+    ) -> Dict[str, Any]:
+        """Poll a parameter in the background to keep its cached value warm.
+
+        Args:
+            instrument_name: Name of the instrument
+            parameter_name: Parameter path (e.g., "ch01.voltage")
+            interval_s: Polling interval in seconds
+
+        Returns:
+            Subscription confirmation
+        """
+        # Resolve now so an unknown parameter fails here, not in the poller
+        await self._resolve_parameter(instrument_name, parameter_name)
+        self._assign_io_group(instrument_name)
+        await self.poller.subscribe(
+            instrument_name, parameter_name, interval_s, self._read_parameter_sync
+        )
+        return {
+            "subscribed": True,
+            "instrument": instrument_name,
+            "parameter": parameter_name,
+            "interval_s": interval_s,
+        }
+
+    async def unsubscribe_parameter(
+        self, instrument_name: str, parameter_name: str
+    ) -> Dict[str, Any]:
+        """Stop polling a parameter; its cached value is kept."""
+        key = (instrument_name, parameter_name)
+        was_subscribed = key in self.poller.subscriptions
+        await self.poller.unsubscribe(instrument_name, parameter_name)
+        return {
+            "unsubscribed": was_subscribed,
+            "instrument": instrument_name,
+            "parameter": parameter_name,
+        }
+
+    async def get_parameter_history(
+        self,
+        instrument_name: str,
+        parameter_name: str,
+        window_s: Optional[float] = None,
+        method: str = "stats",
+        max_points: int = 200,
+    ) -> Dict[str, Any]:
+        """Summarize recorded reads of a parameter; never reads hardware.
+
+        Args:
+            instrument_name: Name of the instrument
+            parameter_name: Parameter path (e.g., "ch01.voltage")
+            window_s: Only include reads from the last window_s seconds (None = all)
+            method: "stats", or "lttb"/"minmax" to include a decimated series
+            max_points: Maximum points in the decimated series
+
+        Returns:
+            History summary (see ParameterHistory.query)
+        """
+        history = self.cache.history
+        key = self._make_cache_key(instrument_name, parameter_name)
+        if history is None or key not in history.series:
+            raise ValueError(
+                f"No history recorded for {instrument_name}.{parameter_name}. "
+                "History is recorded from live reads and subscriptions; "
+                "use qcodes_subscribe_parameter to record it continuously."
+            )
+        result = history.query(key, window_s, method, max_points)
+        result["instrument"] = instrument_name
+        result["parameter"] = parameter_name
+        return result
+
+    async def list_subscriptions(self) -> Dict[str, Any]:
+        """List polled parameters with poller, cache, rate limiter and I/O statistics."""
+        await self._restore_warm_start()
+        status = self.poller.get_subscriptions()
+        return {
+            "subscriptions": status["details"],
+            "count": len(status["details"]),
+            "poller": {
+                "batch_reads": status["batch_reads"],
+                "overruns": status["overruns"],
+                "active_tasks": status["active_tasks"],
+            },
+            "cache": await self.cache.get_stats(),
+            "rate_limiter": self.rate_limiter.get_stats(),
+            "instrument_io": self.instrument_io.get_stats(),
+            "circuit_breakers": self.instrument_io.get_breaker_stats(),
+            "history": (
+                self.cache.history.get_stats()
+                if self.cache.history is not None
+                else None
+            ),
+            "warm_start": (
+                self.warm_start.get_stats() if self.warm_start is not None else None
+            ),
+        }
+
+    async def _structural_snapshot(
+        self, name: str, instr, io_name: Optional[str] = None, refresh: bool = False
+    ):
+        """Get the cached value-free snapshot of an instrument, capturing if needed.
+
+        Args:
+            name: Snapshot store key (namespace or station component name)
+            instr: The instrument object
+            io_name: Namespace name used to route the capture to an executor
+            refresh: Capture again even if the cached snapshot is valid
+
+        Returns:
+            SnapshotEntry
+        """
+        entry = None if refresh else self._snapshots.get(name, instr)
+        if entry is None:
+            snapshot = await self._run_io(io_name or name, instr.snapshot, update=False)
+            self._strip_parameter_values(snapshot)
+            entry = self._snapshots.store(name, snapshot, instr)
+        return entry
+
+    async def _capture_snapshot(
+        self,
+        name: str,
+        instr,
+        io_name: str,
+        refresh: bool,
+        timeout_s: Optional[float],
+    ):
+        """Get one instrument's structural snapshot for the station snapshot.
+
+        Failures are reported rather than raised, so one slow or broken
+        instrument does not fail the whole station snapshot. On failure the
+        last snapshot stored for the instrument, if any, is returned as stale.
+
+        Returns:
+            (SnapshotEntry or None, status dict)
+        """
+        entry = None if refresh else self._snapshots.get(name, instr)
+        if entry is not None:
+            return entry, {"status": "ok", "cached": True}
+
+        start = time.perf_counter()
+        try:
+            capture = self._structural_snapshot(name, instr, io_name, refresh=True)
+            if timeout_s is not None:
+                entry = await asyncio.wait_for(capture, timeout=timeout_s)
+            else:
+                entry = await capture
+            status: Dict[str, Any] = {"status": "ok", "cached": False}
+        except asyncio.TimeoutError as e:
+            status = {
+                "status": "timeout",
+                "error": str(e) or f"Snapshot exceeded {timeout_s}s timeout",
+            }
+        except Exception as e:
+            logger.warning(f"Snapshot of '{name}' failed: {e}")
+            status = {"status": "error", "error": str(e)}
+        status["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+
+        if entry is None:
+            entry = self._snapshots.peek(name)
+            status["stale"] = entry is not None
+        return entry, status
+
+    def _find_station(self):
+        """Find the first QCoDeS Station in the namespace.
+
+        Returns:
+            (station, name), or (None, None) if there is none
+        """
+        try:
+            from qcodes.station import Station
+        except ImportError:
+            return None, None
+
+        for name, obj in list(self.namespace.items()):
+            if isinstance(obj, Station):
+                return obj, name
+        return None, None
+
+    def _station_parts(self, station) -> Dict[str, Any]:
+        """Snapshot the station-level parts (everything except instruments)."""
+        from qcodes.instrument import InstrumentBase
+        from qcodes.parameters import ManualParameter, Parameter
+
+        parts: Dict[str, Any] = {
+            "parameters": {},
+            "components": {},
+            "config": station.config,
+        }
+        for name, component in list(station.components.items()):
+            if isinstance(component, InstrumentBase):
+                continue
+            if isinstance(component, (Parameter, ManualParameter)):
+                if not component.snapshot_exclude:
+                    parts["parameters"][name] = component.snapshot(update=False)
+            else:
+                parts["components"][name] = component.snapshot(update=False)
+        if station.metadata:
+            parts["metadata"] = station.metadata
+        self._strip_parameter_values(parts)
+        return parts
+
+    async def get_station_snapshot(
+        self,
+        since_version: Optional[int] = None,
+        path: Optional[str] = None,
+        refresh: bool = False,
+        timeout_s: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Get the station snapshot without parameter values.
+
+        Instrument snapshots are cached per instrument and only captured again
+        when the instrument is rebound or its structure changes (or with
+        refresh). Captures run concurrently on the instruments' executors, so
+        the snapshot takes as long as the slowest instrument rather than the
+        sum. An instrument that times out or fails is marked in "status" and
+        served from its last snapshot if there is one.
+
+        Every content change bumps a version number, so clients can fetch only
+        the instruments changed since a version they hold. Without a Station
+        in the namespace, all namespace instruments are covered.
+
+        Args:
+            since_version: Only include parts changed after this version;
+                removed instruments are listed under "removed"
+            path: JSONPath-style selection, e.g. "$.instruments.dac.parameters"
+                or "instruments.*.submodules.ch0*"
+            refresh: Capture every instrument again
+            timeout_s: Per-instrument capture timeout (default: each
+                instrument's I/O deadline)
+
+        Returns:
+            Dict with "version", "station", per-instrument "status" and either
+            the station-shaped "snapshot" or, with path, the "matches" by
+            concrete path
+        """
+        try:
+            from qcodes.instrument import Instrument, InstrumentBase
+        except ImportError:
+            return {"version": 0, "station": None, "message": "QCoDeS not available"}
+
+        station, station_name = self._find_station()
+
+        # Instruments covered, and the namespace names that route their I/O
+        io_names = {
+            id(obj): name
+            for name, obj in list(self.namespace.items())
+            if isinstance(obj, InstrumentBase)
+        }
+        if station is None:
+            instruments = {name: self.namespace[name] for name in io_names.values()}
+        else:
+            instruments = {
+                name: component
+                for name, component in list(station.components.items())
+                if isinstance(component, InstrumentBase)
+                and (
+                    not isinstance(component, Instrument)
+                    or Instrument.is_valid(component)
+                )
+            }
+
+        captured = await asyncio.gather(
+            *(
+                self._capture_snapshot(
+                    name, instr, io_names.get(id(instr), name), refresh, timeout_s
+                )
+                for name, instr in instruments.items()
+            )
+        )
+        snapshots = {}
+        status = {}
+        for name, (entry, instrument_status) in zip(instruments, captured):
+            status[name] = instrument_status
+            if entry is not None:
+                snapshots[name] = entry.snapshot
+        self._snapshots.set_members(list(instruments))
+
+        station_entry = None
+        if station is not None:
+            station_entry = self._snapshots.store(
+                STATION_PART, self._station_parts(station)
+            )
+
+        result: Dict[str, Any] = {
+            "version": self._snapshots.version,
+            "station": station_name,
+            "status": status,
+        }
+        if station is None:
+            result["message"] = (
+                "No QCoDeS Station found in namespace; "
+                "snapshot covers all instruments in the namespace"
+            )
+
+        # A version from a previous server run cannot be diffed against
+        if since_version is None or not 0 <= since_version <= result["version"]:
+            tree: Dict[str, Any] = {"instruments": snapshots}
+            if station_entry is not None:
+                tree.update(station_entry.snapshot)
+            result["full"] = True
+        else:
+            changed, removed = self._snapshots.changes_since(since_version)
+            tree = {
+                "instruments": {
+                    name: snapshots[name] for name in changed if name in snapshots
+                }
+            }
+            if station_entry is not None and station_entry.version > since_version:
+                tree.update(station_entry.snapshot)
+            result.update({"full": False, "since_version": since_version})
+            result["removed"] = removed
+
+        if path:
+            result["path"] = path
+            result["matches"] = select_path(tree, path)
+        else:
+            result["snapshot"] = tree
+        return result
+
+    async def _restore_warm_start(self) -> None:
+        """Restore saved read-path state of instruments now in the namespace.
+
+        The warm-start file is loaded on first use, which also starts the
+        periodic save. Each instrument's saved state is restored once, when
+        an instrument of the saved class and structure is bound to its name:
+        its parameter index, cached values and subscriptions. Saved state of
+        an instrument that changed is discarded.
+        """
+        store = self.warm_start
+        if store is None or self._warm_pending == {}:
+            return
+
+        async with self._warm_lock:
+            if self._warm_pending is None:
+                self._warm_pending = await asyncio.to_thread(store.load)
+                self._warm_save_task = asyncio.create_task(self._warm_start_loop())
+
+            try:
+                from qcodes.instrument import InstrumentBase
+            except ImportError:
+                return
+
+            for name in [n for n in self._warm_pending if n in self.namespace]:
+                state = self._warm_pending.pop(name)
+                obj = self.namespace.get(name)
+                if not isinstance(obj, InstrumentBase):
+                    continue
+                fingerprint = structure_fingerprint(obj)
+                if state.class_name != _class_name(obj) or state.fingerprint != [
+                    fingerprint[0],
+                    list(fingerprint[1]),
+                ]:
+                    logger.debug(f"Discarding warm-start state of '{name}': changed")
+                    continue
+                await self._apply_instrument_state(name, obj, state)
+                store.restored_instruments += 1
+
+    async def _apply_instrument_state(
+        self, name: str, obj, state: InstrumentState
+    ) -> None:
+        """Restore one instrument's saved index, values and subscriptions.
+
+        Values keep their saved timestamp, so age limits treat them as old,
+        and are marked restored (reported with source "restored" and stale
+        until read again) rather than recorded in the history.
+        """
+        if state.paths and state.max_depth is not None:
+            if self._param_index.get(name, obj, state.max_depth) is None:
+                try:
+                    objects = {
+                        path: self._walk_parameter_path(obj, path, {})
+                        for path in state.paths
+                    }
+                except (AttributeError, KeyError, ValueError):
+                    # Fall back to discovery on first use
+                    objects = None
+                if objects is not None:
+                    self._param_index.store(name, obj, objects, state.max_depth)
+
+        for parameter, (value, timestamp) in state.values.items():
+            key = self._make_cache_key(name, parameter)
+            current = self.cache.peek(key)
+            if current is None or current[1] < timestamp:
+                await self.cache.set(key, value, timestamp, restored=True)
+
+        for parameter, interval_s in state.subscriptions.items():
+            if (name, parameter) in self.poller.subscriptions:
+                continue
+            try:
+                await self.subscribe_parameter(name, parameter, interval_s)
+            except Exception as e:
+                logger.warning(f"Could not resume subscription {name}.{parameter}: {e}")
+
+    def _warm_start_states(self) -> Dict[str, InstrumentState]:
+        """Collect the read-path state to save, keyed by instrument name."""
+        from qcodes.instrument import InstrumentBase
+
+        states: Dict[str, InstrumentState] = {}
+
+        def state_for(name: str) -> Optional[InstrumentState]:
+            state = states.get(name)
+            if state is None:
+                obj = self.namespace.get(name)
+                if not isinstance(obj, InstrumentBase):
+                    return None
+                fingerprint = structure_fingerprint(obj)
+                state = states[name] = InstrumentState(
+                    class_name=_class_name(obj),
+                    fingerprint=[fingerprint[0], list(fingerprint[1])],
+                )
+            return state
+
+        for name, entry in list(self._param_index.entries.items()):
+            state = state_for(name)
+            if state is not None and entry.instrument_ref() is self.namespace.get(name):
+                state.paths = list(entry.parameters)
+                state.max_depth = entry.max_depth
+        for (name, parameter), (value, timestamp) in list(self.cache.data.items()):
+            state = state_for(name)
+            if state is not None:
+                state.values[parameter] = (value, timestamp)
+        for (name, parameter), sub in list(self.poller.subscriptions.items()):
+            state = state_for(name)
+            if state is not None:
+                state.subscriptions[parameter] = sub.interval_s
+
+        # Instruments not yet re-created since the restart keep their saved state
+        for name, state in (self._warm_pending or {}).items():
+            states.setdefault(name, state)
+        return states
+
+    async def _save_warm_start(self, marker: Any = None) -> Any:
+        """Save the read-path state if it changed since marker.
+
+        Returns:
+            The marker of the saved (or unchanged) state
+        """
+        current = (
+            self.cache.writes,
+            len(self._param_index.entries),
+            tuple((k, s.interval_s) for k, s in self.poller.subscriptions.items()),
+            len(self._warm_pending or {}),
+        )
+        if current != marker:
+            states = self._warm_start_states()
+            await asyncio.to_thread(self.warm_start.save, states)
+        return current
+
+    async def _warm_start_loop(self) -> None:
+        """Periodically save changed read-path state."""
+        marker = None
+        while True:
+            await asyncio.sleep(self.warm_start.save_interval_s)
+            try:
+                marker = await self._save_warm_start(marker)
+            except Exception as e:
+                logger.warning(f"Warm-start save failed: {e}")
 
     async def cleanup(self):
         """Clean up resources."""
+        if self._warm_save_task is not None:
+            self._warm_save_task.cancel()
+            self._warm_save_task = None
+        if self.warm_start is not None and self._warm_pending is not None:
+            # Only save once loaded, so unrestored saved state is never lost
+            try:
+                await self._save_warm_start()
+            except Exception as e:
+                logger.warning(f"Warm-start save failed: {e}")
         await self.poller.stop_all()
         await self.cache.clear()
+        self.instrument_io.shutdown()
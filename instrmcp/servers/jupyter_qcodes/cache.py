@@ -3,65 +3,488 @@ Caching and rate limiting for QCoDeS parameter reads.
 """
 
 import asyncio
+import heapq
+import sys
+import threading
 import time
 import logging
-from typing import Dict, Tuple, Any, Optional
+import random
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .instrument_io import InstrumentIO, is_instrument_fault
+
+if TYPE_CHECKING:
+    from .history import ParameterHistory
 
 logger = logging.getLogger(__name__)
 
 
-class ReadCache:
-    """Thread-safe cache for QCoDeS parameter values with timestamps."""
+def structure_fingerprint(instrument: Any) -> Tuple[int, Tuple[str, ...]]:
+    """Cheap fingerprint of an instrument's structure.
+
+    Combines the number of direct parameters with the names of its submodules,
+    so adding a parameter or a channel changes the fingerprint.
+    """
+    parameters = getattr(instrument, "parameters", None) or {}
+    submodules = getattr(instrument, "submodules", None) or {}
+    return (len(parameters), tuple(submodules))
+
+
+@dataclass
+class IndexEntry:
+    """Indexed parameters of a single instrument."""
+
+    instrument_ref: Any  # weakref.ref to the instrument the entry was built from
+    fingerprint: Tuple[int, Tuple[str, ...]]
+    max_depth: int
+    # full parameter path (e.g. "ch01.voltage") -> Parameter object
+    parameters: Dict[str, Any] = field(default_factory=dict)
+    # Cached list_instruments summary, built on first listing
+    summary: Optional[Dict[str, Any]] = None
+
+
+class ParameterIndex:
+    """Per-instrument index mapping full parameter paths to Parameter objects.
+
+    An entry is only valid for the exact instrument object it was built from
+    and while the instrument's structure fingerprint is unchanged, so rebinding
+    the namespace entry or adding submodules invalidates it.
+    """
 
     def __init__(self):
-        # (instrument_name, parameter_name) -> (value, timestamp)
-        self.data: Dict[Tuple[str, str], Tuple[Any, float]] = {}
-        self.lock = asyncio.Lock()
+        # instrument_name -> IndexEntry
+        self.entries: Dict[str, IndexEntry] = {}
+
+    def get(
+        self, instrument_name: str, instrument: Any, max_depth: Optional[int] = None
+    ) -> Optional[IndexEntry]:
+        """Get the entry for an instrument if it is still valid."""
+        entry = self.entries.get(instrument_name)
+        if entry is None:
+            return None
+        if (
+            entry.instrument_ref() is not instrument
+            or entry.fingerprint != structure_fingerprint(instrument)
+            or (max_depth is not None and entry.max_depth != max_depth)
+        ):
+            self.entries.pop(instrument_name, None)
+            return None
+        return entry
+
+    def store(
+        self,
+        instrument_name: str,
+        instrument: Any,
+        parameters: Dict[str, Any],
+        max_depth: int,
+    ) -> IndexEntry:
+        """Store a freshly built index for an instrument."""
+        entry = IndexEntry(
+            instrument_ref=weakref.ref(instrument),
+            fingerprint=structure_fingerprint(instrument),
+            max_depth=max_depth,
+            parameters=parameters,
+        )
+        self.entries[instrument_name] = entry
+        return entry
+
+    def invalidate(self, instrument_name: Optional[str] = None):
+        """Drop the entry for one instrument, or all entries."""
+        if instrument_name is None:
+            self.entries.clear()
+        else:
+            self.entries.pop(instrument_name, None)
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate the memory footprint of a cached value in bytes.
+
+    NumPy arrays report their buffer size; lists, tuples and dicts are summed
+    over their items; anything else falls back to sys.getsizeof.
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size(k) + estimate_size(v) for k, v in value.items()
+        )
+    try:
+        return sys.getsizeof(value)
+    except TypeError:
+        return 64
+
 
-    async def get(self, key: Tuple[str, str]) -> Optional[Tuple[Any, float]]:
-        """Get cached value and timestamp for a parameter."""
-        async with self.lock:
-            return self.data.get(key)
+class ReadCache:
+    """Bounded cache for QCoDeS parameter values with timestamps.
+
+    Entries are evicted least-recently-used once either the entry budget or
+    the byte budget is exceeded. Reads can be limited by age, either through a
+    per-read ``max_age_s`` or through TTLs configured per instrument or per
+    parameter; older entries are reported as misses but are kept for
+    stale fallbacks (see ``peek``).
+
+    Reads never take a lock: each entry is an immutable ``(value, timestamp)``
+    tuple that writers replace atomically. Writers serialize their multi-step
+    bookkeeping on a short threading lock that is never held across an await.
+    Sizes and oldest/newest timestamps are maintained incrementally so
+    ``get_stats`` does not scan the entries.
+
+    Entries restored from a warm start (``set(..., restored=True)``) keep
+    their original timestamp, are not recorded in the history and are marked
+    in ``restored`` until a new value replaces them.
+    """
+
+    # Rebuild the timestamp heaps once they hold this many times more items
+    # than live entries (superseded items are dropped lazily)
+    _HEAP_COMPACT_FACTOR = 4
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl_s: Optional[float] = None,
+        history: Optional["ParameterHistory"] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached parameters
+            max_bytes: Maximum estimated size of all cached values
+            default_ttl_s: TTL for parameters without a specific rule (None = no TTL)
+            history: Optional history that also records every value set
+        """
+        self.max_entries = max_entries
+        self.history = history
+        self.max_bytes = max_bytes
+        self.default_ttl_s = default_ttl_s
+        # (instrument_name, parameter_name) -> (value, timestamp), in LRU order
+        self.data: "OrderedDict[Tuple[str, str], Tuple[Any, float]]" = OrderedDict()
+        # (instrument_name, parameter_name) -> estimated size in bytes
+        self.sizes: Dict[Tuple[str, str], int] = {}
+        # Keys whose value was restored from a warm start, not read
+        self.restored: Set[Tuple[str, str]] = set()
+        self.total_bytes = 0
+        # Lazy-deletion heaps of (timestamp, key) and (-timestamp, key)
+        self._oldest_heap: List[Tuple[float, Tuple[str, str]]] = []
+        self._newest_heap: List[Tuple[float, Tuple[str, str]]] = []
+        # (instrument_name, parameter_name or None) -> TTL in seconds
+        self.ttls: Dict[Tuple[str, Optional[str]], float] = {}
+        # Guards writer bookkeeping only; reads are lock-free
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        # Live reads served by attaching to an identical in-flight read
+        self.coalesced_reads = 0
+        # Number of set() calls, used to detect changes cheaply
+        self.writes = 0
+
+    def set_ttl(
+        self, instrument_name: str, ttl_s: float, parameter_name: Optional[str] = None
+    ):
+        """Set the TTL for one parameter, or for every parameter of an instrument."""
+        self.ttls[(instrument_name, parameter_name)] = ttl_s
+
+    def clear_ttl(self, instrument_name: str, parameter_name: Optional[str] = None):
+        """Remove a TTL rule set with set_ttl."""
+        self.ttls.pop((instrument_name, parameter_name), None)
+
+    def get_ttl(self, key: Tuple[str, str]) -> Optional[float]:
+        """Get the effective TTL for a parameter (parameter, then instrument rule)."""
+        ttl = self.ttls.get(key)
+        if ttl is None:
+            ttl = self.ttls.get((key[0], None), self.default_ttl_s)
+        return ttl
+
+    async def get(
+        self, key: Tuple[str, str], max_age_s: Optional[float] = None
+    ) -> Optional[Tuple[Any, float]]:
+        """Get cached value and timestamp for a parameter.
+
+        Args:
+            key: (instrument_name, parameter_name) cache key
+            max_age_s: Maximum acceptable age; defaults to the parameter's TTL
+
+        Returns:
+            (value, timestamp), or None if missing or older than allowed
+        """
+        entry = self.data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        limit = max_age_s if max_age_s is not None else self.get_ttl(key)
+        if limit is not None and time.time() - entry[1] > limit:
+            self.expired += 1
+            self.misses += 1
+            return None
+
+        try:
+            self.data.move_to_end(key)
+        except KeyError:
+            # Evicted by a concurrent writer; the entry we read is still valid
+            pass
+        self.hits += 1
+        return entry
+
+    def peek(self, key: Tuple[str, str]) -> Optional[Tuple[Any, float]]:
+        """Get an entry regardless of age, without touching LRU order or stats."""
+        return self.data.get(key)
+
+    def is_restored(self, key: Tuple[str, str]) -> bool:
+        """Check whether an entry was restored from a warm start."""
+        return key in self.restored
 
     async def set(
-        self, key: Tuple[str, str], value: Any, timestamp: Optional[float] = None
+        self,
+        key: Tuple[str, str],
+        value: Any,
+        timestamp: Optional[float] = None,
+        restored: bool = False,
     ):
-        """Set cached value with timestamp for a parameter."""
+        """Set cached value with timestamp for a parameter.
+
+        Args:
+            key: (instrument_name, parameter_name) cache key
+            value: Value to cache
+            timestamp: When the value was read (default: now)
+            restored: The value comes from a warm start, not a read; it is
+                marked restored and not recorded in the history
+        """
         if timestamp is None:
             timestamp = time.time()
-        async with self.lock:
+        if self.history is not None and not restored:
+            self.history.record(key, value, timestamp)
+        size = estimate_size(value)
+        with self.lock:
+            self.writes += 1
+            self._discard(key)
+            if size > self.max_bytes:
+                # A single value larger than the whole budget is not cached
+                self.evictions += 1
+                logger.debug(f"Not caching {key}: {size} bytes exceeds budget")
+                return
             self.data[key] = (value, timestamp)
+            self.sizes[key] = size
+            if restored:
+                self.restored.add(key)
+            self.total_bytes += size
+            heapq.heappush(self._oldest_heap, (timestamp, key))
+            heapq.heappush(self._newest_heap, (-timestamp, key))
+            self._evict()
+            if len(self._oldest_heap) > self._HEAP_COMPACT_FACTOR * (
+                len(self.data) + 16
+            ):
+                self._rebuild_heaps()
+
+    def _discard(self, key: Tuple[str, str]):
+        """Remove an entry and its size accounting (caller holds the lock)."""
+        if self.data.pop(key, None) is not None:
+            self.total_bytes -= self.sizes.pop(key, 0)
+            self.restored.discard(key)
+
+    def _evict(self):
+        """Evict least-recently-used entries until within budget."""
+        while self.data and (
+            len(self.data) > self.max_entries or self.total_bytes > self.max_bytes
+        ):
+            key = next(iter(self.data))
+            self._discard(key)
+            self.evictions += 1
+
+    def _rebuild_heaps(self):
+        """Rebuild the timestamp heaps from live entries (caller holds the lock)."""
+        self._oldest_heap = [(ts, key) for key, (_, ts) in self.data.items()]
+        self._newest_heap = [(-ts, key) for ts, key in self._oldest_heap]
+        heapq.heapify(self._oldest_heap)
+        heapq.heapify(self._newest_heap)
+
+    def _heap_top(self, heap: List[Tuple[float, Tuple[str, str]]], sign: int) -> float:
+        """Pop superseded heap items and return the top timestamp (lock held)."""
+        while heap:
+            ts, key = heap[0]
+            entry = self.data.get(key)
+            if entry is not None and entry[1] == sign * ts:
+                return entry[1]
+            heapq.heappop(heap)
+        return 0
+
+    def record_coalesced(self):
+        """Count a read that was coalesced onto an in-flight hardware read."""
+        self.coalesced_reads += 1
 
     async def clear(self):
         """Clear all cached values."""
-        async with self.lock:
+        with self.lock:
             self.data.clear()
-
-    async def get_stats(self) -> Dict[str, Any]:
-        """Get cache statistics."""
-        async with self.lock:
-            return {
+            self.sizes.clear()
+            self.restored.clear()
+            self.total_bytes = 0
+            self._oldest_heap.clear()
+            self._newest_heap.clear()
+
+    async def get_stats(self, include_keys: bool = False) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Args:
+            include_keys: Also list every cached key (O(n) in the cache size)
+        """
+        with self.lock:
+            stats = {
                 "size": len(self.data),
-                "keys": list(self.data.keys()),
-                "oldest_timestamp": min(
-                    (ts for _, ts in self.data.values()), default=0
-                ),
-                "newest_timestamp": max(
-                    (ts for _, ts in self.data.values()), default=0
-                ),
+                "oldest_timestamp": self._heap_top(self._oldest_heap, 1),
+                "newest_timestamp": self._heap_top(self._newest_heap, -1),
+                "bytes": self.total_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "coalesced_reads": self.coalesced_reads,
+                "restored": len(self.restored),
+                "ttl_rules": len(self.ttls),
             }
+            if include_keys:
+                stats["keys"] = list(self.data.keys())
+        return stats
+
+
+# Priorities for RateLimiter.acquire; lower is served first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_POLL = 1
+
+# Upper bounds of the wait-time (ms) and queue-depth histogram buckets
+WAIT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+DEPTH_BUCKETS = (0, 1, 2, 4, 8, 16)
+
+
+def _histogram_bucket(bounds: Tuple[float, ...], value: float) -> str:
+    """Label of the histogram bucket for a value ("<=bound" or ">last")."""
+    for bound in bounds:
+        if value <= bound:
+            return f"<={bound}"
+    return f">{bounds[-1]}"
+
+
+class TokenBucket:
+    """Token bucket and fair wait queue for one instrument."""
+
+    def __init__(self, rate_hz: float, burst: int):
+        self.rate_hz = rate_hz
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        # Heap of (priority, seq) for queued acquire() calls
+        self.waiters: List[Tuple[int, int]] = []
+        # Replaced on every queue change; waiters wait on the current one
+        self.changed = asyncio.Event()
+        # Tokens taken by acquire() that record_access() has not settled yet
+        self.outstanding = 0
+        self.grants = 0
+        self.wait_hist: Dict[str, int] = {}
+        self.depth_hist: Dict[str, int] = {}
+        self.max_depth = 0
+
+    def refill(self, now: float):
+        """Add the tokens accrued since the last update."""
+        if self.rate_hz == float("inf"):
+            self.tokens = float(self.burst)
+        else:
+            self.tokens = min(
+                float(self.burst), self.tokens + (now - self.updated) * self.rate_hz
+            )
+        self.updated = now
+
+    def try_take(self, now: float) -> bool:
+        """Take one token if available."""
+        self.refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def time_until_token(self) -> float:
+        """Seconds until one token is available (after refill)."""
+        return max(0.0, (1 - self.tokens) / self.rate_hz)
+
+    def notify(self):
+        """Wake every queued waiter so the queue head can re-check."""
+        self.changed.set()
+        self.changed = asyncio.Event()
 
 
 class RateLimiter:
-    """Rate limiter for QCoDeS instrument access."""
+    """Rate limiter for QCoDeS instrument access.
+
+    Each instrument has a token bucket: ``burst`` reads may happen
+    back-to-back, after which reads are limited to ``rate_hz``. Without a
+    per-instrument policy the bucket is derived from ``min_interval_s``
+    (burst 1, one read per interval), which matches a plain minimum
+    interval between reads.
+
+    Callers that must wait queue fairly per instrument: interactive reads
+    are served before background poll reads, and callers of the same
+    priority are served in arrival order. Taking a token is atomic with the
+    availability check, so concurrent callers cannot both pass a check and
+    then read back-to-back.
+    """
 
     def __init__(self, min_interval_s: float = 0.2):
         self.min_interval_s = min_interval_s
+        self.default_rate_hz = (
+            1 / min_interval_s if min_interval_s > 0 else float("inf")
+        )
+        self.default_burst = 1
+        # instrument_name -> (rate_hz, burst)
+        self.policies: Dict[str, Tuple[float, int]] = {}
+        self.buckets: Dict[str, TokenBucket] = {}
         # instrument_name -> last_access_time
         self.last_access: Dict[str, float] = {}
         # Per-instrument locks to serialize access
         self.locks: Dict[str, asyncio.Lock] = {}
-        self.lock = asyncio.Lock()
+        self._seq = 0
+
+    def set_default_policy(self, rate_hz: Optional[float], burst: int = 1):
+        """Set the policy for instruments without their own (None = unlimited)."""
+        self.default_rate_hz = rate_hz if rate_hz is not None else float("inf")
+        self.default_burst = burst
+        for name, bucket in self.buckets.items():
+            if name not in self.policies:
+                bucket.rate_hz, bucket.burst = self.default_rate_hz, burst
+
+    def set_policy(
+        self, instrument_name: str, rate_hz: Optional[float], burst: int = 1
+    ):
+        """Set the rate (None = unlimited) and burst size for one instrument."""
+        policy = (rate_hz if rate_hz is not None else float("inf"), burst)
+        self.policies[instrument_name] = policy
+        if instrument_name in self.buckets:
+            bucket = self.buckets[instrument_name]
+            bucket.rate_hz, bucket.burst = policy
+
+    def get_policy(self, instrument_name: str) -> Tuple[Optional[float], int]:
+        """Get the (rate_hz, burst) that applies to an instrument (None = unlimited)."""
+        bucket = self._bucket(instrument_name)
+        rate_hz = None if bucket.rate_hz == float("inf") else bucket.rate_hz
+        return rate_hz, bucket.burst
+
+    def _bucket(self, instrument_name: str) -> TokenBucket:
+        """Get or create the token bucket for an instrument."""
+        bucket = self.buckets.get(instrument_name)
+        if bucket is None:
+            rate_hz, burst = self.policies.get(
+                instrument_name, (self.default_rate_hz, self.default_burst)
+            )
+            bucket = self.buckets[instrument_name] = TokenBucket(rate_hz, burst)
+        return bucket
 
     def get_instrument_lock(self, instrument_name: str) -> asyncio.Lock:
         """Get or create a lock for an instrument."""
@@ -70,63 +493,221 @@ class RateLimiter:
         return self.locks[instrument_name]
 
     async def can_access(self, instrument_name: str) -> bool:
-        """Check if instrument can be accessed (rate limit check)."""
-        async with self.lock:
-            last_time = self.last_access.get(instrument_name, 0)
-            return (time.time() - last_time) >= self.min_interval_s
+        """Check if instrument can be accessed now without waiting."""
+        bucket = self._bucket(instrument_name)
+        bucket.refill(time.monotonic())
+        return not bucket.waiters and bucket.tokens >= 1
 
     async def record_access(self, instrument_name: str):
-        """Record that instrument was accessed."""
-        async with self.lock:
-            self.last_access[instrument_name] = time.time()
-
-    async def wait_if_needed(self, instrument_name: str):
-        """Wait if rate limit would be exceeded."""
-        async with self.lock:
-            last_time = self.last_access.get(instrument_name, 0)
-            elapsed = time.time() - last_time
-            if elapsed < self.min_interval_s:
-                wait_time = self.min_interval_s - elapsed
-                logger.debug(
-                    f"Rate limiting {instrument_name}: waiting {wait_time:.3f}s"
-                )
-                await asyncio.sleep(wait_time)
+        """Record that instrument was accessed.
+
+        Settles the token taken by a preceding acquire(); an access made
+        without acquire() consumes a token here instead.
+        """
+        self.last_access[instrument_name] = time.time()
+        bucket = self._bucket(instrument_name)
+        if bucket.outstanding > 0:
+            bucket.outstanding -= 1
+        else:
+            bucket.refill(time.monotonic())
+            bucket.tokens = max(0.0, bucket.tokens - 1)
+
+    async def acquire(self, instrument_name: str, priority: int = PRIORITY_INTERACTIVE):
+        """Wait for and take one read token for an instrument.
+
+        Args:
+            instrument_name: Instrument to read
+            priority: PRIORITY_INTERACTIVE or PRIORITY_POLL (lower is served first)
+        """
+        bucket = self._bucket(instrument_name)
+        start = time.monotonic()
+        depth = len(bucket.waiters)
+        label = _histogram_bucket(DEPTH_BUCKETS, depth)
+        bucket.depth_hist[label] = bucket.depth_hist.get(label, 0) + 1
+
+        if not bucket.waiters and bucket.try_take(start):
+            self._granted(bucket, start)
+            return
+
+        self._seq += 1
+        entry = (priority, self._seq)
+        heapq.heappush(bucket.waiters, entry)
+        bucket.max_depth = max(bucket.max_depth, len(bucket.waiters))
+        # A new head may need to take over from a sleeping one
+        bucket.notify()
+        try:
+            while True:
+                changed = bucket.changed
+                if bucket.waiters[0] == entry:
+                    if bucket.try_take(time.monotonic()):
+                        heapq.heappop(bucket.waiters)
+                        break
+                    timeout = bucket.time_until_token()
+                else:
+                    timeout = None
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        except BaseException:
+            if entry in bucket.waiters:
+                bucket.waiters.remove(entry)
+                heapq.heapify(bucket.waiters)
+            raise
+        finally:
+            bucket.notify()
+
+        waited = time.monotonic() - start
+        logger.debug(f"Rate limiting {instrument_name}: waited {waited:.3f}s")
+        self._granted(bucket, start)
+
+    def _granted(self, bucket: TokenBucket, start: float):
+        """Account for a token handed out by acquire()."""
+        bucket.outstanding += 1
+        bucket.grants += 1
+        label = _histogram_bucket(WAIT_BUCKETS_MS, (time.monotonic() - start) * 1000)
+        bucket.wait_hist[label] = bucket.wait_hist.get(label, 0) + 1
+
+    async def wait_if_needed(
+        self, instrument_name: str, priority: int = PRIORITY_INTERACTIVE
+    ):
+        """Wait if rate limit would be exceeded (takes a token, see acquire)."""
+        await self.acquire(instrument_name, priority)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-instrument rate limiter statistics."""
+        now = time.monotonic()
+        stats = {}
+        for name, bucket in self.buckets.items():
+            bucket.refill(now)
+            stats[name] = {
+                "rate_hz": None if bucket.rate_hz == float("inf") else bucket.rate_hz,
+                "burst": bucket.burst,
+                "tokens": round(bucket.tokens, 3),
+                "queue_depth": len(bucket.waiters),
+                "max_queue_depth": bucket.max_depth,
+                "grants": bucket.grants,
+                "wait_time_ms": dict(bucket.wait_hist),
+                "queue_depth_on_arrival": dict(bucket.depth_hist),
+            }
+        return stats
 
 
-class ParameterPoller:
-    """Background poller for subscribed parameters."""
+@dataclass(eq=False)
+class Subscription:
+    """A parameter polled periodically by ParameterPoller."""
+
+    instrument_name: str
+    parameter_name: str
+    interval_s: float
+    # Synchronous (instrument_name, parameter_name) -> value, run in a thread
+    read_func: Callable[[str, str], Any]
+    # Monotonic time of the next scheduled read
+    next_due: float = 0.0
+    # Consecutive failed reads; drives the error backoff
+    failures: int = 0
+    polls: int = 0
+    errors: int = 0
+    last_error: Optional[str] = None
+    last_read: Optional[float] = None
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return (self.instrument_name, self.parameter_name)
+
 
-    def __init__(self, cache: ReadCache, rate_limiter: RateLimiter):
+class ParameterPoller:
+    """Background poller for subscribed parameters.
+
+    A single scheduler task keeps a heap of subscription deadlines. When
+    parameters come due, those on the same instrument (including any due
+    within ``batch_window_s``) are read in one batch: one instrument lock
+    acquisition, one rate-limiter token (at poll priority, so interactive
+    reads go first) and one call on the instrument executor for the whole group. Batches for
+    different instruments run concurrently.
+
+    Subscriptions keep a fixed cadence (the next deadline advances from the
+    previous one, so they do not drift), and new subscriptions on an
+    instrument with the same interval join the existing phase so they keep
+    being batched together. Failed reads back off exponentially with jitter,
+    up to ``max_backoff_s``.
+    """
+
+    def __init__(
+        self,
+        cache: ReadCache,
+        rate_limiter: RateLimiter,
+        batch_window_s: float = 0.05,
+        max_backoff_s: float = 60.0,
+        jitter: float = 0.1,
+        instrument_io: Optional[InstrumentIO] = None,
+    ):
+        """Initialize the poller.
+
+        Args:
+            cache: Cache that receives polled values
+            rate_limiter: Rate limiter shared with interactive reads
+            batch_window_s: Parameters due within this window are read together
+            max_backoff_s: Upper bound on the retry delay after errors
+            jitter: Relative random spread applied to error retry delays
+            instrument_io: Executors for the batch reads (shared with the backend)
+        """
         self.cache = cache
         self.rate_limiter = rate_limiter
-        self.subscriptions: Dict[Tuple[str, str], float] = (
-            {}
-        )  # (inst, param) -> interval_s
-        self.tasks: Dict[Tuple[str, str], asyncio.Task] = {}
+        self.batch_window_s = batch_window_s
+        self.max_backoff_s = max_backoff_s
+        self.jitter = jitter
+        self.instrument_io = instrument_io or InstrumentIO()
+        # (inst, param) -> Subscription
+        self.subscriptions: Dict[Tuple[str, str], Subscription] = {}
+        # Heap of (next_due, seq, subscription); superseded items are skipped
+        self._heap: List[Tuple[float, int, Subscription]] = []
+        self._seq = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._scheduler: Optional[asyncio.Task] = None
+        # instrument name -> batch read currently running for it
+        self._batches: Dict[str, asyncio.Task] = {}
+        self._random = random.Random()
         self.running = False
+        self.batch_reads = 0
+        self.overruns = 0
 
     async def subscribe(
         self,
         instrument_name: str,
         parameter_name: str,
         interval_s: float,
-        get_parameter_func,
+        get_parameter_func: Callable[[str, str], Any],
     ):
-        """Subscribe to periodic parameter updates."""
-        key = (instrument_name, parameter_name)
+        """Subscribe to periodic parameter updates.
 
-        # Cancel existing subscription if any
-        await self.unsubscribe(instrument_name, parameter_name)
+        Re-subscribing an already subscribed parameter replaces its interval.
+        """
+        if interval_s <= 0:
+            raise ValueError(f"interval_s must be positive, got {interval_s}")
 
-        self.subscriptions[key] = interval_s
+        key = (instrument_name, parameter_name)
+        self.subscriptions.pop(key, None)
 
-        # Start polling task
-        task = asyncio.create_task(
-            self._poll_parameter(
-                instrument_name, parameter_name, interval_s, get_parameter_func
-            )
+        now = time.monotonic()
+        next_due = now
+        # Join the phase of an existing subscription on the same instrument
+        # and interval, so the two keep being read in the same batch
+        for other in self.subscriptions.values():
+            if (
+                other.instrument_name == instrument_name
+                and other.interval_s == interval_s
+                and other.failures == 0
+            ):
+                next_due = other.next_due
+                break
+
+        sub = Subscription(
+            instrument_name, parameter_name, interval_s, get_parameter_func, next_due
         )
-        self.tasks[key] = task
+        self.subscriptions[key] = sub
+        self._schedule(sub, next_due)
+        self._ensure_scheduler()
 
         logger.debug(
             f"Subscribed to {instrument_name}.{parameter_name} at {interval_s}s interval"
@@ -134,63 +715,198 @@ class ParameterPoller:
 
     async def unsubscribe(self, instrument_name: str, parameter_name: str):
         """Unsubscribe from parameter updates."""
-        key = (instrument_name, parameter_name)
+        # The heap item is dropped lazily when it comes due
+        self.subscriptions.pop((instrument_name, parameter_name), None)
+        logger.debug(f"Unsubscribed from {instrument_name}.{parameter_name}")
 
-        if key in self.tasks:
-            task = self.tasks.pop(key)
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+    def _schedule(self, sub: Subscription, due: float):
+        """Push a subscription deadline onto the heap and wake the scheduler."""
+        sub.next_due = due
+        self._seq += 1
+        heapq.heappush(self._heap, (due, self._seq, sub))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _ensure_scheduler(self):
+        """Start the scheduler task if it is not running."""
+        if self._scheduler is None or self._scheduler.done():
+            self._wakeup = asyncio.Event()
+            self._scheduler = asyncio.create_task(self._run_scheduler())
+            self.running = True
+
+    def _is_current(self, due: float, sub: Subscription) -> bool:
+        """Check a heap item still matches a live subscription deadline."""
+        return self.subscriptions.get(sub.key) is sub and sub.next_due == due
+
+    async def _run_scheduler(self):
+        """Wait for the earliest deadline and dispatch due batches."""
+        while self.subscriptions:
+            # Drop superseded heap items
+            while self._heap and not self._is_current(
+                self._heap[0][0], self._heap[0][2]
+            ):
+                heapq.heappop(self._heap)
+
+            self._wakeup.clear()
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            delay = self._heap[0][0] - time.monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            self._dispatch_due()
 
-        self.subscriptions.pop(key, None)
-        logger.debug(f"Unsubscribed from {instrument_name}.{parameter_name}")
+        self.running = False
 
-    async def _poll_parameter(
-        self,
-        instrument_name: str,
-        parameter_name: str,
-        interval_s: float,
-        get_parameter_func,
-    ):
-        """Continuously poll a parameter at the specified interval."""
-        key = (instrument_name, parameter_name)
+    def _dispatch_due(self):
+        """Pop due subscriptions and start one batch read per instrument."""
+        horizon = time.monotonic() + self.batch_window_s
+        groups: Dict[str, List[Subscription]] = {}
+        while self._heap and self._heap[0][0] <= horizon:
+            due, _, sub = heapq.heappop(self._heap)
+            if self._is_current(due, sub):
+                groups.setdefault(sub.instrument_name, []).append(sub)
+
+        for instrument_name, subs in groups.items():
+            if instrument_name in self._batches:
+                # The previous batch is still reading; skip to the next period
+                self.overruns += len(subs)
+                for sub in subs:
+                    self._schedule(sub, self._next_period(sub))
+                continue
+            task = asyncio.create_task(self._read_batch(instrument_name, subs))
+            self._batches[instrument_name] = task
+            task.add_done_callback(
+                lambda _, name=instrument_name: self._batches.pop(name, None)
+            )
 
-        while key in self.subscriptions:
+    def _next_period(self, sub: Subscription) -> float:
+        """Next deadline on the subscription's fixed cadence, after now."""
+        now = time.monotonic()
+        due = sub.next_due + sub.interval_s
+        if due <= now:
+            # Fell behind; skip missed periods rather than bursting
+            due += ((now - due) // sub.interval_s + 1) * sub.interval_s
+        return due
+
+    def _backoff_delay(self, sub: Subscription) -> float:
+        """Retry delay after consecutive failures, with jitter."""
+        delay = min(sub.interval_s * 2**sub.failures, self.max_backoff_s)
+        return delay * (1 + self.jitter * self._random.random())
+
+    @staticmethod
+    def _read_all(subs: List[Subscription]) -> List[Tuple[bool, Any, float]]:
+        """Read every subscription in the batch (runs on the instrument executor).
+
+        Raises:
+            Exception: The first error, if every read failed with an
+                instrument fault (see is_instrument_fault), so the batch
+                counts toward the instrument's circuit breaker and a
+                half-open probe running this batch fails
+        """
+        results = []
+        for sub in subs:
+            try:
+                value = sub.read_func(sub.instrument_name, sub.parameter_name)
+                results.append((True, value, time.time()))
+            except Exception as e:
+                results.append((False, e, time.time()))
+        errors = [value for ok, value, _ in results if not ok]
+        if errors and len(errors) == len(results):
+            if all(is_instrument_fault(error) for error in errors):
+                raise errors[0]
+        return results
+
+    async def _read_batch(self, instrument_name: str, subs: List[Subscription]):
+        """Read a batch of parameters on one instrument and reschedule them."""
+        try:
+            await self.rate_limiter.acquire(instrument_name, PRIORITY_POLL)
             try:
-                # Use the rate limiter and instrument lock
                 async with self.rate_limiter.get_instrument_lock(instrument_name):
-                    await self.rate_limiter.wait_if_needed(instrument_name)
-
-                    # Get the parameter value
-                    value = await asyncio.to_thread(
-                        get_parameter_func, instrument_name, parameter_name
+                    results = await self.instrument_io.run(
+                        instrument_name, self._read_all, subs
                     )
+            finally:
+                # Settle the token even if the read failed, so it is not
+                # left outstanding for a later read to skip its own token
+                await self.rate_limiter.record_access(instrument_name)
+        except Exception as e:
+            results = [(False, e, time.time())] * len(subs)
+        self.batch_reads += 1
+
+        for sub, (ok, value, read_time) in zip(subs, results):
+            sub.polls += 1
+            if ok:
+                await self.cache.set(sub.key, value, read_time)
+                sub.failures = 0
+                sub.last_error = None
+                sub.last_read = read_time
+                logger.debug(f"Polled {instrument_name}.{sub.parameter_name} = {value}")
+            else:
+                sub.failures += 1
+                sub.errors += 1
+                sub.last_error = str(value)
+                logger.error(
+                    f"Error polling {instrument_name}.{sub.parameter_name}: {value}"
+                )
 
-                    # Cache the value
-                    await self.cache.set(key, value)
-                    await self.rate_limiter.record_access(instrument_name)
-
-                    logger.debug(f"Polled {instrument_name}.{parameter_name} = {value}")
-
-            except Exception as e:
-                logger.error(f"Error polling {instrument_name}.{parameter_name}: {e}")
-
-            # Wait for next poll
-            await asyncio.sleep(interval_s)
+            if self.subscriptions.get(sub.key) is not sub:
+                continue
+            if ok:
+                self._schedule(sub, self._next_period(sub))
+            else:
+                self._schedule(sub, time.monotonic() + self._backoff_delay(sub))
 
     async def stop_all(self):
-        """Stop all polling tasks."""
-        for key in list(self.tasks.keys()):
-            instrument_name, parameter_name = key
-            await self.unsubscribe(instrument_name, parameter_name)
+        """Stop all polling and drop every subscription."""
+        self.subscriptions.clear()
+        self._heap.clear()
+        tasks = list(self._batches.values())
+        if self._scheduler is not None:
+            tasks.append(self._scheduler)
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._scheduler = None
+        self._batches.clear()
         self.running = False
 
     def get_subscriptions(self) -> Dict[str, Any]:
         """Get current subscription status."""
+        now = time.monotonic()
+        active = len(self._batches)
+        if self._scheduler is not None and not self._scheduler.done():
+            active += 1
         return {
             "subscriptions": list(self.subscriptions.keys()),
-            "active_tasks": len(self.tasks),
-            "intervals": dict(self.subscriptions),
+            "active_tasks": active,
+            "intervals": {
+                key: sub.interval_s for key, sub in self.subscriptions.items()
+            },
+            "details": [
+                {
+                    "instrument": sub.instrument_name,
+                    "parameter": sub.parameter_name,
+                    "interval_s": sub.interval_s,
+                    "next_read_in_s": max(0.0, sub.next_due - now),
+                    "last_read": sub.last_read,
+                    "polls": sub.polls,
+                    "errors": sub.errors,
+                    "consecutive_failures": sub.failures,
+                    "last_error": sub.last_error,
+                }
+                for sub in self.subscriptions.values()
+            ],
+            "batch_reads": self.batch_reads,
+            "overruns": self.overruns,
         }
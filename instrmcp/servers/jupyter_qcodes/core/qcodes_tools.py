@@ -6,7 +6,7 @@ Registers tools for interacting with QCodes instruments.
 
 import json
 import logging
-from typing import List
+from typing import List, Optional
 
 from mcp.types import TextContent
 
@@ -65,7 +65,8 @@ class QCodesToolRegistrar:
     def _to_concise_parameter_values(self, result) -> dict:
         """Convert full parameter value result to concise format.
 
-        Concise format: per query {instrument, parameter, value, error?}; only include value.
+        Concise format: per query {instrument, parameter, value, error?}; only include value,
+        plus the stale, circuit and message markers of cached fallback values.
         """
         # Handle single result
         if isinstance(result, dict):
@@ -84,9 +85,21 @@ class QCodesToolRegistrar:
 
         if "error" in result:
             concise["error"] = result["error"]
-        else:
+        if "error" not in result or result.get("stale"):
             concise["value"] = result.get("value")
 
+        # A cached value served because the instrument could not be read must
+        # not look like a fresh read
+        if result.get("stale"):
+            concise["stale"] = True
+        circuit = result.get("circuit")
+        if circuit:
+            concise["circuit"] = (
+                circuit.get("state") if isinstance(circuit, dict) else circuit
+            )
+        if result.get("message"):
+            concise["message"] = result["message"]
+
         return concise
 
     def register_all(self):
@@ -94,6 +107,11 @@ class QCodesToolRegistrar:
         self._register_instrument_info()
         self._register_get_parameter_info()
         self._register_get_parameter_values()
+        self._register_subscribe_parameter()
+        self._register_unsubscribe_parameter()
+        self._register_list_subscriptions()
+        self._register_get_parameter_history()
+        self._register_station_snapshot()
 
     def _register_instrument_info(self):
         """Register the qcodes_instrument_info tool."""
@@ -254,3 +272,245 @@ class QCodesToolRegistrar:
                         type="text", text=json.dumps({"error": str(e)}, indent=2)
                     )
                 ]
+
+    def _register_subscribe_parameter(self):
+        """Register the qcodes_subscribe_parameter tool."""
+
+        @self.mcp.tool(
+            name="qcodes_subscribe_parameter",
+            annotations={
+                "readOnlyHint": False,
+                "destructiveHint": False,
+                "idempotentHint": False,
+                "openWorldHint": False,
+            },
+        )
+        async def subscribe_parameter(
+            instrument: str, parameter: str, interval_s: float = 1.0
+        ) -> List[TextContent]:
+            # Description loaded from metadata_baseline.yaml
+            start = time.perf_counter()
+            args = {
+                "instrument": instrument,
+                "parameter": parameter,
+                "interval_s": interval_s,
+            }
+            try:
+                result = await self.tools.subscribe_parameter(
+                    instrument, parameter, interval_s
+                )
+                duration = (time.perf_counter() - start) * 1000
+                log_tool_call("qcodes_subscribe_parameter", args, duration, "success")
+                return [
+                    TextContent(
+                        type="text", text=json.dumps(result, indent=2, default=str)
+                    )
+                ]
+            except Exception as e:
+                duration = (time.perf_counter() - start) * 1000
+                log_tool_call(
+                    "qcodes_subscribe_parameter", args, duration, "error", str(e)
+                )
+                logger.error(f"Error in qcodes_subscribe_parameter: {e}")
+                return [
+                    TextContent(
+                        type="text", text=json.dumps({"error": str(e)}, indent=2)
+                    )
+                ]
+
+    def _register_unsubscribe_parameter(self):
+        """Register the qcodes_unsubscribe_parameter tool."""
+
+        @self.mcp.tool(
+            name="qcodes_unsubscribe_parameter",
+            annotations={
+                "readOnlyHint": False,
+                "destructiveHint": False,
+                "idempotentHint": True,
+                "openWorldHint": False,
+            },
+        )
+        async def unsubscribe_parameter(
+            instrument: str, parameter: str
+        ) -> List[TextContent]:
+            # Description loaded from metadata_baseline.yaml
+            start = time.perf_counter()
+            args = {"instrument": instrument, "parameter": parameter}
+            try:
+                result = await self.tools.unsubscribe_parameter(instrument, parameter)
+                duration = (time.perf_counter() - start) * 1000
+                log_tool_call("qcodes_unsubscribe_parameter", args, duration, "success")
+                return [
+                    TextContent(
+                        type="text", text=json.dumps(result, indent=2, default=str)
+                    )
+                ]
+            except Exception as e:
+                duration = (time.perf_counter() - start) * 1000
+                log_tool_call(
+                    "qcodes_unsubscribe_parameter", args, duration, "error", str(e)
+                )
+                logger.error(f"Error in qcodes_unsubscribe_parameter: {e}")
+                return [
+                    TextContent(
+                        type="text", text=json.dumps({"error": str(e)}, indent=2)
+                    )
+                ]
+
+    def _register_list_subscriptions(self):
+        """Register the qcodes_list_subscriptions tool."""
+
+        @self.mcp.tool(
+            name="qcodes_list_subscriptions",
+            annotations={
+                "readOnlyHint": True,
+                "idempotentHint": True,
+                "openWorldHint": False,
+            },
+        )
+        async def list_subscriptions(detailed: bool = False) -> List[TextContent]:
+            # Description loaded from metadata_baseline.yaml
+            start = time.perf_counter()
+            try:
+                result = await self.tools.list_subscriptions()
+                duration = (time.perf_counter() - start) * 1000
+                log_tool_call(
+                    "qcodes_list_subscriptions",
+                    {"detailed": detailed},
+                    duration,
+                    "success",
+                )
+
+                # Concise mode: just what is polled and how often
+                if not detailed:
+                    result = {
+                        "subscriptions": [
+                            {
+                                "instrument": sub["instrument"],
+                                "parameter": sub["parameter"],
+                                "interval_s": sub["interval_s"],
+                                "last_error": sub["last_error"],
+                            }
+                            for sub in result["subscriptions"]
+                        ],
+                        "count": result["count"],
+                    }
+
+                return [
+                    TextContent(
+                        type="text", text=json.dumps(result, indent=2, default=str)
+                    )
+                ]
+            except Exception as e:
+                duration = (time.perf_counter() - start) * 1000
+                log_tool_call(
+                    "qcodes_list_subscriptions",
+                    {"detailed": detailed},
+                    duration,
+                    "error",
+                    str(e),
+                )
+                logger.error(f"Error in qcodes_list_subscriptions: {e}")
+                return [
+                    TextContent(
+                        type="text", text=json.dumps({"error": str(e)}, indent=2)
+                    )
+                ]
+
+    def _register_get_parameter_history(self):
+        """Register the qcodes_get_parameter_history tool."""
+
+        @self.mcp.tool(
+            name="qcodes_get_parameter_history",
+            annotations={
+                "readOnlyHint": True,
+                "idempotentHint": True,
+                "openWorldHint": False,
+            },
+        )
+        async def get_parameter_history(
+            instrument: str,
+            parameter: str,
+            window_s: Optional[float] = None,
+            method: str = "stats",
+            max_points: int = 200,
+        ) -> List[TextContent]:
+            # Description loaded from metadata_baseline.yaml
+            start = time.perf_counter()
+            args = {
+                "instrument": instrument,
+                "parameter": parameter,
+                "window_s": window_s,
+                "method": method,
+                "max_points": max_points,
+            }
+            try:
+                result = await self.tools.get_parameter_history(
+                    instrument, parameter, window_s, method, max_points
+                )
+                duration = (time.perf_counter() - start) * 1000
+                log_tool_call("qcodes_get_parameter_history", args, duration, "success")
+                return [
+                    TextContent(
+                        type="text", text=json.dumps(result, indent=2, default=str)
+                    )
+                ]
+            except Exception as e:
+                duration = (time.perf_counter() - start) * 1000
+                log_tool_call(
+                    "qcodes_get_parameter_history", args, duration, "error", str(e)
+                )
+                logger.error(f"Error in qcodes_get_parameter_history: {e}")
+                return [
+                    TextContent(
+                        type="text", text=json.dumps({"error": str(e)}, indent=2)
+                    )
+                ]
+
+    def _register_station_snapshot(self):
+        """Register the qcodes_station_snapshot tool."""
+
+        @self.mcp.tool(
+            name="qcodes_station_snapshot",
+            annotations={
+                "readOnlyHint": True,
+                "idempotentHint": True,
+                "openWorldHint": False,
+            },
+        )
+        async def station_snapshot(
+            since_version: Optional[int] = None,
+            path: Optional[str] = None,
+            refresh: bool = False,
+            timeout_s: Optional[float] = None,
+        ) -> List[TextContent]:
+            # Description loaded from metadata_baseline.yaml
+            start = time.perf_counter()
+            args = {
+                "since_version": since_version,
+                "path": path,
+                "refresh": refresh,
+                "timeout_s": timeout_s,
+            }
+            try:
+                result = await self.tools.get_station_snapshot(
+                    since_version, path, refresh, timeout_s
+                )
+                duration = (time.perf_counter() - start) * 1000
+                log_tool_call("qcodes_station_snapshot", args, duration, "success")
+                return [
+                    TextContent(
+                        type="text", text=json.dumps(result, indent=2, default=str)
+                    )
+                ]
+            except Exception as e:
+                duration = (time.perf_counter() - start) * 1000
+                log_tool_call(
+                    "qcodes_station_snapshot", args, duration, "error", str(e)
+                )
+                logger.error(f"Error in qcodes_station_snapshot: {e}")
+                return [
+                    TextContent(
+                        type="text", text=json.dumps({"error": str(e)}, indent=2)
+                    )
+                ]
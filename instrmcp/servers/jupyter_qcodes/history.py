@@ -0,0 +1,187 @@
+"""
+Fixed-size time-series history of parameter reads.
+
+Every live or polled read that lands in ReadCache is also appended to a
+per-parameter ring buffer of float64 timestamps and values, so drift over
+the recent past can be queried without touching hardware.
+"""
+
+import logging
+import math
+import time
+from collections import OrderedDict
+from numbers import Real
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from .array_utils import lttb, minmax_decimate
+
+logger = logging.getLogger(__name__)
+
+# Decimation methods accepted by ParameterHistory.query
+HISTORY_METHODS = ("stats", "lttb", "minmax")
+
+
+class RingBuffer:
+    """Preallocated ring buffer of (timestamp, value) float64 pairs."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.timestamps = np.empty(capacity, dtype=np.float64)
+        self.values = np.empty(capacity, dtype=np.float64)
+        # Index of the next write, and number of valid points
+        self.head = 0
+        self.count = 0
+
+    def append(self, timestamp: float, value: float):
+        """Append a point, overwriting the oldest once full."""
+        self.timestamps[self.head] = timestamp
+        self.values[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (timestamps, values) copies in insertion order."""
+        if self.count < self.capacity:
+            return (
+                self.timestamps[: self.count].copy(),
+                self.values[: self.count].copy(),
+            )
+        order = np.r_[self.head : self.capacity, 0 : self.head]
+        return self.timestamps[order], self.values[order]
+
+    @property
+    def nbytes(self) -> int:
+        return self.timestamps.nbytes + self.values.nbytes
+
+
+class ParameterHistory:
+    """Ring-buffer history for numeric scalar parameter values.
+
+    Each parameter gets a buffer of ``capacity`` points (16 bytes per point)
+    allocated on its first read. At most ``max_series`` parameters are kept;
+    the one updated least recently is dropped to make room. Non-numeric,
+    boolean and array values are not recorded.
+    """
+
+    def __init__(self, capacity: int = 4096, max_series: int = 512):
+        """Initialize the history.
+
+        Args:
+            capacity: Points kept per parameter
+            max_series: Maximum number of parameters with history
+        """
+        self.capacity = capacity
+        self.max_series = max_series
+        # (instrument_name, parameter_name) -> RingBuffer, least recent first
+        self.series: "OrderedDict[Tuple[str, str], RingBuffer]" = OrderedDict()
+        self.skipped = 0
+
+    def record(self, key: Tuple[str, str], value: Any, timestamp: float):
+        """Record a read; ignored unless the value is a real number."""
+        if isinstance(value, (np.ndarray, np.generic)) and value.ndim == 0:
+            value = value.item()
+        # bool is a Real, but on/off states are not a series to decimate
+        if not isinstance(value, Real) or isinstance(value, bool):
+            self.skipped += 1
+            return
+
+        buffer = self.series.get(key)
+        if buffer is None:
+            buffer = self.series[key] = RingBuffer(self.capacity)
+            while len(self.series) > self.max_series:
+                self.series.popitem(last=False)
+        else:
+            self.series.move_to_end(key)
+        buffer.append(timestamp, float(value))
+
+    def clear(self, key: Optional[Tuple[str, str]] = None):
+        """Drop the history of one parameter, or of all parameters."""
+        if key is None:
+            self.series.clear()
+        else:
+            self.series.pop(key, None)
+
+    def query(
+        self,
+        key: Tuple[str, str],
+        window_s: Optional[float] = None,
+        method: str = "stats",
+        max_points: int = 200,
+    ) -> Dict[str, Any]:
+        """Summarize recorded values of a parameter.
+
+        Args:
+            key: (instrument_name, parameter_name)
+            window_s: Only include points from the last window_s seconds (None = all)
+            method: "stats" for statistics only; "lttb" or "minmax" to also
+                return a series decimated to at most max_points
+            max_points: Maximum points in the returned series
+
+        Returns:
+            Dict with count, time range, min/max/mean/std/first/last and,
+            for lttb/minmax, a "series" of [timestamp, value] pairs
+
+        Raises:
+            KeyError: If no history was recorded for the parameter
+            ValueError: If method is unknown
+        """
+        if method not in HISTORY_METHODS:
+            raise ValueError(
+                f"Unknown method '{method}', expected one of {list(HISTORY_METHODS)}"
+            )
+        buffer = self.series.get(key)
+        if buffer is None:
+            raise KeyError(key)
+
+        t, v = buffer.arrays()
+        if t.size > 1 and np.any(np.diff(t) < 0):
+            # Concurrent reads can land slightly out of order
+            order = np.argsort(t, kind="stable")
+            t, v = t[order], v[order]
+        if window_s is not None:
+            start = np.searchsorted(t, time.time() - window_s)
+            t, v = t[start:], v[start:]
+
+        result: Dict[str, Any] = {
+            "count": int(t.size),
+            "capacity": buffer.capacity,
+            "start": float(t[0]) if t.size else None,
+            "end": float(t[-1]) if t.size else None,
+        }
+        finite = v[np.isfinite(v)]
+        if finite.size:
+            result.update(
+                {
+                    "min": float(finite.min()),
+                    "max": float(finite.max()),
+                    "mean": float(finite.mean()),
+                    "std": float(finite.std()),
+                    "first": _json_float(v[0]),
+                    "last": _json_float(v[-1]),
+                }
+            )
+
+        if method != "stats":
+            decimate = lttb if method == "lttb" else minmax_decimate
+            t, v = decimate(t, v, max_points)
+            result["method"] = method
+            result["series"] = [[float(ts), _json_float(val)] for ts, val in zip(t, v)]
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get history statistics."""
+        return {
+            "series": len(self.series),
+            "max_series": self.max_series,
+            "capacity": self.capacity,
+            "bytes": sum(buffer.nbytes for buffer in self.series.values()),
+            "skipped_non_numeric": self.skipped,
+        }
+
+
+def _json_float(value: float) -> Optional[float]:
+    """Convert to a JSON-safe float (NaN and infinities become None)."""
+    value = float(value)
+    return value if math.isfinite(value) else None
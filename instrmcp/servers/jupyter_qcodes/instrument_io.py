@@ -0,0 +1,429 @@
+"""
+Dedicated thread pools for instrument I/O.
+
+Hardware calls (parameter reads, snapshots, discovery) run on small
+per-instrument executors instead of asyncio's default pool, so a hung VISA
+read only blocks its own instrument. Instruments on a shared bus (e.g. all
+devices on GPIB0) share one executor, since the bus serializes them anyway.
+Notebook tools keep using the default pool; database tools have their own
+workers (options/database/worker_pool.py).
+
+Every call has a deadline, and each instrument has a circuit breaker: after
+repeated failures or timeouts calls fail immediately instead of stalling,
+until a background probe finds the instrument responsive again.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class InstrumentQueueFull(RuntimeError):
+    """Raised when an instrument executor already has too many pending calls."""
+
+
+class InstrumentTimeout(asyncio.TimeoutError):
+    """Raised when an instrument call exceeds its deadline."""
+
+
+class InstrumentUnavailable(RuntimeError):
+    """Raised without calling the instrument while its circuit breaker is open."""
+
+    def __init__(self, message: str, breaker: Dict[str, Any]):
+        super().__init__(message)
+        self.breaker = breaker
+
+
+# Circuit breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitBreaker:
+    """Failure tracking for one instrument."""
+
+    state: str = CLOSED
+    consecutive_failures: int = 0
+    # Delay before the next probe; doubles after every failed probe
+    reset_timeout_s: float = 0.0
+    opened_at: Optional[float] = None
+    last_error: Optional[str] = None
+    trips: int = 0
+    short_circuited: int = 0
+    # Last failed call, re-run as the half-open probe
+    probe: Optional[Callable[[], Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "open_for_s": (
+                time.monotonic() - self.opened_at
+                if self.opened_at is not None
+                else None
+            ),
+            "next_probe_in_s": (
+                max(0.0, self.opened_at + self.reset_timeout_s - time.monotonic())
+                if self.state == OPEN and self.opened_at is not None
+                else None
+            ),
+            "last_error": self.last_error,
+            "trips": self.trips,
+            "short_circuited": self.short_circuited,
+        }
+
+
+@dataclass
+class ExecutorStats:
+    """Counters for one instrument executor (guarded by InstrumentIO.lock)."""
+
+    queued: int = 0
+    running: int = 0
+    max_queued: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    total_run_s: float = 0.0
+    max_run_s: float = 0.0
+    max_wait_s: float = 0.0
+
+
+class InstrumentIO:
+    """Runs blocking instrument calls on bounded per-instrument executors.
+
+    Each executor group (an instrument name, or a bus name shared by several
+    instruments) gets a ThreadPoolExecutor with ``workers`` threads, created
+    on first use. At most ``max_pending`` calls may wait or run per group;
+    beyond that ``run`` fails fast with InstrumentQueueFull instead of
+    queueing behind a hung instrument indefinitely.
+    """
+
+    def __init__(
+        self,
+        workers: int = 1,
+        max_pending: int = 32,
+        timeout_s: Optional[float] = 10.0,
+        failure_threshold: int = 3,
+        reset_timeout_s: float = 15.0,
+        max_reset_timeout_s: float = 300.0,
+    ):
+        """Initialize the I/O layer.
+
+        Args:
+            workers: Threads per executor group
+            max_pending: Maximum queued plus running calls per group
+            timeout_s: Default deadline per call (None = no deadline)
+            failure_threshold: Consecutive failures that open an instrument's breaker
+            reset_timeout_s: Delay before the first half-open probe
+            max_reset_timeout_s: Upper bound on the probe delay after failed probes
+        """
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout_s = timeout_s
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_s = reset_timeout_s
+        self.max_reset_timeout_s = max_reset_timeout_s
+        # instrument_name -> deadline overriding timeout_s
+        self.timeouts: Dict[str, Optional[float]] = {}
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self._probes: Set[asyncio.Task] = set()
+        # instrument_name -> executor group (bus) name; default is the instrument
+        self.groups: Dict[str, str] = {}
+        self.executors: Dict[str, ThreadPoolExecutor] = {}
+        self.stats: Dict[str, ExecutorStats] = {}
+        # Counters are updated from worker threads
+        self.lock = threading.Lock()
+
+    def assign(self, instrument_name: str, group: str):
+        """Route an instrument's calls to a shared executor group (e.g. "GPIB0")."""
+        self.groups[instrument_name] = group
+
+    def set_timeout(self, instrument_name: str, timeout_s: Optional[float]):
+        """Set the per-call deadline for one instrument (None = no deadline)."""
+        self.timeouts[instrument_name] = timeout_s
+
+    def get_timeout(self, instrument_name: str) -> Optional[float]:
+        """Get the per-call deadline for an instrument."""
+        return self.timeouts.get(instrument_name, self.timeout_s)
+
+    def breaker_state(self, instrument_name: str) -> Dict[str, Any]:
+        """Get the circuit breaker state of an instrument."""
+        breaker = self.breakers.get(instrument_name)
+        return (breaker or CircuitBreaker()).to_dict()
+
+    def is_available(self, instrument_name: str) -> bool:
+        """Check whether calls to an instrument are currently let through."""
+        breaker = self.breakers.get(instrument_name)
+        return breaker is None or breaker.state == CLOSED
+
+    def group_for(self, instrument_name: str) -> str:
+        """Get the executor group for an instrument."""
+        return self.groups.get(instrument_name, instrument_name)
+
+    def _executor(self, group: str) -> ThreadPoolExecutor:
+        """Get or create the executor for a group."""
+        executor = self.executors.get(group)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix=f"instrmcp-io-{group}"
+            )
+            self.executors[group] = executor
+            self.stats[group] = ExecutorStats()
+        return executor
+
+    async def run(
+        self, instrument_name: str, func: Callable[..., Any], *args, **kwargs
+    ) -> Any:
+        """Run a blocking call on the instrument's executor, with a deadline.
+
+        Args:
+            instrument_name: Instrument the call talks to
+            func: Blocking callable
+            *args, **kwargs: Arguments for func
+
+        Returns:
+            The result of func
+
+        Raises:
+            InstrumentUnavailable: If the instrument's circuit breaker is open
+            InstrumentTimeout: If the call exceeds the instrument's deadline
+            InstrumentQueueFull: If the group already has max_pending calls
+        """
+        breaker = self.breakers.get(instrument_name)
+        if breaker is not None and breaker.state != CLOSED:
+            breaker.short_circuited += 1
+            raise InstrumentUnavailable(
+                f"Instrument '{instrument_name}' is unavailable (circuit {breaker.state} "
+                f"after {breaker.consecutive_failures} failures: {breaker.last_error})",
+                breaker.to_dict(),
+            )
+
+        try:
+            result = await self._call(instrument_name, func, *args, **kwargs)
+        except InstrumentQueueFull:
+            raise
+        except Exception as e:
+            if is_instrument_fault(e):
+                self._record_failure(instrument_name, e, lambda: func(*args, **kwargs))
+            raise
+        self._record_success(instrument_name)
+        return result
+
+    async def _call(
+        self, instrument_name: str, func: Callable[..., Any], *args, **kwargs
+    ) -> Any:
+        """Run a call on the instrument's executor, enforcing its deadline."""
+        timeout = self.get_timeout(instrument_name)
+        # asyncio.wait (not wait_for) so a TimeoutError raised by the driver
+        # itself is not mistaken for the deadline expiring
+        future = asyncio.ensure_future(
+            self._submit(instrument_name, func, *args, **kwargs)
+        )
+        try:
+            done, _ = await asyncio.wait({future}, timeout=timeout)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        if not done:
+            # The worker thread keeps running the call; only the caller gives up
+            future.cancel()
+            raise InstrumentTimeout(
+                f"Call to '{instrument_name}' exceeded its {timeout}s deadline"
+            )
+        return future.result()
+
+    async def _submit(
+        self, instrument_name: str, func: Callable[..., Any], *args, **kwargs
+    ) -> Any:
+        """Submit a call to the instrument's executor with queue accounting."""
+        group = self.group_for(instrument_name)
+        executor = self._executor(group)
+        stats = self.stats[group]
+
+        with self.lock:
+            if stats.queued + stats.running >= self.max_pending:
+                stats.rejected += 1
+                raise InstrumentQueueFull(
+                    f"I/O queue for '{group}' is full ({self.max_pending} pending calls); "
+                    "the instrument may be unresponsive"
+                )
+            stats.queued += 1
+            stats.max_queued = max(stats.max_queued, stats.queued)
+
+        submitted = time.monotonic()
+        # Whether call() started, or the caller gave up while it was queued
+        state = {"started": False, "abandoned": False}
+
+        def call():
+            start = time.monotonic()
+            with self.lock:
+                state["started"] = True
+                if not state["abandoned"]:
+                    stats.queued -= 1
+                stats.running += 1
+                stats.max_wait_s = max(stats.max_wait_s, start - submitted)
+            ok = False
+            try:
+                result = func(*args, **kwargs)
+                ok = True
+                return result
+            finally:
+                elapsed = time.monotonic() - start
+                with self.lock:
+                    stats.running -= 1
+                    stats.total_run_s += elapsed
+                    stats.max_run_s = max(stats.max_run_s, elapsed)
+                    if ok:
+                        stats.completed += 1
+                    else:
+                        stats.failed += 1
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(executor, call)
+        except asyncio.CancelledError:
+            # A call cancelled while queued may never reach call()
+            with self.lock:
+                if not state["started"]:
+                    state["abandoned"] = True
+                    stats.queued -= 1
+            raise
+
+    def _record_success(self, instrument_name: str):
+        """Reset an instrument's failure count after a successful call."""
+        breaker = self.breakers.get(instrument_name)
+        if breaker is not None:
+            breaker.consecutive_failures = 0
+
+    def _record_failure(
+        self, instrument_name: str, error: Exception, probe: Callable[[], Any]
+    ):
+        """Count a failed call and open the breaker at the threshold."""
+        breaker = self.breakers.setdefault(instrument_name, CircuitBreaker())
+        breaker.consecutive_failures += 1
+        breaker.last_error = str(error) or type(error).__name__
+        breaker.probe = probe
+        if (
+            breaker.state == CLOSED
+            and breaker.consecutive_failures >= self.failure_threshold
+        ):
+            breaker.reset_timeout_s = self.reset_timeout_s
+            self._open(instrument_name, breaker)
+            task = asyncio.ensure_future(self._probe_until_closed(instrument_name))
+            self._probes.add(task)
+            task.add_done_callback(self._probes.discard)
+
+    def _open(self, instrument_name: str, breaker: CircuitBreaker):
+        """Move a breaker to the open state."""
+        breaker.state = OPEN
+        breaker.opened_at = time.monotonic()
+        breaker.trips += 1
+        logger.warning(
+            f"Circuit opened for instrument '{instrument_name}' after "
+            f"{breaker.consecutive_failures} failures: {breaker.last_error}"
+        )
+
+    async def _probe_until_closed(self, instrument_name: str):
+        """Retry the last failed call in the background until it succeeds."""
+        breaker = self.breakers[instrument_name]
+        while breaker.state != CLOSED:
+            await asyncio.sleep(breaker.reset_timeout_s)
+            breaker.state = HALF_OPEN
+            try:
+                await self._call(instrument_name, breaker.probe)
+            except InstrumentQueueFull:
+                breaker.state = OPEN
+                continue
+            except Exception as e:
+                # Anything but an I/O fault means the instrument answered
+                if is_instrument_fault(e):
+                    breaker.consecutive_failures += 1
+                    breaker.last_error = str(e) or type(e).__name__
+                    breaker.reset_timeout_s = min(
+                        breaker.reset_timeout_s * 2, self.max_reset_timeout_s
+                    )
+                    self._open(instrument_name, breaker)
+                    continue
+            breaker.state = CLOSED
+            breaker.consecutive_failures = 0
+            breaker.opened_at = None
+            breaker.probe = None
+            logger.info(f"Circuit closed for instrument '{instrument_name}'")
+
+    def get_breaker_stats(self) -> Dict[str, Any]:
+        """Get circuit breaker state for every instrument that has failed."""
+        return {name: breaker.to_dict() for name, breaker in self.breakers.items()}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-group queue depth and latency statistics."""
+        members: Dict[str, list] = {}
+        for instrument_name, group in self.groups.items():
+            members.setdefault(group, []).append(instrument_name)
+
+        with self.lock:
+            result = {}
+            for group, stats in self.stats.items():
+                finished = stats.completed + stats.failed
+                result[group] = {
+                    "instruments": members.get(group, [group]),
+                    "workers": self.workers,
+                    "queued": stats.queued,
+                    "running": stats.running,
+                    "max_queued": stats.max_queued,
+                    "completed": stats.completed,
+                    "failed": stats.failed,
+                    "rejected": stats.rejected,
+                    "mean_run_ms": (
+                        stats.total_run_s / finished * 1000 if finished else None
+                    ),
+                    "max_run_ms": stats.max_run_s * 1000,
+                    "max_wait_ms": stats.max_wait_s * 1000,
+                }
+        return result
+
+    def shutdown(self):
+        """Stop all executors and probes without waiting for hung calls."""
+        for task in list(self._probes):
+            task.cancel()
+        for executor in self.executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        self.executors.clear()
+        self.stats.clear()
+
+
+def is_instrument_fault(error: BaseException) -> bool:
+    """Check whether an error means the instrument itself is not responding.
+
+    Timeouts, OS/connection errors and VISA errors count toward the circuit
+    breaker. Other exceptions (validation, parsing, driver bugs) mean the
+    instrument answered and do not.
+    """
+    if isinstance(error, (TimeoutError, asyncio.TimeoutError, OSError)):
+        return True
+    error_type = type(error)
+    return error_type.__module__.startswith("pyvisa") or (
+        "visa" in error_type.__name__.lower()
+    )
+
+
+def detect_bus(instrument: Any) -> Optional[str]:
+    """Detect a shared bus from a VISA address, e.g. "GPIB0::12::INSTR" -> "GPIB0".
+
+    Only GPIB addresses are grouped; other interfaces (TCPIP, USB, ASRL) are
+    independent connections and keep one executor per instrument.
+    """
+    address = getattr(instrument, "_address", None)
+    if not isinstance(address, str):
+        handle = getattr(instrument, "visa_handle", None)
+        address = getattr(handle, "resource_name", None)
+    if isinstance(address, str) and address.upper().startswith("GPIB"):
+        return address.split("::", 1)[0].upper()
+    return None
@@ -60,12 +60,18 @@ except ImportError:
 # Database integration (optional)
 try:
     from .options import database as db_integration
-    from .options.database import DatabaseToolRegistrar
+    from .options.database import (
+        DatabaseToolRegistrar,
+        DatabaseWorkerPool,
+        get_connection_pool,
+    )
 
     DATABASE_AVAILABLE = True
 except ImportError:
     db_integration = None
     DatabaseToolRegistrar = None
+    DatabaseWorkerPool = None
+    get_connection_pool = None
     DATABASE_AVAILABLE = False
 
 logger = get_logger("server")
@@ -107,6 +113,8 @@ class JupyterMCPServer:
 
         # Initialize tools
         self.tools = QCodesReadOnlyTools(ipython)
+        # Executor of the database tools, shut down with the tools
+        self.database_workers = None
 
         # Create FastMCP server
         server_name = (
@@ -194,11 +202,13 @@ class JupyterMCPServer:
 
         # Optional: Database tools
         if DATABASE_AVAILABLE and "database" in self.enabled_options:
+            self.database_workers = DatabaseWorkerPool()
             database_registrar = DatabaseToolRegistrar(
                 self.mcp,
                 db_integration,
                 tools=self.tools,
                 safe_mode=self.safe_mode,
+                workers=self.database_workers,
             )
             database_registrar.register_all()
 
@@ -218,18 +228,6 @@ class JupyterMCPServer:
             )
             dynamic_registrar.register_all()
 
-        # Commented out: Parameter subscription tools (future feature)
-        # @self.mcp.tool()
-        # async def subscribe_parameter(instrument: str, parameter: str, interval_s: float = 1.0):
-        #     """Subscribe to periodic parameter updates."""
-        #     pass
-
-        # Commented out: System tools (future feature)
-        # @self.mcp.tool()
-        # async def get_cache_stats():
-        #     """Get parameter cache statistics."""
-        #     pass
-
     def _apply_metadata_overrides(self) -> None:
         """Apply tool and resource metadata overrides from config.
 
@@ -627,7 +625,28 @@ class JupyterMCPServer:
         2. If RuntimeError (IPython API access), try run_coroutine_threadsafe
            on server loop if still alive
         3. If both fail, log warning and continue (don't block server stop)
+
+        The database worker pool and pooled connections are released
+        either way.
         """
+        try:
+            self._run_tools_cleanup()
+        finally:
+            self._cleanup_database()
+
+    def _cleanup_database(self):
+        """Stop the database workers and close pooled database connections.
+
+        Workers do not wait for abandoned queries; connections those queries
+        still hold are closed when they are returned.
+        """
+        if self.database_workers is not None:
+            self.database_workers.shutdown()
+            get_connection_pool().close_all()
+            logger.debug("Database workers and connections released")
+
+    def _run_tools_cleanup(self):
+        """Run tools.cleanup() on a fresh loop, or on the server loop."""
         # First try: fresh event loop (simplest, works for most cleanup)
         try:
             loop = asyncio.new_event_loop()
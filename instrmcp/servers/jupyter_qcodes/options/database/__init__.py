@@ -13,8 +13,12 @@ from .query_tools import (
     thread_safe_db_connection,
 )
 
+from .run_data import get_run_data
+from .previews import get_run_preview
 from .resources import get_current_database_config, get_recent_measurements
 from .tools import DatabaseToolRegistrar
+from .worker_pool import DatabaseWorkerPool
+from .connection_pool import get_connection_pool
 
 __all__ = [
     # Query tools
@@ -23,9 +27,14 @@ __all__ = [
     "get_database_stats",
     "list_available_databases",
     "thread_safe_db_connection",
+    # Result table data and previews
+    "get_run_data",
+    "get_run_preview",
     # Resources
     "get_current_database_config",
     "get_recent_measurements",
-    # Tool registrar
+    # Tool registrar and the worker pool running its calls
     "DatabaseToolRegistrar",
+    "DatabaseWorkerPool",
+    "get_connection_pool",
 ]
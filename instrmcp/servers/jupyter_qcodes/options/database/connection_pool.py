@@ -0,0 +1,290 @@
+"""
+Pooled read-only SQLite connections for QCoDeS databases.
+
+Opening a connection and parsing the schema of a large measurement database
+on every helper call dominates the cost of small queries. SQLiteConnectionPool
+keeps a few idle connections per database file, opened read-only and tuned
+for large files, and hands them out to one thread at a time.
+
+Pooled connections coexist with a kernel writing to the same database: they
+never write (``mode=ro`` and ``PRAGMA query_only``), and outside of a query
+they hold no read transaction, so every query sees the latest committed data
+and WAL checkpoints are not blocked. Connections are evicted when they have
+been idle too long or when the database file is replaced.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Memory-map up to this many bytes of the database file
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024
+# Page cache per connection in KiB
+DEFAULT_CACHE_SIZE_KIB = 64 * 1024
+
+
+@dataclass
+class _PooledConnection:
+    connection: sqlite3.Connection
+    # (st_dev, st_ino) of the database file when the connection was opened
+    file_id: Tuple[int, int]
+    # close_all() calls made before the connection was opened
+    generation: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _DatabasePool:
+    idle: List[_PooledConnection] = field(default_factory=list)
+    # Connections currently handed out
+    in_use: int = 0
+
+
+class SQLiteConnectionPool:
+    """Per-database pool of read-only SQLite connections.
+
+    A connection is used by one thread at a time; callers that find all
+    connections of a database in use wait for one to be returned.
+    """
+
+    def __init__(
+        self,
+        max_connections_per_db: int = 4,
+        idle_timeout_s: float = 300.0,
+        wait_timeout_s: float = 30.0,
+        mmap_size: int = DEFAULT_MMAP_SIZE,
+        cache_size_kib: int = DEFAULT_CACHE_SIZE_KIB,
+    ):
+        """Initialize the pool.
+
+        Args:
+            max_connections_per_db: Maximum open connections per database file
+            idle_timeout_s: Close connections that have been idle this long
+            wait_timeout_s: Maximum time to wait for a free connection
+            mmap_size: PRAGMA mmap_size in bytes
+            cache_size_kib: PRAGMA cache_size in KiB
+        """
+        self.max_connections_per_db = max_connections_per_db
+        self.idle_timeout_s = idle_timeout_s
+        self.wait_timeout_s = wait_timeout_s
+        self.mmap_size = mmap_size
+        self.cache_size_kib = cache_size_kib
+        self._pools: Dict[str, _DatabasePool] = {}
+        self._condition = threading.Condition()
+        # Incremented by close_all(); older connections are closed on release
+        self._generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.wait_time_s = 0.0
+        self.max_wait_s = 0.0
+        self.evicted_idle = 0
+        self.evicted_replaced = 0
+        self.discarded = 0
+
+    @contextmanager
+    def connection(self, db_path: str) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection to a database file.
+
+        Cursors should be exhausted or closed before the block ends, so the
+        connection holds no read transaction while idle in the pool.
+
+        Args:
+            db_path: Path to the SQLite database file
+
+        Yields:
+            sqlite3.Connection with Row factory enabled for dict-like access
+
+        Raises:
+            sqlite3.OperationalError: If the file cannot be opened or no
+                connection became free within wait_timeout_s
+        """
+        key = str(Path(db_path).resolve())
+        file_id = _file_id(key)
+        pooled = self._acquire(key, file_id)
+        if pooled is None:
+            generation = self._generation
+            try:
+                pooled = _PooledConnection(self._open(key), file_id, generation)
+            except BaseException:
+                self._release(key, None)
+                raise
+
+        try:
+            yield pooled.connection
+        except GeneratorExit:
+            # A generator holding the connection was closed early; the
+            # connection itself is fine
+            pooled.last_used = time.monotonic()
+            if not self._release(key, pooled):
+                _close(pooled.connection)
+            raise
+        except BaseException:
+            # The connection may be mid-transaction or the file unusable
+            self._release(key, None)
+            _close(pooled.connection)
+            with self._condition:
+                self.discarded += 1
+            raise
+        else:
+            pooled.last_used = time.monotonic()
+            if not self._release(key, pooled):
+                _close(pooled.connection)
+
+    def _acquire(
+        self, key: str, file_id: Optional[Tuple[int, int]]
+    ) -> Optional[_PooledConnection]:
+        """Reserve a connection slot; returns an idle connection or None to open one."""
+        to_close = []
+        try:
+            with self._condition:
+                pool = self._pools.setdefault(key, _DatabasePool())
+                to_close.extend(self._evict(pool, file_id))
+
+                if not pool.idle and pool.in_use >= self.max_connections_per_db:
+                    self.waits += 1
+                    start = time.monotonic()
+                    while not pool.idle and pool.in_use >= self.max_connections_per_db:
+                        remaining = self.wait_timeout_s - (time.monotonic() - start)
+                        if remaining <= 0:
+                            raise sqlite3.OperationalError(
+                                f"Timed out after {self.wait_timeout_s}s waiting "
+                                f"for a connection to {key}"
+                            )
+                        self._condition.wait(remaining)
+                    waited = time.monotonic() - start
+                    self.wait_time_s += waited
+                    self.max_wait_s = max(self.max_wait_s, waited)
+                    to_close.extend(self._evict(pool, file_id))
+
+                pool.in_use += 1
+                if pool.idle:
+                    self.hits += 1
+                    # Most recently used first: its pages are the warmest
+                    return pool.idle.pop()
+                self.misses += 1
+                return None
+        finally:
+            for pooled in to_close:
+                _close(pooled.connection)
+
+    def _release(self, key: str, pooled: Optional[_PooledConnection]) -> bool:
+        """Free a connection slot; returns whether pooled was kept for reuse."""
+        with self._condition:
+            pool = self._pools[key]
+            pool.in_use -= 1
+            kept = pooled is not None and pooled.generation == self._generation
+            if kept:
+                pool.idle.append(pooled)
+            self._condition.notify()
+            return kept
+
+    def _evict(
+        self, pool: _DatabasePool, file_id: Optional[Tuple[int, int]]
+    ) -> List[_PooledConnection]:
+        """Remove stale idle connections from a pool (caller holds the lock)."""
+        now = time.monotonic()
+        keep = []
+        evicted = []
+        for pooled in pool.idle:
+            if pooled.file_id != file_id:
+                self.evicted_replaced += 1
+                evicted.append(pooled)
+            elif now - pooled.last_used > self.idle_timeout_s:
+                self.evicted_idle += 1
+                evicted.append(pooled)
+            else:
+                keep.append(pooled)
+        pool.idle = keep
+        return evicted
+
+    def _open(self, path: str) -> sqlite3.Connection:
+        """Open and tune a read-only connection."""
+        uri = f"{Path(path).as_uri()}?mode=ro"
+        connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        try:
+            self._configure(connection)
+        except sqlite3.OperationalError as e:
+            # A WAL database whose -shm file does not exist yet cannot be
+            # opened read-only; open it normally but still refuse writes.
+            _close(connection)
+            logger.debug(f"Read-only open of {path} failed ({e}), using query_only")
+            if not os.path.exists(path):
+                raise
+            connection = sqlite3.connect(path, check_same_thread=False)
+            try:
+                self._configure(connection)
+            except BaseException:
+                _close(connection)
+                raise
+        return connection
+
+    def _configure(self, connection: sqlite3.Connection):
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA query_only = ON")
+        connection.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        connection.execute(f"PRAGMA cache_size = {-int(self.cache_size_kib)}")
+        # Read the schema now, once per connection rather than per query
+        connection.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+
+    def close_all(self):
+        """Close all idle connections, and borrowed ones once they are returned."""
+        with self._condition:
+            self._generation += 1
+            idle = [p for pool in self._pools.values() for p in pool.idle]
+            for pool in self._pools.values():
+                pool.idle = []
+        for pooled in idle:
+            _close(pooled.connection)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        with self._condition:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "waits": self.waits,
+                "wait_time_ms": round(self.wait_time_s * 1000, 3),
+                "max_wait_ms": round(self.max_wait_s * 1000, 3),
+                "evicted_idle": self.evicted_idle,
+                "evicted_replaced": self.evicted_replaced,
+                "discarded": self.discarded,
+                "databases": {
+                    key: {"idle": len(pool.idle), "in_use": pool.in_use}
+                    for key, pool in self._pools.items()
+                    if pool.idle or pool.in_use
+                },
+            }
+
+
+def _file_id(path: str) -> Optional[Tuple[int, int]]:
+    """Identity of a file, so a replaced file is detected."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_dev, stat.st_ino)
+
+
+def _close(connection: sqlite3.Connection):
+    try:
+        connection.close()
+    except sqlite3.Error:
+        pass
+
+
+_pool = SQLiteConnectionPool()
+
+
+def get_connection_pool() -> SQLiteConnectionPool:
+    """Get the process-wide connection pool used by the database tools."""
+    return _pool
@@ -0,0 +1,23 @@
+"""
+SQL identifier helpers for QCoDeS result tables.
+
+Result table and column names come from the database itself and are
+interpolated into queries, so table names are checked against the pattern
+QCoDeS uses for them and column names are quoted.
+"""
+
+import re
+from typing import Optional
+
+# Result table names QCoDeS creates, e.g. "results-1-12"
+VALID_TABLE_NAME_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_-]*$")
+
+
+def is_valid_table_name(table_name: Optional[str]) -> bool:
+    """Check a result table name is safe to interpolate into a query."""
+    return bool(table_name) and VALID_TABLE_NAME_PATTERN.match(table_name) is not None
+
+
+def quote_identifier(identifier: str) -> str:
+    """Quote an SQL identifier (e.g. a parameter's column name)."""
+    return '"' + identifier.replace('"', '""') + '"'
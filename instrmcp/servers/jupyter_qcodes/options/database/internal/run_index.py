@@ -0,0 +1,348 @@
+"""
+Incremental index of parsed per-run metadata.
+
+Sweep grouping and code suggestions need a few fields of every run (sweep
+class, setpoints, dependents, launched_by, ...), which live in the large
+``run_description`` and ``measureit`` JSON blobs of the ``runs`` table.
+RunIndex parses each run once and keeps the result in memory and in a
+sidecar SQLite file under ``~/.instrmcp``, keyed by database path and run
+GUID, so later calls only read runs added since the last one.
+
+An index is reused without touching the ``runs`` table while the database
+file (and its WAL file) keep the same inode, mtime and size. Otherwise runs
+after the highest indexed run_id are read, together with the runs that were
+still in progress, whose metadata may have been completed since. If the file
+was replaced, or the highest indexed run no longer has the same GUID, the
+index of that database is rebuilt. PRAGMA data_version is not used: it only
+changes per connection, and pooled connections are not tied to one index.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..query_tools import thread_safe_db_connection
+
+logger = logging.getLogger(__name__)
+
+# Default location of the sidecar index
+DEFAULT_RUN_INDEX_PATH = Path.home() / ".instrmcp" / "run_index.sqlite"
+
+# Incomplete run_ids re-read per query (below SQLite's bound-parameter limit)
+_MAX_IN_IDS = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS databases (
+    db_path TEXT PRIMARY KEY,
+    file_id TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    db_path TEXT NOT NULL,
+    guid TEXT NOT NULL,
+    run_id INTEGER NOT NULL,
+    metadata TEXT NOT NULL,
+    PRIMARY KEY (db_path, guid)
+);
+"""
+
+
+@dataclass
+class RunMetadata:
+    """Parsed metadata of one run."""
+
+    run_id: int
+    guid: str
+    exp_id: int
+    exp_name: str
+    sample_name: str
+    is_completed: bool
+    # MeasureIt class summary: None without MeasureIt metadata, {} if empty,
+    # otherwise {"class": ...}
+    measureit: Optional[dict] = None
+    setpoints: List[str] = field(default_factory=list)
+    dependents: List[str] = field(default_factory=list)
+    launched_by: Optional[str] = None
+    inner_sweep: Optional[dict] = None
+    outer_sweep: Optional[dict] = None
+    set_param: Optional[dict] = None
+    set_params: Optional[dict] = None
+    follow_params: Optional[dict] = None
+
+
+@dataclass
+class _DatabaseIndex:
+    file_id: Tuple[int, int]
+    runs: Dict[int, RunMetadata] = field(default_factory=dict)
+    # Signature of the database files when the index was last refreshed
+    signature: Optional[Tuple] = None
+
+    def incomplete_run_ids(self) -> List[int]:
+        """Runs indexed while in progress, whose metadata may have changed since."""
+        return sorted(
+            run_id for run_id, run in self.runs.items() if not run.is_completed
+        )
+
+
+class RunIndex:
+    """Per-database index of RunMetadata, refreshed incrementally."""
+
+    def __init__(self, path: Optional[Path] = None, persist: bool = True):
+        """Initialize the index.
+
+        Args:
+            path: Sidecar SQLite file (default ~/.instrmcp/run_index.sqlite)
+            persist: Whether to load and save the sidecar file
+        """
+        self.path = Path(path) if path is not None else DEFAULT_RUN_INDEX_PATH
+        self.persist = persist
+        self._indexes: Dict[str, _DatabaseIndex] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.refreshes = 0
+        self.rebuilds = 0
+        self.parsed_runs = 0
+        self.last_error: Optional[str] = None
+
+    def get_runs(self, database_path: str) -> List[RunMetadata]:
+        """Get the metadata of all runs of a database, ordered by run_id."""
+        key = str(Path(database_path).resolve())
+        with self._lock:
+            signature = _signature(key)
+            index = self._indexes.get(key)
+            if index is None and self.persist:
+                index = self._load(key)
+            if index is not None and signature is not None:
+                if index.signature == signature:
+                    self.hits += 1
+                    return [index.runs[run_id] for run_id in sorted(index.runs)]
+                if index.file_id != signature[:2]:
+                    index = None
+
+            with thread_safe_db_connection(key) as conn:
+                cursor = conn.cursor()
+                if index is not None and not _same_database(cursor, index):
+                    index = None
+                if index is None:
+                    self.rebuilds += 1
+                    index = _DatabaseIndex(
+                        file_id=signature[:2] if signature else (0, 0)
+                    )
+                    replace = True
+                else:
+                    self.refreshes += 1
+                    replace = False
+                updated = self._read_runs(cursor, index)
+
+            index.signature = signature
+            self._indexes[key] = index
+            if self.persist:
+                self._save(key, index, updated, replace)
+            return [index.runs[run_id] for run_id in sorted(index.runs)]
+
+    def _read_runs(
+        self, cursor: sqlite3.Cursor, index: _DatabaseIndex
+    ) -> List[RunMetadata]:
+        """Parse new runs, and runs that were still in progress, into the index.
+
+        Only the incomplete runs themselves are read again, so a run that
+        never got marked completed (e.g. a crashed sweep) does not make every
+        later refresh re-parse all runs recorded after it.
+        """
+        incomplete = index.incomplete_run_ids()
+        queries = [("r.run_id > ?", [max(index.runs, default=0)])]
+        for i in range(0, len(incomplete), _MAX_IN_IDS):
+            ids = incomplete[i : i + _MAX_IN_IDS]
+            queries.append((f"r.run_id IN ({', '.join('?' * len(ids))})", ids))
+
+        updated = []
+        for condition, params in queries:
+            cursor.execute(
+                f"""
+                SELECT r.run_id, r.guid, r.exp_id, r.is_completed,
+                       r.run_description, r.measureit,
+                       e.name as exp_name, e.sample_name
+                FROM runs r
+                JOIN experiments e ON r.exp_id = e.exp_id
+                WHERE {condition}
+                ORDER BY r.run_id
+            """,
+                params,
+            )
+            for row in cursor:
+                run = parse_run(dict(row))
+                index.runs[run.run_id] = run
+                updated.append(run)
+        self.parsed_runs += len(updated)
+        return updated
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=5.0)
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def _load(self, key: str) -> Optional[_DatabaseIndex]:
+        """Load the saved index of a database, if any."""
+        if not self.path.exists():
+            return None
+        try:
+            connection = self._connect()
+            try:
+                return _load_index(connection, key)
+            finally:
+                connection.close()
+        except (sqlite3.Error, ValueError, TypeError) as e:
+            self.last_error = str(e)
+            logger.warning(f"Ignoring run index {self.path}: {e}")
+            return None
+
+    def _save(
+        self,
+        key: str,
+        index: _DatabaseIndex,
+        updated: List[RunMetadata],
+        replace: bool,
+    ):
+        """Save new and changed runs (or the whole index after a rebuild)."""
+        if not updated and not replace:
+            return
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    if replace:
+                        connection.execute("DELETE FROM runs WHERE db_path = ?", (key,))
+                    connection.execute(
+                        "INSERT OR REPLACE INTO databases VALUES (?, ?)",
+                        (key, json.dumps(list(index.file_id))),
+                    )
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?)",
+                        [
+                            (key, run.guid, run.run_id, json.dumps(asdict(run)))
+                            for run in updated
+                        ],
+                    )
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            self.last_error = str(e)
+            logger.warning(f"Could not save run index to {self.path}: {e}")
+
+    def invalidate(self, database_path: Optional[str] = None):
+        """Forget the in-memory index of one database, or of all databases."""
+        with self._lock:
+            if database_path is None:
+                self._indexes.clear()
+            else:
+                self._indexes.pop(str(Path(database_path).resolve()), None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics."""
+        return {
+            "path": str(self.path) if self.persist else None,
+            "databases": len(self._indexes),
+            "hits": self.hits,
+            "refreshes": self.refreshes,
+            "rebuilds": self.rebuilds,
+            "parsed_runs": self.parsed_runs,
+            "last_error": self.last_error,
+        }
+
+
+def parse_run(row: Dict[str, Any]) -> RunMetadata:
+    """Parse a runs row (joined with its experiment) into RunMetadata."""
+    run = RunMetadata(
+        run_id=row["run_id"],
+        guid=row.get("guid") or f"run:{row['run_id']}",
+        exp_id=row["exp_id"],
+        exp_name=row["exp_name"],
+        sample_name=row["sample_name"],
+        is_completed=bool(row.get("is_completed")),
+    )
+
+    # Parse run description for parameters
+    run_desc = row.get("run_description")
+    if run_desc:
+        try:
+            desc_data = json.loads(run_desc)
+            interdeps = desc_data.get("interdependencies", {})
+            paramspecs = interdeps.get("paramspecs", [])
+            for p in paramspecs:
+                if not p.get("depends_on"):
+                    run.setpoints.append(p["name"])
+                else:
+                    run.dependents.append(p["name"])
+        except json.JSONDecodeError:
+            pass
+
+    # Parse MeasureIt metadata
+    measureit = row.get("measureit")
+    if measureit:
+        try:
+            data = json.loads(measureit)
+        except json.JSONDecodeError:
+            data = None
+        if isinstance(data, dict):
+            run.measureit = {"class": data.get("class", "")} if data else {}
+            attrs = data.get("attributes") or {}
+            run.launched_by = attrs.get("launched_by")
+            run.inner_sweep = data.get("inner_sweep")
+            run.outer_sweep = data.get("outer_sweep")
+            run.set_param = data.get("set_param")
+            run.set_params = data.get("set_params")
+            run.follow_params = data.get("follow_params")
+    return run
+
+
+def _load_index(connection: sqlite3.Connection, key: str) -> Optional[_DatabaseIndex]:
+    row = connection.execute(
+        "SELECT file_id FROM databases WHERE db_path = ?", (key,)
+    ).fetchone()
+    if row is None:
+        return None
+    index = _DatabaseIndex(file_id=tuple(json.loads(row[0])))
+    for (metadata,) in connection.execute(
+        "SELECT metadata FROM runs WHERE db_path = ?", (key,)
+    ):
+        run = RunMetadata(**json.loads(metadata))
+        index.runs[run.run_id] = run
+    return index
+
+
+def _signature(path: str) -> Optional[Tuple]:
+    """(st_dev, st_ino, mtime, size) of a database and its WAL file."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    try:
+        wal = os.stat(f"{path}-wal")
+        wal_signature = (wal.st_mtime_ns, wal.st_size)
+    except OSError:
+        wal_signature = None
+    return (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size, wal_signature)
+
+
+def _same_database(cursor: sqlite3.Cursor, index: _DatabaseIndex) -> bool:
+    """Check the highest indexed run still has the same GUID."""
+    if not index.runs:
+        return True
+    last = index.runs[max(index.runs)]
+    cursor.execute("SELECT guid FROM runs WHERE run_id = ?", (last.run_id,))
+    row = cursor.fetchone()
+    return row is not None and (row[0] or f"run:{last.run_id}") == last.guid
+
+
+_run_index = RunIndex()
+
+
+def get_run_index() -> RunIndex:
+    """Get the process-wide run index used by sweep analysis."""
+    return _run_index
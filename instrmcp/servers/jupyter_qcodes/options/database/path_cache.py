@@ -0,0 +1,175 @@
+"""
+Cache of database path resolutions.
+
+Every database tool call resolves its database path, which without an
+explicit path means checking the MeasureIt databases directory, globbing
+the working directory (and, with scan_nested, nested Databases directories)
+and stat-ing every candidate. On network-mounted data directories these
+syscalls dominate tool latency.
+
+PathResolutionCache remembers each resolution by its inputs (database path,
+data directory, working directory, scan_nested, MeasureIt and QCoDeS
+locations) together with the modification time of every directory that was
+searched. A cached path is reused while it still exists and none of those
+directories changed, which costs one stat per directory instead of globs.
+Adding, removing or renaming a database changes its directory's mtime (as
+does SQLite creating a journal or WAL file next to a database being
+written). Entries are re-resolved after max_age_s regardless, which bounds
+staleness for changes directory mtimes do not show, such as a new nested
+Databases directory in a project that had none.
+
+As in git's "racy" index check, a directory modified less than RACY_S
+before it was searched is not trusted: with coarse mtime resolution a
+later change could leave its mtime unchanged.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+# (directory, st_mtime_ns or None if it did not exist) when it was searched
+WatchedDir = Tuple[str, Optional[int]]
+
+# Directories modified this recently before a resolution are not trusted
+RACY_S = 2.0
+
+
+def watch_dir(watched: List[WatchedDir], directory: Path):
+    """Record a directory about to be searched, with its current mtime."""
+    watched.append((str(directory), _mtime_ns(str(directory))))
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@dataclass
+class _Resolution:
+    path: str
+    info: Dict[str, Any]
+    watched: Tuple[WatchedDir, ...]
+    resolved_at: float
+    # Wall clock time of the resolution, compared with directory mtimes
+    resolved_at_ns: int
+
+    def is_valid(self) -> bool:
+        """Check the path still exists and no searched directory changed."""
+        racy_ns = self.resolved_at_ns - int(RACY_S * 1e9)
+        for directory, mtime in self.watched:
+            if mtime is not None and mtime >= racy_ns:
+                return False
+            if _mtime_ns(directory) != mtime:
+                return False
+        return os.path.exists(self.path)
+
+
+class PathResolutionCache:
+    """Resolved database paths keyed by the inputs of the resolution."""
+
+    def __init__(self, max_age_s: float = 60.0, max_entries: int = 64):
+        """Initialize the cache.
+
+        Args:
+            max_age_s: Re-resolve entries older than this, even if unchanged
+            max_entries: Maximum number of resolutions to remember
+        """
+        self.max_age_s = max_age_s
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, _Resolution]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.changed = 0
+        self.expired = 0
+
+    def resolve(
+        self,
+        key: Hashable,
+        resolver: Callable[[List[WatchedDir]], Tuple[str, Dict[str, Any]]],
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Get a cached resolution, or resolve and cache it.
+
+        Args:
+            key: Inputs of the resolution
+            resolver: Resolves the path, recording the directories it
+                searches with watch_dir; may raise FileNotFoundError, in
+                which case nothing is cached
+
+        Returns:
+            (path, resolution_info), where resolution_info["cache"] tells
+            whether the path came from the cache and how old it is
+        """
+        now = time.monotonic()
+        now_ns = time.time_ns()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            age = now - entry.resolved_at
+            if age > self.max_age_s:
+                reason = "expired"
+            elif not entry.is_valid():
+                reason = "changed"
+            else:
+                with self._lock:
+                    self.hits += 1
+                    self._entries.move_to_end(key)
+                return entry.path, self._info(entry, hit=True, age=age)
+            with self._lock:
+                setattr(self, reason, getattr(self, reason) + 1)
+                self._entries.pop(key, None)
+        else:
+            with self._lock:
+                self.misses += 1
+
+        watched: List[WatchedDir] = []
+        path, info = resolver(watched)
+        entry = _Resolution(path, info, tuple(dict.fromkeys(watched)), now, now_ns)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return path, self._info(entry, hit=False, age=0.0)
+
+    def _info(self, entry: _Resolution, hit: bool, age: float) -> Dict[str, Any]:
+        info = dict(entry.info)
+        info["cache"] = {
+            "hit": hit,
+            "age_s": round(age, 3),
+            "max_age_s": self.max_age_s,
+            "watched_dirs": len(entry.watched),
+        }
+        return info
+
+    def clear(self):
+        """Forget all cached resolutions."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get path resolution cache statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "changed": self.changed,
+                "expired": self.expired,
+                "max_age_s": self.max_age_s,
+            }
+
+
+_cache = PathResolutionCache()
+
+
+def get_path_resolution_cache() -> PathResolutionCache:
+    """Get the process-wide cache used by resolve_database_path."""
+    return _cache
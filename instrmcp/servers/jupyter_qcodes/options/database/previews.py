@@ -0,0 +1,459 @@
+"""
+Decimated previews of 1D and 2D runs, computed from the result table.
+
+Shows the shape of a measurement in a few kilobytes instead of loading the
+dataset in the kernel and rendering a plot. The result table is streamed in
+chunks of CHUNK_ROWS rows and reduced with vectorized NumPy:
+
+- 1D (one setpoint): min-max or LTTB decimation of the values in
+  acquisition order, with the setpoint value of each kept point. Min-max
+  keeps the running minimum and maximum of each bucket chunk by chunk, with
+  bucket edges fixed by a row count taken up front. LTTB needs the whole
+  series, so it is limited to runs of at most LTTB_MAX_ROWS points; larger
+  runs fall back to min-max and say so in a warning
+- 2D (two setpoints): block means on a fixed grid of at most
+  ``resolution`` x ``resolution`` cells, accumulated chunk by chunk, so the
+  full grid is never held in memory
+
+Previews of completed runs are immutable and cached per run, parameter,
+resolution and method.
+"""
+
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ...array_utils import _to_json_list, lttb, minmax_decimate
+from .query_tools import (
+    QCODES_AVAILABLE,
+    resolve_database_path,
+    thread_safe_db_connection,
+)
+from .identifiers import quote_identifier
+from .run_data import read_run
+
+# Rows fetched from the result table per chunk
+CHUNK_ROWS = 50000
+
+# Default and maximum points of a 1D preview (cells per axis of a 2D preview)
+DEFAULT_RESOLUTION = 64
+MAX_RESOLUTION = 1000
+MAX_GRID_RESOLUTION = 256
+
+PREVIEW_METHODS = ("minmax", "lttb")
+
+# Largest 1D run LTTB is applied to; it holds the whole series in memory
+LTTB_MAX_ROWS = 1_000_000
+
+
+class PreviewCache:
+    """LRU cache of previews of completed runs."""
+
+    def __init__(self, max_entries: int = 256):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of previews to keep
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        """Get a cached preview, or None."""
+        with self._lock:
+            preview = self._entries.get(key)
+            if preview is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return preview
+
+    def put(self, key: Tuple, preview: Dict[str, Any]):
+        """Cache a preview."""
+        with self._lock:
+            self._entries[key] = preview
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Forget all cached previews."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get preview cache statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+def _paramspecs(run_description: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    """Parameter name -> paramspec of a run."""
+    if not run_description:
+        return {}
+    try:
+        desc = json.loads(run_description)
+        paramspecs = desc.get("interdependencies", {}).get("paramspecs", [])
+        return {p["name"]: p for p in paramspecs}
+    except (json.JSONDecodeError, AttributeError, KeyError, TypeError):
+        return {}
+
+
+def _stream(
+    cursor: sqlite3.Cursor,
+    table: str,
+    columns: List[str],
+    value: str,
+    max_id: Optional[int] = None,
+) -> Iterator[np.ndarray]:
+    """Yield (rows, len(columns)) float arrays of the rows where value is set.
+
+    With max_id, only rows up to that id are read (rows appended to a run in
+    progress after it was counted are left out).
+    """
+    selected = ", ".join(quote_identifier(c) for c in columns)
+    query = (
+        f'SELECT {selected} FROM "{table}" WHERE {quote_identifier(value)} IS NOT NULL'
+    )
+    params: List[Any] = []
+    if max_id is not None:
+        query += " AND id <= ?"
+        params.append(max_id)
+    cursor.execute(query + " ORDER BY id", params)
+    while True:
+        rows = cursor.fetchmany(CHUNK_ROWS)
+        if not rows:
+            return
+        # NULL setpoints become NaN
+        yield np.array(rows, dtype=np.float64).reshape(len(rows), len(columns))
+
+
+def _preview_1d(
+    cursor: sqlite3.Cursor,
+    table: str,
+    setpoint: str,
+    param: str,
+    resolution: int,
+    method: str,
+) -> Dict[str, Any]:
+    """Decimate a 1D run in acquisition order.
+
+    Points are decimated over their acquisition index, so back-and-forth
+    sweeps (where the setpoint is not monotonic) keep their order.
+    """
+    cursor.execute(
+        f'SELECT COUNT(*), MAX(id) FROM "{table}" WHERE {quote_identifier(param)} IS NOT NULL'
+    )
+    total, max_id = cursor.fetchone()
+    chunks = _stream(cursor, table, [setpoint, param], param, max_id)
+
+    warning = None
+    if method == "lttb" and total > LTTB_MAX_ROWS:
+        method = "minmax"
+        warning = (
+            f"LTTB is limited to runs of at most {LTTB_MAX_ROWS} points; "
+            f"this run has {total}, so min-max decimation was used"
+        )
+
+    if total <= resolution or method == "lttb":
+        data = np.concatenate(list(chunks) or [np.empty((0, 2))])
+        x, y = data[:, 0], data[:, 1]
+        index = np.arange(len(y), dtype=np.float64)
+        if method == "lttb":
+            kept, _ = lttb(index, y, resolution)
+        else:
+            kept, _ = minmax_decimate(index, y, resolution)
+        kept = kept.astype(np.int64)
+        finite = y[~np.isnan(y)]
+        value_range = (
+            [finite.min().item(), finite.max().item()] if finite.size else None
+        )
+        x, y = x[kept], y[kept]
+    else:
+        kept, x, y, value_range = _minmax_stream(chunks, total, resolution)
+
+    preview = {
+        "kind": "1d",
+        "method": method,
+        "points_total": int(total),
+        "points": int(len(kept)),
+        "range": value_range,
+        "index": kept.tolist(),
+        "x": _to_json_list(x),
+        "y": _to_json_list(y),
+    }
+    if warning:
+        preview["warning"] = warning
+    return preview
+
+
+def _minmax_stream(
+    chunks: Iterator[np.ndarray], total: int, resolution: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Optional[List[float]]]:
+    """Min-max decimate streamed (setpoint, value) chunks of a total-row series.
+
+    Splits the series into the same equal-count buckets as minmax_decimate
+    and keeps the running minimum and maximum point of each bucket, so only
+    one chunk is held in memory at a time.
+
+    Returns:
+        (index, x, y, range) of the kept points, in acquisition order
+    """
+    size = -(-total // (resolution // 2))
+    buckets = -(-total // size)
+    # Per bucket: acquisition index, setpoint and value of the lowest and
+    # highest point so far; NaN values only win a bucket with nothing else
+    low_index = np.full(buckets, -1, dtype=np.int64)
+    high_index = np.full(buckets, -1, dtype=np.int64)
+    low = np.full(buckets, np.inf)
+    high = np.full(buckets, -np.inf)
+    low_point = np.full((buckets, 2), np.nan)
+    high_point = np.full((buckets, 2), np.nan)
+    value_min, value_max = np.inf, -np.inf
+
+    offset = 0
+    for chunk in chunks:
+        y = chunk[:, 1]
+        y_low = np.where(np.isnan(y), np.inf, y)
+        y_high = np.where(np.isnan(y), -np.inf, y)
+        value_min = min(value_min, y_low.min())
+        value_max = max(value_max, y_high.max())
+
+        end = offset + len(chunk)
+        for bucket in range(offset // size, min(-(-end // size), buckets)):
+            start = max(bucket * size, offset) - offset
+            stop = min((bucket + 1) * size, end) - offset
+            i = start + int(np.argmin(y_low[start:stop]))
+            if low_index[bucket] < 0 or y_low[i] < low[bucket]:
+                low[bucket] = y_low[i]
+                low_index[bucket] = offset + i
+                low_point[bucket] = chunk[i]
+            i = start + int(np.argmax(y_high[start:stop]))
+            if high_index[bucket] < 0 or y_high[i] > high[bucket]:
+                high[bucket] = y_high[i]
+                high_index[bucket] = offset + i
+                high_point[bucket] = chunk[i]
+        offset = end
+
+    seen = low_index >= 0
+    index = np.concatenate([low_index[seen], high_index[seen]])
+    points = np.concatenate([low_point[seen], high_point[seen]])
+    index, first = np.unique(index, return_index=True)
+    points = points[first]
+    value_range = (
+        [float(value_min), float(value_max)] if value_min <= value_max else None
+    )
+    return index, points[:, 0], points[:, 1], value_range
+
+
+def _preview_2d(
+    cursor: sqlite3.Cursor,
+    table: str,
+    setpoints: List[str],
+    param: str,
+    resolution: int,
+) -> Dict[str, Any]:
+    """Block-mean a 2D run onto a grid of at most resolution x resolution cells.
+
+    Rows and columns of the grid that no point falls into are dropped, so a
+    sweep with fewer setpoints than cells keeps one column per setpoint; the
+    coordinates of each row and column are the mean setpoint of its points.
+    """
+    x_name, y_name = setpoints
+    cursor.execute(
+        f"SELECT MIN({quote_identifier(x_name)}), MAX({quote_identifier(x_name)}), "
+        f"MIN({quote_identifier(y_name)}), MAX({quote_identifier(y_name)}) "
+        f'FROM "{table}" WHERE {quote_identifier(param)} IS NOT NULL'
+    )
+    x_min, x_max, y_min, y_max = cursor.fetchone()
+    if x_min is None or y_min is None:
+        return {"kind": "2d", "method": "block_mean", "points_total": 0}
+
+    n = resolution
+    cell_sum = np.zeros(n * n)
+    cell_count = np.zeros(n * n)
+    x_sum, x_count = np.zeros(n), np.zeros(n)
+    y_sum, y_count = np.zeros(n), np.zeros(n)
+    value_min, value_max = np.inf, -np.inf
+    total = 0
+
+    for chunk in _stream(cursor, table, [x_name, y_name, param], param):
+        total += len(chunk)
+        chunk = chunk[~np.isnan(chunk).any(axis=1)]
+        if not len(chunk):
+            continue
+        x, y, z = chunk[:, 0], chunk[:, 1], chunk[:, 2]
+        ix = _bin(x, x_min, x_max, n)
+        iy = _bin(y, y_min, y_max, n)
+        cell = iy * n + ix
+        cell_sum += np.bincount(cell, weights=z, minlength=n * n)
+        cell_count += np.bincount(cell, minlength=n * n)
+        x_sum += np.bincount(ix, weights=x, minlength=n)
+        x_count += np.bincount(ix, minlength=n)
+        y_sum += np.bincount(iy, weights=y, minlength=n)
+        y_count += np.bincount(iy, minlength=n)
+        value_min = min(value_min, z.min())
+        value_max = max(value_max, z.max())
+
+    columns = x_count > 0
+    rows = y_count > 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        grid = (cell_sum / cell_count).reshape(n, n)[np.ix_(rows, columns)]
+    return {
+        "kind": "2d",
+        "method": "block_mean",
+        "points_total": total,
+        "shape": list(grid.shape),
+        "x": _to_json_list(x_sum[columns] / x_count[columns]),
+        "y": _to_json_list(y_sum[rows] / y_count[rows]),
+        "range": [float(value_min), float(value_max)] if grid.size else None,
+        # values[i][j] is the mean at (x[j], y[i]); cells without points are None
+        "values": _to_json_list(grid),
+    }
+
+
+def _bin(values: np.ndarray, low: float, high: float, bins: int) -> np.ndarray:
+    """Index of the equal-width bin over [low, high] of each value."""
+    if high <= low:
+        return np.zeros(len(values), dtype=np.int64)
+    index = ((values - low) * (bins / (high - low))).astype(np.int64)
+    return np.clip(index, 0, bins - 1)
+
+
+def get_run_preview(
+    id: int,
+    database_path: Optional[str] = None,
+    param: Optional[str] = None,
+    resolution: int = DEFAULT_RESOLUTION,
+    method: str = "minmax",
+) -> str:
+    """
+    Get a decimated preview of a 1D or 2D run.
+
+    Args:
+        id: Run ID
+        database_path: Path to database file. If None, uses MeasureIt default or QCodes config.
+        param: Numeric dependent parameter to preview (default: the first one)
+        resolution: Points of a 1D preview, or cells per axis of a 2D preview
+        method: 1D decimation, "minmax" (keeps spikes) or "lttb" (keeps the
+            visual shape); 2D previews always use block means
+
+    Returns:
+        JSON string with the preview and the setpoints it is plotted against
+    """
+    if not QCODES_AVAILABLE:
+        return json.dumps({"error": "QCodes not available"}, indent=2)
+    if method not in PREVIEW_METHODS:
+        return json.dumps(
+            {
+                "error": f"Unknown method '{method}', expected one of "
+                f"{list(PREVIEW_METHODS)}"
+            },
+            indent=2,
+        )
+    if not 2 <= resolution <= MAX_RESOLUTION:
+        return json.dumps(
+            {"error": f"resolution must be between 2 and {MAX_RESOLUTION}"}, indent=2
+        )
+
+    try:
+        resolved_path, _ = resolve_database_path(database_path)
+    except FileNotFoundError as e:
+        return json.dumps(
+            {"error": str(e), "error_type": "database_not_found"}, indent=2
+        )
+
+    try:
+        with thread_safe_db_connection(resolved_path) as conn:
+            cursor = conn.cursor()
+            try:
+                run = read_run(cursor, id)
+            except ValueError as e:
+                return json.dumps({"error": str(e)}, indent=2)
+
+            specs = _paramspecs(run["run_description"])
+            dependents = [
+                name
+                for name, spec in specs.items()
+                if spec.get("depends_on") and spec.get("type", "numeric") == "numeric"
+            ]
+            if param is None:
+                if not dependents:
+                    return json.dumps(
+                        {"error": f"Run {id} has no numeric dependent parameter"},
+                        indent=2,
+                    )
+                param = dependents[0]
+            if param not in dependents:
+                return json.dumps(
+                    {
+                        "error": f"'{param}' is not a numeric dependent parameter "
+                        "(array values can be read with database_get_run_data)",
+                        "available_parameters": dependents,
+                    },
+                    indent=2,
+                )
+            setpoints = list(specs[param]["depends_on"])
+            if len(setpoints) > 2:
+                return json.dumps(
+                    {
+                        "error": f"'{param}' depends on {len(setpoints)} setpoints; "
+                        "previews support 1D and 2D runs"
+                    },
+                    indent=2,
+                )
+
+            completed = bool(run["is_completed"])
+            if len(setpoints) == 2:
+                resolution = min(resolution, MAX_GRID_RESOLUTION)
+            key = (resolved_path, run["guid"], param, resolution, method)
+            preview = get_preview_cache().get(key) if completed else None
+            cached = preview is not None
+            if preview is None:
+                # Plain tuples, for np.array
+                cursor.row_factory = None
+                table = run["result_table_name"]
+                if len(setpoints) == 1:
+                    preview = _preview_1d(
+                        cursor, table, setpoints[0], param, resolution, method
+                    )
+                else:
+                    preview = _preview_2d(cursor, table, setpoints, param, resolution)
+                if completed:
+                    get_preview_cache().put(key, preview)
+
+        result = {
+            "database_path": resolved_path,
+            "run_id": id,
+            "completed": completed,
+            "parameter": param,
+            "setpoints": setpoints,
+            "resolution": resolution,
+            "cached": cached,
+            **preview,
+        }
+        return json.dumps(result, indent=2, default=str)
+
+    except Exception as e:
+        return json.dumps({"error": f"Failed to preview run: {str(e)}"}, indent=2)
+
+
+_cache = PreviewCache()
+
+
+def get_preview_cache() -> PreviewCache:
+    """Get the process-wide cache of run previews."""
+    return _cache
@@ -14,8 +14,6 @@ Thread Safety Fix:
 
 import json
 import os
-import re
-import sqlite3
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
@@ -29,18 +27,28 @@ try:
 except ImportError:
     QCODES_AVAILABLE = False
 
-# Regex pattern for valid SQLite table names (alphanumeric and underscore only)
-_VALID_TABLE_NAME_PATTERN = r"^[a-zA-Z_][a-zA-Z0-9_-]*$"
+from .connection_pool import get_connection_pool
+from .path_cache import WatchedDir, get_path_resolution_cache, watch_dir
+from .result_counts import get_result_count_cache
+from .worker_pool import interruptible
+
+# Experiments with at most this many runs list every run ID (e.g. "1,2,5");
+# larger ones are summarized as a range (e.g. "6-16(11)")
+_CONCISE_RUN_ID_COUNT = 5
 
 
 @contextmanager
 def thread_safe_db_connection(db_path: str):
     """
-    Create a fresh SQLite connection for the current thread.
+    Borrow a read-only SQLite connection for the current thread.
 
     This avoids the "SQLite objects created in a thread can only be used
-    in that same thread" error by creating a new connection each time
-    instead of reusing QCoDeS's cached connections.
+    in that same thread" error by using the server's own connections
+    instead of QCoDeS's cached connections. Connections come from a
+    per-database pool (see connection_pool.py), so schema parsing and
+    connection setup are paid once rather than on every call. When used
+    from a DatabaseWorkerPool call that times out or is cancelled, the
+    connection is interrupted (see worker_pool.py).
 
     This is the canonical thread-safe database connection helper for all
     MCP server database operations. Import this from other modules instead
@@ -53,15 +61,10 @@ def thread_safe_db_connection(db_path: str):
         sqlite3.Connection object with Row factory enabled for dict-like access
     """
     # check_same_thread=False is safe here because:
-    # 1. Each connection is created and closed within the same context manager call
-    # 2. Connections are not shared or cached across threads
-    # 3. This is a read-only operation (no concurrent writes to worry about)
-    conn = sqlite3.connect(db_path, check_same_thread=False)
-    conn.row_factory = sqlite3.Row  # Enable dict-like row access
-    try:
+    # 1. The pool hands each connection to one thread at a time
+    # 2. Connections are opened read-only (mode=ro, PRAGMA query_only)
+    with get_connection_pool().connection(db_path) as conn, interruptible(conn):
         yield conn
-    finally:
-        conn.close()
 
 
 # Backward compatibility alias (deprecated, use thread_safe_db_connection)
@@ -88,27 +91,75 @@ def _query_experiments_direct(db_path: str) -> List[Dict[str, Any]]:
         return [dict(row) for row in cursor.fetchall()]
 
 
-def _query_datasets_for_experiment(db_path: str, exp_id: int) -> List[int]:
+def _count_experiments_direct(db_path: str) -> int:
     """
-    Query run IDs for a specific experiment directly from SQLite.
+    Count the experiments in a database directly from SQLite.
+
+    Args:
+        db_path: Path to the database file
+
+    Returns:
+        Number of experiments
+    """
+    with _thread_safe_db_connection(db_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM experiments").fetchone()[0]
+
+
+def _query_experiments_with_runs(
+    db_path: str,
+    after_exp_id: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Query experiments with aggregated run IDs in a single SQLite query.
+
+    Runs are grouped per experiment, so the result carries the run count,
+    the first and last run ID, and the run IDs themselves only for
+    experiments with few runs (enough for _format_run_ids_concise).
 
     Args:
         db_path: Path to the database file
-        exp_id: Experiment ID
+        after_exp_id: Only return experiments with exp_id greater than this
+        limit: Maximum number of experiments to return (None = all)
 
     Returns:
-        List of run IDs belonging to this experiment
+        List of experiment dictionaries with run_count, first_run_id, last_run_id
+        and run_ids (list, or None if there are more than
+        _CONCISE_RUN_ID_COUNT runs)
     """
     with _thread_safe_db_connection(db_path) as conn:
         cursor = conn.cursor()
         cursor.execute(
-            """
-            SELECT run_id FROM runs WHERE exp_id = ?
-            ORDER BY run_id
+            f"""
+            SELECT e.exp_id, e.name, e.sample_name, e.format_string,
+                   e.start_time, e.end_time,
+                   COUNT(r.run_id) AS run_count,
+                   MIN(r.run_id) AS first_run_id,
+                   MAX(r.run_id) AS last_run_id,
+                   CASE WHEN COUNT(r.run_id) <= {_CONCISE_RUN_ID_COUNT}
+                        THEN group_concat(r.run_id) END AS run_ids
+            FROM experiments e
+            LEFT JOIN runs r ON r.exp_id = e.exp_id
+            WHERE e.exp_id > ?
+            GROUP BY e.exp_id
+            ORDER BY e.exp_id
+            LIMIT ?
         """,
-            (exp_id,),
+            (
+                after_exp_id if after_exp_id is not None else -1,
+                limit if limit is not None else -1,
+            ),
+        )
+        rows = [dict(row) for row in cursor.fetchall()]
+
+    for exp in rows:
+        run_ids = exp["run_ids"]
+        exp["run_ids"] = (
+            sorted(int(r) for r in str(run_ids).split(","))
+            if run_ids is not None
+            else None
         )
-        return [row[0] for row in cursor.fetchall()]
+    return rows
 
 
 def _query_dataset_info_direct(db_path: str, run_id: int) -> Optional[Dict[str, Any]]:
@@ -190,21 +241,16 @@ def _query_dataset_info_direct(db_path: str, run_id: int) -> Optional[Dict[str,
         for param in result["parameters"]:
             param["depends_on"] = deps.get(param["name"], [])
 
-        # Get result count
+        # Get result count (validates the table name against SQL injection)
         result_table = result.get("result_table_name")
         if result_table:
-            try:
-                # Validate table name to prevent SQL injection
-                # Table names come from our DB but could be corrupted
-                if not re.match(_VALID_TABLE_NAME_PATTERN, result_table):
-                    result["number_of_results"] = None
-                else:
-                    # Safe to use - name validated against pattern
-                    # Use double quotes for SQL identifiers (table names)
-                    cursor.execute(f'SELECT COUNT(*) FROM "{result_table}"')
-                    result["number_of_results"] = cursor.fetchone()[0]
-            except Exception:
-                result["number_of_results"] = None
+            result["number_of_results"] = get_result_count_cache().count(
+                cursor,
+                db_path,
+                result_table,
+                run_key=result.get("guid"),
+                completed=bool(result.get("is_completed")),
+            )
 
         return result
 
@@ -346,7 +392,9 @@ def _select_default_database(db_files: list[Path]) -> Optional[Path]:
     return max(db_files, key=_safe_mtime)
 
 
-def _find_nested_databases(base_dir: Path) -> list[Path]:
+def _find_nested_databases(
+    base_dir: Path, watched: Optional[List[WatchedDir]] = None
+) -> list[Path]:
     """
     Find database files under nested Databases/ directories.
 
@@ -359,6 +407,8 @@ def _find_nested_databases(base_dir: Path) -> list[Path]:
 
     Args:
         base_dir: Base directory to search from
+        watched: If given, records base_dir and the directories databases
+            were found in, for the path resolution cache
 
     Returns:
         List of Path objects to .db files found in */Databases/*.db pattern
@@ -370,9 +420,15 @@ def _find_nested_databases(base_dir: Path) -> list[Path]:
             - project/Databases/measurements.db   ✓ matches
     """
     try:
+        if watched is not None:
+            watch_dir(watched, base_dir)
         # Use glob to find databases in */Databases/*.db pattern
         # This includes Databases/Databases/ which may contain user data
         results = list(base_dir.glob("*/Databases/*.db"))
+        if watched is not None:
+            for databases_dir in {result.parent for result in results}:
+                watch_dir(watched, databases_dir.parent)
+                watch_dir(watched, databases_dir)
         return results
     except Exception:
         return []
@@ -425,6 +481,8 @@ def resolve_database_path(
         tuple: (resolved_path, resolution_info)
             resolved_path: Absolute path to database file
             resolution_info: Dict with 'source', 'available_databases', 'tried_path'
+                and 'cache' (whether the path came from the resolution cache
+                and its age, see path_cache.py)
 
     Raises:
         FileNotFoundError: If database path doesn't exist, with helpful suggestions
@@ -442,12 +500,57 @@ def resolve_database_path(
         # Search nested Databases directories
         path, info = resolve_database_path(scan_nested=True)
     """
-    resolution_info = {"source": None, "available_databases": [], "tried_path": None}
-
     # Check for data_dir constraint from environment if not provided
     if data_dir is None:
         data_dir = _get_data_dir_constraint()
 
+    key = _resolution_key(database_path, data_dir, scan_nested)
+    return get_path_resolution_cache().resolve(
+        key,
+        lambda watched: _resolve_database_path(
+            database_path, data_dir, scan_nested, watched
+        ),
+    )
+
+
+def _resolution_key(
+    database_path: Optional[str], data_dir: Optional[Path], scan_nested: bool
+) -> tuple:
+    """Inputs that determine the result of resolve_database_path."""
+    measureit_dir = None
+    qcodes_db = None
+    if not database_path and data_dir is None:
+        try:
+            from measureit import get_path
+
+            measureit_dir = str(get_path("databases"))
+        except Exception:
+            pass
+        if QCODES_AVAILABLE:
+            qcodes_db = str(qc.config.core.db_location)
+    return (
+        database_path,
+        str(data_dir) if data_dir is not None else None,
+        os.getcwd(),
+        scan_nested,
+        measureit_dir,
+        qcodes_db,
+    )
+
+
+def _resolve_database_path(
+    database_path: Optional[str],
+    data_dir: Optional[Path],
+    scan_nested: bool,
+    watched: List[WatchedDir],
+) -> tuple[str, dict]:
+    """Resolve the database path without the cache (see resolve_database_path).
+
+    Every directory searched is recorded in watched, so the cache can tell
+    when the resolution may have changed.
+    """
+    resolution_info = {"source": None, "available_databases": [], "tried_path": None}
+
     # Track if we're in constrained mode
     is_constrained = data_dir is not None
     if is_constrained:
@@ -498,6 +601,7 @@ def resolve_database_path(
     # If constrained to data_dir, only search there - NO environment fallbacks
     if is_constrained:
         # Search for any .db file in data_dir
+        watch_dir(watched, data_dir)
         if data_dir.exists():
             db_files = list(data_dir.glob("*.db"))
             if db_files:
@@ -510,7 +614,7 @@ def resolve_database_path(
                     resolution_info["tried_path"] = str(selected_db)
                     return str(selected_db), resolution_info
             if scan_nested:
-                nested_db_files = _find_nested_databases(data_dir)
+                nested_db_files = _find_nested_databases(data_dir, watched)
                 if nested_db_files:
                     selected_db = _select_default_database(nested_db_files)
                     if selected_db:
@@ -538,6 +642,7 @@ def resolve_database_path(
         default_db = db_dir / "Example_database.db"
         resolution_info["tried_path"] = str(default_db)
 
+        watch_dir(watched, db_dir)
         if default_db.exists():
             resolution_info["source"] = "measureit_default"
             return str(default_db), resolution_info
@@ -552,7 +657,7 @@ def resolve_database_path(
 
             data_root = Path(get_data_dir())
             if data_root.exists():
-                nested_db_files = _find_nested_databases(data_root)
+                nested_db_files = _find_nested_databases(data_root, watched)
                 if nested_db_files:
                     selected_db = _select_default_database(nested_db_files)
                     if selected_db:
@@ -565,6 +670,7 @@ def resolve_database_path(
     # Case 3: Try Jupyter working directory (only if not constrained)
     try:
         cwd = Path(os.getcwd())
+        watch_dir(watched, cwd)
         cwd_db_files = list(cwd.glob("*.db"))
         if cwd_db_files:
             selected_db = _select_default_database(cwd_db_files)
@@ -726,30 +832,48 @@ def _format_run_ids_concise(run_ids: list[int]) -> str:
     if not run_ids:
         return ""
     run_ids_sorted = sorted(run_ids)
-    if len(run_ids_sorted) <= 5:
+    if len(run_ids_sorted) <= _CONCISE_RUN_ID_COUNT:
         return ",".join(str(r) for r in run_ids_sorted)
     return f"{run_ids_sorted[0]}-{run_ids_sorted[-1]}({len(run_ids_sorted)})"
 
 
+def _format_run_range_concise(exp: Dict[str, Any]) -> str:
+    """Format the aggregated run IDs of an experiment like _format_run_ids_concise."""
+    if not exp["run_count"]:
+        return ""
+    if exp["run_ids"] is not None:
+        return _format_run_ids_concise(exp["run_ids"])
+    return f"{exp['first_run_id']}-{exp['last_run_id']}({exp['run_count']})"
+
+
 def list_experiments(
     database_path: Optional[str] = None,
     scan_nested: bool = False,
+    after_exp_id: Optional[int] = None,
+    limit: Optional[int] = None,
 ) -> str:
     """
     List all experiments in the specified QCodes database.
 
     Uses direct SQLite queries to avoid thread-safety issues with QCoDeS
     connection pool (the MCP server runs in a different thread than the
-    Jupyter kernel).
+    Jupyter kernel). Experiments and their run IDs are fetched with a single
+    aggregated query.
 
     Args:
         database_path: Path to database file. If None, uses MeasureIt default or QCodes config.
         scan_nested: If True, also search nested "Databases" directories when
             resolving the default database path.
+        after_exp_id: Pagination cursor; only list experiments with a larger ID.
+        limit: Maximum number of experiments to list (None = all).
 
     Returns:
         JSON string containing experiment information including ID, name,
-        sample_name, start_time, end_time, and run IDs.
+        sample_name, start_time, end_time, and run IDs. experiment_count is
+        the number of experiments in the database; when paging (limit or
+        after_exp_id), page_count is the number listed on this page and, if
+        more experiments follow, next_after_exp_id holds the cursor for the
+        next page.
     """
     if not QCODES_AVAILABLE:
         return json.dumps(
@@ -769,30 +893,44 @@ def list_experiments(
             indent=2,
         )
 
-    try:
-        # Use direct SQLite queries for thread safety
-        exp_rows = _query_experiments_direct(resolved_path)
+    if limit is not None and limit < 1:
+        return json.dumps(
+            {"error": "limit must be at least 1", "experiments": []}, indent=2
+        )
 
+    try:
         result = {
             "database_path": resolved_path,
             "path_resolved_via": resolution_info["source"],
-            "experiment_count": len(exp_rows),
+            "experiment_count": 0,
             "experiments": [],
         }
 
-        for exp in exp_rows:
-            # Get run IDs for this experiment using direct query
-            run_ids = _query_datasets_for_experiment(resolved_path, exp["exp_id"])
-
-            exp_info = {
-                "experiment_id": exp["exp_id"],
-                "name": exp["name"],
-                "sample_name": exp["sample_name"],
-                "start_time": exp.get("start_time"),
-                "end_time": exp.get("end_time"),
-                "run_ids": _format_run_ids_concise(run_ids),
-            }
-            result["experiments"].append(exp_info)
+        # Fetch one extra row to know whether another page follows
+        fetch_limit = limit + 1 if limit is not None else None
+        rows = _query_experiments_with_runs(
+            resolved_path, after_exp_id=after_exp_id, limit=fetch_limit
+        )
+        for exp in rows[:limit]:
+            result["experiments"].append(
+                {
+                    "experiment_id": exp["exp_id"],
+                    "name": exp["name"],
+                    "sample_name": exp["sample_name"],
+                    "start_time": exp.get("start_time"),
+                    "end_time": exp.get("end_time"),
+                    "run_ids": _format_run_range_concise(exp),
+                }
+            )
+        if limit is not None and len(rows) > limit:
+            result["next_after_exp_id"] = result["experiments"][-1]["experiment_id"]
+
+        if limit is None and after_exp_id is None:
+            result["experiment_count"] = len(result["experiments"])
+        else:
+            # experiment_count stays the database total; the page has its own
+            result["experiment_count"] = _count_experiments_direct(resolved_path)
+            result["page_count"] = len(result["experiments"])
 
         return json.dumps(result, indent=2, default=str)
 
@@ -930,7 +1068,8 @@ def get_database_stats(database_path: Optional[str] = None) -> str:
 
     Returns:
         JSON string containing database statistics including path, size,
-        experiment count, dataset count, and last modified time.
+        experiment count, dataset count, last modified time and connection
+        pool metrics.
     """
     if not QCODES_AVAILABLE:
         return json.dumps({"error": "QCodes not available"}, indent=2)
@@ -978,6 +1117,13 @@ def get_database_stats(database_path: Optional[str] = None) -> str:
                 measurement_types = _count_measurement_types(resolved_path)
                 result["measurement_types"] = measurement_types
 
+                result["connection_pool"] = get_connection_pool().get_stats()
+                result["result_counts"] = get_result_count_cache().get_stats()
+                result["path_resolution"] = {
+                    "this_call": resolution_info["cache"],
+                    **get_path_resolution_cache().get_stats(),
+                }
+
             except Exception as e:
                 result["count_error"] = (
                     f"Could not count experiments/datasets: {str(e)}"
@@ -12,7 +12,6 @@ Thread Safety Fix:
 """
 
 import json
-import re
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -28,8 +27,8 @@ except ImportError:
 from .query_tools import (
     thread_safe_db_connection,
     resolve_database_path,
-    _VALID_TABLE_NAME_PATTERN,
 )
+from .result_counts import get_result_count_cache
 
 
 def get_current_database_config(database_path: Optional[str] = None) -> str:
@@ -122,33 +121,49 @@ def get_current_database_config(database_path: Optional[str] = None) -> str:
         )
 
 
-def _get_result_count(cursor, run_id: int) -> Optional[int]:
+def _get_result_count(
+    cursor,
+    run_id: int,
+    db_path: Optional[str] = None,
+    row: Optional[dict] = None,
+) -> Optional[int]:
     """
     Get result count for a run from its result table.
 
+    Counts come from the shared ResultCountCache, which uses MAX(rowid)
+    instead of scanning the table and remembers counts of completed runs.
+
     Args:
         cursor: SQLite cursor from an open connection
         run_id: Run ID to get result count for
+        db_path: Database path the cursor is connected to (cache key)
+        row: Already fetched runs row with result_table_name, guid and
+            is_completed, to skip looking them up
 
     Returns:
         Number of results or None if table doesn't exist/is invalid
     """
-    cursor.execute("SELECT result_table_name FROM runs WHERE run_id = ?", (run_id,))
-    row = cursor.fetchone()
-    if not row or not row[0]:
-        return None
-
-    table_name = row[0]
-    # Validate table name to prevent SQL injection
-    if not re.match(_VALID_TABLE_NAME_PATTERN, table_name):
-        return None
-
-    try:
-        # Use double quotes for SQL identifiers (table names), not single quotes
-        cursor.execute(f'SELECT COUNT(*) FROM "{table_name}"')
-        return cursor.fetchone()[0]
-    except Exception:
-        return None
+    if row is None:
+        cursor.execute(
+            "SELECT result_table_name, guid, is_completed FROM runs WHERE run_id = ?",
+            (run_id,),
+        )
+        found = cursor.fetchone()
+        if not found:
+            return None
+        row = dict(found)
+    if db_path is None:
+        # File of the connection's main database
+        cursor.execute("PRAGMA database_list")
+        db_path = cursor.fetchone()[2]
+
+    return get_result_count_cache().count(
+        cursor,
+        db_path,
+        row.get("result_table_name"),
+        run_key=row.get("guid") or f"run:{run_id}",
+        completed=bool(row.get("is_completed")),
+    )
 
 
 def get_recent_measurements(
@@ -203,7 +218,7 @@ def get_recent_measurements(
                 """
                 SELECT r.run_id, r.captured_run_id, r.exp_id, r.name,
                        r.is_completed, r.run_timestamp, r.measureit,
-                       r.run_description, r.result_table_name,
+                       r.run_description, r.result_table_name, r.guid,
                        e.name as exp_name, e.sample_name
                 FROM runs r
                 JOIN experiments e ON r.exp_id = e.exp_id
@@ -238,7 +253,9 @@ def get_recent_measurements(
                         pass
 
                 # Get result count from result table
-                result_count = _get_result_count(cursor, row_dict["run_id"])
+                result_count = _get_result_count(
+                    cursor, row_dict["run_id"], resolved_path, row_dict
+                )
 
                 dataset_info = {
                     "run_id": row_dict["run_id"],
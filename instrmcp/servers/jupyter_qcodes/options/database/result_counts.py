@@ -0,0 +1,145 @@
+"""
+Row counts of QCoDeS result tables without full table scans.
+
+``SELECT COUNT(*)`` walks the whole result table, which on multi-million-row
+sweeps costs seconds per run. QCoDeS only ever appends to result tables with
+consecutive ``id`` values starting at 1 (its own table length is
+``MAX(id)``), so the count is usually a single B-tree lookup of
+``MAX(rowid)``. ResultCountCache uses that when the table starts at rowid 1,
+remembers the counts of completed (immutable) runs, and counts runs still in
+progress incrementally from the last rowid it has seen.
+"""
+
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from .identifiers import is_valid_table_name
+
+# MIN and MAX are separate queries: SQLite only answers a lone MIN() or MAX()
+# of the rowid with a B-tree lookup, and scans the table for both at once
+_MAX_ROWID_QUERY = 'SELECT MAX(rowid) FROM "{table}"'
+_MIN_ROWID_QUERY = 'SELECT MIN(rowid) FROM "{table}"'
+
+
+def _min_rowid(cursor: sqlite3.Cursor, table_name: str) -> Optional[int]:
+    cursor.execute(_MIN_ROWID_QUERY.format(table=table_name))
+    return cursor.fetchone()[0]
+
+
+@dataclass
+class _CountEntry:
+    count: int
+    # Highest rowid included in the count
+    last_rowid: int
+    completed: bool
+
+
+class ResultCountCache:
+    """Row counts of result tables, keyed by database path and run."""
+
+    def __init__(self, max_entries: int = 10000):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of runs to remember
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], _CountEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.max_rowid_counts = 0
+        self.incremental_counts = 0
+        self.full_counts = 0
+
+    def count(
+        self,
+        cursor: sqlite3.Cursor,
+        db_path: str,
+        table_name: Optional[str],
+        run_key: Optional[str] = None,
+        completed: bool = False,
+    ) -> Optional[int]:
+        """Get the number of rows of a run's result table.
+
+        Args:
+            cursor: SQLite cursor from an open connection to db_path
+            db_path: Database path, part of the cache key
+            table_name: Result table of the run
+            run_key: Identity of the run, preferably its GUID (default: table name)
+            completed: Whether the run is completed, so its count is final
+
+        Returns:
+            Number of rows, or None if the table does not exist or is invalid
+        """
+        if not is_valid_table_name(table_name):
+            return None
+
+        key = (db_path, run_key or table_name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if entry.completed:
+                    self.hits += 1
+                    return entry.count
+
+        try:
+            # Use double quotes for SQL identifiers (table names)
+            cursor.execute(_MAX_ROWID_QUERY.format(table=table_name))
+            max_rowid = cursor.fetchone()[0]
+            if max_rowid is None:
+                count, max_rowid, kind = 0, 0, None
+            elif entry is not None and entry.last_rowid <= max_rowid:
+                cursor.execute(
+                    f'SELECT COUNT(*) FROM "{table_name}" WHERE rowid > ?',
+                    (entry.last_rowid,),
+                )
+                count, kind = entry.count + cursor.fetchone()[0], "incremental"
+            elif _min_rowid(cursor, table_name) == 1:
+                count, kind = max_rowid, "max_rowid"
+            else:
+                cursor.execute(f'SELECT COUNT(*) FROM "{table_name}"')
+                count, kind = cursor.fetchone()[0], "full"
+        except sqlite3.Error:
+            return None
+
+        with self._lock:
+            if kind == "incremental":
+                self.incremental_counts += 1
+            elif kind == "max_rowid":
+                self.max_rowid_counts += 1
+            elif kind == "full":
+                self.full_counts += 1
+            self._entries[key] = _CountEntry(count, max_rowid, completed)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return count
+
+    def clear(self):
+        """Forget all cached counts."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get result count statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "max_rowid_counts": self.max_rowid_counts,
+                "incremental_counts": self.incremental_counts,
+                "full_counts": self.full_counts,
+            }
+
+
+_cache = ResultCountCache()
+
+
+def get_result_count_cache() -> ResultCountCache:
+    """Get the process-wide result count cache used by the database tools."""
+    return _cache
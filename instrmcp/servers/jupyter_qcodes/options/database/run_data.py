@@ -0,0 +1,261 @@
+"""
+Paginated, columnar read access to QCoDeS result tables.
+
+Reads selected parameter columns of a run straight from its result table,
+one page of rows at a time, so data can be inspected without loading the
+dataset in the kernel. Numeric columns become NumPy arrays; array-valued
+(and complex) columns, which QCoDeS stores as .npy blobs, are decoded in
+bulk. Columns are returned through array_utils.encode_value, as compact
+summaries by default.
+"""
+
+import io
+import json
+import sqlite3
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ...array_utils import ARRAY_MODES, INLINE_ARRAY_SIZE, encode_value
+from .query_tools import (
+    QCODES_AVAILABLE,
+    resolve_database_path,
+    thread_safe_db_connection,
+)
+from .identifiers import is_valid_table_name, quote_identifier
+from .result_counts import get_result_count_cache
+
+# Default and maximum number of rows per page
+DEFAULT_ROW_LIMIT = 1000
+MAX_ROW_LIMIT = 100000
+
+_NPY_MAGIC = b"\x93NUMPY"
+
+
+def decode_npy_blobs(blobs: List[bytes]) -> Tuple[np.ndarray, bool]:
+    """Decode a column of .npy blobs (QCoDeS array and complex values).
+
+    The header of every blob is parsed once; blobs sharing one header (same
+    dtype and shape, the usual case within a run) are then decoded with a
+    single np.frombuffer over their joined data, one copy in total. A single
+    blob is returned as a read-only view of the blob, without copying.
+
+    Args:
+        blobs: Non-empty list of .npy encoded arrays
+
+    Returns:
+        (array, ragged): the values stacked to shape (rows, *value_shape),
+        or, if they differ in dtype or shape, all values flattened and
+        concatenated with ragged=True
+
+    Raises:
+        ValueError: If a blob is not a .npy encoded array
+    """
+    headers = [_npy_header(blob) for blob in blobs]
+    header, offset, dtype, shape, fortran = headers[0]
+    if not fortran and all(h[0] == header for h in headers):
+        if len(blobs) == 1:
+            data = np.frombuffer(blobs[0], dtype=dtype, offset=offset)
+        else:
+            data = np.frombuffer(
+                b"".join(memoryview(blob)[offset:] for blob in blobs), dtype=dtype
+            )
+        return data.reshape((len(blobs),) + shape), False
+
+    values = [
+        np.lib.format.read_array(io.BytesIO(blob), allow_pickle=False) for blob in blobs
+    ]
+    if all(v.shape == values[0].shape and v.dtype == values[0].dtype for v in values):
+        return np.stack(values), False
+    return np.concatenate([v.ravel() for v in values]), True
+
+
+def _npy_header(blob: bytes) -> Tuple[bytes, int, np.dtype, tuple, bool]:
+    """Parse a .npy header into (header bytes, data offset, dtype, shape, fortran)."""
+    if not isinstance(blob, bytes) or not blob.startswith(_NPY_MAGIC):
+        raise ValueError("value is not a .npy encoded array")
+    stream = io.BytesIO(blob)
+    version = np.lib.format.read_magic(stream)
+    if version == (1, 0):
+        shape, fortran, dtype = np.lib.format.read_array_header_1_0(stream)
+    else:
+        # 2.0 and 3.0 only differ in header encoding
+        shape, fortran, dtype = np.lib.format.read_array_header_2_0(stream)
+    offset = stream.tell()
+    if dtype.hasobject:
+        raise ValueError("object arrays are not supported")
+    return blob[:offset], offset, dtype, tuple(shape), fortran
+
+
+def _column_types(run_description: Optional[str]) -> Dict[str, str]:
+    """Parameter name -> QCoDeS paramtype ("numeric", "array", "text", "complex")."""
+    if not run_description:
+        return {}
+    try:
+        desc = json.loads(run_description)
+        paramspecs = desc.get("interdependencies", {}).get("paramspecs", [])
+        return {p["name"]: p.get("type", "numeric") for p in paramspecs}
+    except (json.JSONDecodeError, AttributeError, KeyError, TypeError):
+        return {}
+
+
+def read_run(cursor: sqlite3.Cursor, run_id: int) -> sqlite3.Row:
+    """Get the runs row (result table, guid, completion, description) of a run.
+
+    Raises:
+        ValueError: If the run does not exist or has no valid result table
+    """
+    cursor.execute(
+        """
+        SELECT result_table_name, guid, is_completed, run_description
+        FROM runs WHERE run_id = ?
+    """,
+        (run_id,),
+    )
+    run = cursor.fetchone()
+    if run is None:
+        raise ValueError(f"Dataset with run_id={run_id} not found")
+    table = run["result_table_name"]
+    if not is_valid_table_name(table):
+        raise ValueError(f"Run {run_id} has no valid result table")
+    return run
+
+
+def _encode_column(values: List[Any], mode: str, max_points: int) -> Dict[str, Any]:
+    """Encode one page of a column."""
+    present = [v for v in values if v is not None]
+    column: Dict[str, Any] = {"null_count": len(values) - len(present)}
+    if not present:
+        column["values"] = None
+        return column
+
+    if all(isinstance(v, bytes) for v in present):
+        array, ragged = decode_npy_blobs(present)
+        if ragged:
+            column["ragged"] = True
+        if column["null_count"]:
+            # Rows without a value are left out of array columns
+            column["rows_with_values"] = len(present)
+        column["values"] = encode_value(array, mode, max_points)
+    elif all(isinstance(v, (int, float)) for v in present):
+        # None becomes NaN, keeping rows aligned with the other columns
+        array = np.array(values, dtype=np.float64)
+        column["values"] = encode_value(array, mode, max_points)
+    else:
+        column["count"] = len(values)
+        column["values"] = values[:INLINE_ARRAY_SIZE]
+        if len(values) > INLINE_ARRAY_SIZE:
+            column["truncated"] = True
+    return column
+
+
+def get_run_data(
+    id: int,
+    database_path: Optional[str] = None,
+    params: Optional[List[str]] = None,
+    after_row: int = 0,
+    limit: int = DEFAULT_ROW_LIMIT,
+    mode: str = "summary",
+    max_points: int = 200,
+) -> str:
+    """
+    Read one page of a run's result table, column by column.
+
+    Rows are paged by their id in the result table: pass the returned
+    next_after_row as after_row to read the next page.
+
+    Args:
+        id: Run ID
+        database_path: Path to database file. If None, uses MeasureIt default or QCodes config.
+        params: Parameter columns to read (default: all)
+        after_row: Only read rows with a larger result-table id
+        limit: Maximum number of rows to read (at most MAX_ROW_LIMIT)
+        mode: How columns are returned, see array_utils.encode_value
+            ("summary", "preview", "full", "base64" or "npy")
+        max_points: Maximum points of a "preview"
+
+    Returns:
+        JSON string with the run's columns, the selected page of data per
+        column, the row range read and the total number of rows
+    """
+    if not QCODES_AVAILABLE:
+        return json.dumps({"error": "QCodes not available"}, indent=2)
+    if mode not in ARRAY_MODES:
+        return json.dumps(
+            {"error": f"Unknown mode '{mode}', expected one of {list(ARRAY_MODES)}"},
+            indent=2,
+        )
+    if not 1 <= limit <= MAX_ROW_LIMIT:
+        return json.dumps(
+            {"error": f"limit must be between 1 and {MAX_ROW_LIMIT}"}, indent=2
+        )
+
+    try:
+        resolved_path, resolution_info = resolve_database_path(database_path)
+    except FileNotFoundError as e:
+        return json.dumps(
+            {"error": str(e), "error_type": "database_not_found"}, indent=2
+        )
+
+    try:
+        with thread_safe_db_connection(resolved_path) as conn:
+            cursor = conn.cursor()
+            try:
+                run = read_run(cursor, id)
+            except ValueError as e:
+                return json.dumps({"error": str(e)}, indent=2)
+            table = run["result_table_name"]
+
+            types = _column_types(run["run_description"])
+            cursor.execute(f'PRAGMA table_info("{table}")')
+            available = [row[1] for row in cursor.fetchall() if row[1] != "id"]
+            selected = list(params) if params else available
+            unknown = [p for p in selected if p not in available]
+            if unknown:
+                return json.dumps(
+                    {
+                        "error": f"Unknown parameters {unknown}",
+                        "available_parameters": available,
+                    },
+                    indent=2,
+                )
+
+            total = get_result_count_cache().count(
+                cursor,
+                resolved_path,
+                table,
+                run_key=run["guid"],
+                completed=bool(run["is_completed"]),
+            )
+            columns = ", ".join(['"id"'] + [quote_identifier(p) for p in selected])
+            cursor.execute(
+                f'SELECT {columns} FROM "{table}" WHERE id > ? ORDER BY id LIMIT ?',
+                (after_row, limit),
+            )
+            rows = cursor.fetchall()
+
+        result: Dict[str, Any] = {
+            "database_path": resolved_path,
+            "path_resolved_via": resolution_info["source"],
+            "run_id": id,
+            "completed": bool(run["is_completed"]),
+            "parameters": {p: types.get(p, "unknown") for p in available},
+            "total_rows": total,
+            "after_row": after_row,
+            "rows": len(rows),
+            "row_ids": [rows[0][0], rows[-1][0]] if rows else None,
+            "next_after_row": rows[-1][0] if len(rows) == limit else None,
+            "mode": mode,
+            "columns": {},
+        }
+        if rows:
+            columns_data = list(zip(*rows))
+            for name, values in zip(selected, columns_data[1:]):
+                result["columns"][name] = _encode_column(list(values), mode, max_points)
+        else:
+            result["columns"] = {name: {"values": None} for name in selected}
+
+        return json.dumps(result, indent=2, default=str)
+
+    except Exception as e:
+        return json.dumps({"error": f"Failed to read run data: {str(e)}"}, indent=2)
@@ -6,11 +6,13 @@ Registers tools for querying QCodes databases (optional feature).
 
 import json
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from mcp.types import TextContent
 
 from .internal import generate_code_suggestion, analyze_sweep_groups
+from .previews import get_preview_cache
+from .worker_pool import DatabaseQueueFull, DatabaseTimeout, DatabaseWorkerPool
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +26,7 @@ class DatabaseToolRegistrar:
         db_integration,
         tools=None,
         safe_mode=True,
+        workers: Optional[DatabaseWorkerPool] = None,
     ):
         """
         Initialize the database tool registrar.
@@ -33,11 +36,16 @@ class DatabaseToolRegistrar:
             db_integration: Database integration module
             tools: QCodesReadOnlyTools instance (for cell operations in unsafe mode)
             safe_mode: Whether server is in safe mode (read-only)
+            workers: Worker pool running the blocking database calls, so they
+                do not stall the event loop. The server passes its own pool
+                and shuts it down on stop; the default, a new
+                DatabaseWorkerPool, is left to the caller to shut down
         """
         self.mcp = mcp_server
         self.db = db_integration
         self.tools = tools
         self.safe_mode = safe_mode
+        self.workers = workers or DatabaseWorkerPool()
 
     # ===== Concise mode helpers =====
 
@@ -59,8 +67,8 @@ class DatabaseToolRegistrar:
         """Convert full experiments list to concise format.
 
         Concise: database_path, experiments with run_ids summary, and sweep groups.
-        If experiments exceed 10, return only sweep groups with a warning.
-        Preserves error field if present.
+        If experiments exceed 10, return only sweep groups, the page's exp_id
+        range and a warning. Preserves error field and pagination cursor if present.
         """
         experiments = data.get("experiments", [])
         if len(experiments) > 10:
@@ -73,8 +81,15 @@ class DatabaseToolRegistrar:
                 ]
             result["warning"] = (
                 "large number of experiment, truncated. "
-                "See code template and write code to query."
+                "Page through them with limit (at most 10) and after_exp_id, "
+                "or see code template and write code to query."
             )
+            # Cursor information, so the truncated listing can still be paged
+            result["count"] = len(experiments)
+            result["first_exp_id"] = experiments[0].get("experiment_id")
+            result["last_exp_id"] = experiments[-1].get("experiment_id")
+            if "next_after_exp_id" in data:
+                result["next_after_exp_id"] = data["next_after_exp_id"]
             if "error" in data:
                 result["error"] = data["error"]
             return result
@@ -89,6 +104,8 @@ class DatabaseToolRegistrar:
             ],
             "count": len(experiments),
         }
+        if "next_after_exp_id" in data:
+            result["next_after_exp_id"] = data["next_after_exp_id"]
         # Include concise sweep groups: "type: run_ids_summary"
         sweep_groups = data.get("sweep_groups", [])
         if sweep_groups:
@@ -199,6 +216,8 @@ d_{run_id} = ds_{run_id}.get_parameter_data()
         """Register all database tools."""
         self._register_list_experiments()
         self._register_get_dataset_info()
+        self._register_get_run_data()
+        self._register_get_run_preview()
         self._register_get_database_stats()
         self._register_list_available_databases()
 
@@ -217,55 +236,83 @@ d_{run_id} = ds_{run_id}.get_parameter_data()
             database_path: Optional[str] = None,
             detailed: bool = False,
             scan_nested: bool = False,
+            after_exp_id: Optional[int] = None,
+            limit: Optional[int] = None,
         ) -> List[TextContent]:
             # Description loaded from metadata_baseline.yaml
             try:
-                result_str = self.db.list_experiments(
-                    database_path=database_path,
-                    scan_nested=scan_nested,
+                text = await self.workers.run(
+                    self._list_experiments,
+                    database_path,
+                    detailed,
+                    scan_nested,
+                    after_exp_id,
+                    limit,
                 )
-                result = json.loads(result_str)
-
-                # Detect sweep groups (Sweep2D parent, SweepQueue batches)
-                db_path = result.get("database_path")
-                if db_path:
-                    try:
-                        groups = analyze_sweep_groups(db_path)
-                        # Filter to only show multi-run groups
-                        grouped = [
-                            {
-                                "type": g.group_type,
-                                "sweep_type": g.sweep_type.value,
-                                "run_ids": g.run_ids,
-                                "description": g.description,
-                            }
-                            for g in groups
-                            if len(g.run_ids) > 1
-                        ]
-                        if grouped:
-                            result["sweep_groups"] = grouped
-                    except Exception as e:
-                        logger.debug(f"Could not analyze sweep groups: {e}")
-
-                # Apply concise mode filtering
-                if not detailed:
-                    result = self._to_concise_list_experiments(result)
-
-                if "warning" not in result:
-                    # Add hint for data loading code
-                    result["hint"] = (
-                        "For dataset loading code, use database_get_dataset_info "
-                        "with code_suggestion=True. For groups, only one run_id is needed."
-                    )
-
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
+                return [TextContent(type="text", text=text)]
             except Exception as e:
                 logger.error(f"Error in list_experiments: {e}")
-                return [
-                    TextContent(
-                        type="text", text=json.dumps({"error": str(e)}, indent=2)
-                    )
+                return self._error_content(e)
+
+    def _list_experiments(
+        self,
+        database_path: Optional[str],
+        detailed: bool,
+        scan_nested: bool,
+        after_exp_id: Optional[int],
+        limit: Optional[int],
+    ) -> str:
+        """List experiments with sweep groups (blocking; runs on a database worker)."""
+        result_str = self.db.list_experiments(
+            database_path=database_path,
+            scan_nested=scan_nested,
+            after_exp_id=after_exp_id,
+            limit=limit,
+        )
+        result = json.loads(result_str)
+
+        # Detect sweep groups (Sweep2D parent, SweepQueue batches)
+        db_path = result.get("database_path")
+        if db_path:
+            try:
+                groups = analyze_sweep_groups(db_path)
+                # Filter to only show multi-run groups
+                grouped = [
+                    {
+                        "type": g.group_type,
+                        "sweep_type": g.sweep_type.value,
+                        "run_ids": g.run_ids,
+                        "description": g.description,
+                    }
+                    for g in groups
+                    if len(g.run_ids) > 1
                 ]
+                if grouped:
+                    result["sweep_groups"] = grouped
+            except Exception as e:
+                logger.debug(f"Could not analyze sweep groups: {e}")
+
+        # Apply concise mode filtering
+        if not detailed:
+            result = self._to_concise_list_experiments(result)
+
+        if "warning" not in result:
+            # Add hint for data loading code
+            result["hint"] = (
+                "For dataset loading code, use database_get_dataset_info "
+                "with code_suggestion=True. For groups, only one run_id is needed."
+            )
+
+        return json.dumps(result, indent=2)
+
+    def _error_content(self, error: Exception) -> List[TextContent]:
+        """Format a tool error, flagging database worker timeouts and overload."""
+        payload = {"error": str(error)}
+        if isinstance(error, DatabaseTimeout):
+            payload["error_type"] = "timeout"
+        elif isinstance(error, DatabaseQueueFull):
+            payload["error_type"] = "busy"
+        return [TextContent(type="text", text=json.dumps(payload, indent=2))]
 
     def _register_get_dataset_info(self):
         """Register the database/get_dataset_info tool."""
@@ -286,19 +333,15 @@ d_{run_id} = ds_{run_id}.get_parameter_data()
         ) -> List[TextContent]:
             # Description loaded from metadata_baseline.yaml
             try:
-                result_str = self.db.get_dataset_info(
-                    id=id, database_path=database_path
+                result, code = await self.workers.run(
+                    self._get_dataset_info, id, database_path, code_suggestion
                 )
-                result = json.loads(result_str)
 
                 # If dataset not found, return error immediately without code generation
                 if "error" in result:
                     return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
-                # Generate code suggestion if requested
-                if code_suggestion:
-                    code = self._generate_code_suggestion(result)
-
+                if code is not None:
                     # In unsafe mode with tools available: auto-execute
                     if not self.safe_mode and self.tools is not None:
                         exec_result = await self._auto_execute_code(code)
@@ -319,14 +362,22 @@ d_{run_id} = ds_{run_id}.get_parameter_data()
                     if not detailed:
                         result = self._to_concise_dataset_info(result)
 
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
+                text = await self.workers.run(json.dumps, result, indent=2)
+                return [TextContent(type="text", text=text)]
             except Exception as e:
                 logger.error(f"Error in database/get_dataset_info: {e}")
-                return [
-                    TextContent(
-                        type="text", text=json.dumps({"error": str(e)}, indent=2)
-                    )
-                ]
+                return self._error_content(e)
+
+    def _get_dataset_info(
+        self, id: int, database_path: Optional[str], code_suggestion: bool
+    ) -> Tuple[dict, Optional[str]]:
+        """Get dataset info and code suggestion (blocking; runs on a database worker)."""
+        result = json.loads(
+            self.db.get_dataset_info(id=id, database_path=database_path)
+        )
+        if "error" in result or not code_suggestion:
+            return result, None
+        return result, self._generate_code_suggestion(result)
 
     async def _auto_execute_code(self, code: str) -> dict:
         # Description loaded from metadata_baseline.yaml
@@ -429,6 +480,76 @@ d_{run_id} = ds_{run_id}.get_parameter_data()
 
         return "\n".join(text_parts)
 
+    def _register_get_run_data(self):
+        """Register the database/get_run_data tool."""
+
+        @self.mcp.tool(
+            name="database_get_run_data",
+            annotations={
+                "readOnlyHint": True,
+                "idempotentHint": True,
+                "openWorldHint": False,
+            },
+        )
+        async def get_run_data(
+            id: int,
+            database_path: Optional[str] = None,
+            params: Optional[List[str]] = None,
+            after_row: int = 0,
+            limit: int = 1000,
+            mode: str = "summary",
+            max_points: int = 200,
+        ) -> List[TextContent]:
+            # Description loaded from metadata_baseline.yaml
+            try:
+                text = await self.workers.run(
+                    self.db.get_run_data,
+                    id=id,
+                    database_path=database_path,
+                    params=params,
+                    after_row=after_row,
+                    limit=limit,
+                    mode=mode,
+                    max_points=max_points,
+                )
+                return [TextContent(type="text", text=text)]
+            except Exception as e:
+                logger.error(f"Error in database/get_run_data: {e}")
+                return self._error_content(e)
+
+    def _register_get_run_preview(self):
+        """Register the database/get_run_preview tool."""
+
+        @self.mcp.tool(
+            name="database_get_run_preview",
+            annotations={
+                "readOnlyHint": True,
+                "idempotentHint": True,
+                "openWorldHint": False,
+            },
+        )
+        async def get_run_preview(
+            id: int,
+            database_path: Optional[str] = None,
+            param: Optional[str] = None,
+            resolution: int = 64,
+            method: str = "minmax",
+        ) -> List[TextContent]:
+            # Description loaded from metadata_baseline.yaml
+            try:
+                text = await self.workers.run(
+                    self.db.get_run_preview,
+                    id=id,
+                    database_path=database_path,
+                    param=param,
+                    resolution=resolution,
+                    method=method,
+                )
+                return [TextContent(type="text", text=text)]
+            except Exception as e:
+                logger.error(f"Error in database/get_run_preview: {e}")
+                return self._error_content(e)
+
     def _register_get_database_stats(self):
         """Register the database/get_database_stats tool."""
 
@@ -446,15 +567,18 @@ d_{run_id} = ds_{run_id}.get_parameter_data()
         ) -> List[TextContent]:
             # Description loaded from metadata_baseline.yaml
             try:
-                result = self.db.get_database_stats(database_path=database_path)
+                result = await self.workers.run(
+                    self.db.get_database_stats, database_path=database_path
+                )
+                if detailed:
+                    stats = json.loads(result)
+                    stats["database_workers"] = self.workers.get_stats()
+                    stats["previews"] = get_preview_cache().get_stats()
+                    result = json.dumps(stats, indent=2)
                 return [TextContent(type="text", text=result)]
             except Exception as e:
                 logger.error(f"Error in database/get_database_stats: {e}")
-                return [
-                    TextContent(
-                        type="text", text=json.dumps({"error": str(e)}, indent=2)
-                    )
-                ]
+                return self._error_content(e)
 
     def _register_list_available_databases(self):
         """Register the database_list_all_available_db tool."""
@@ -473,18 +597,21 @@ d_{run_id} = ds_{run_id}.get_parameter_data()
         ) -> List[TextContent]:
             # Description loaded from metadata_baseline.yaml
             try:
-                result_str = self.db.list_available_databases(scan_nested=scan_nested)
-                result = json.loads(result_str)
-
-                # Apply concise mode filtering
-                if not detailed:
-                    result = self._to_concise_list_available(result)
-
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
+                text = await self.workers.run(
+                    self._list_available_databases, scan_nested, detailed
+                )
+                return [TextContent(type="text", text=text)]
             except Exception as e:
                 logger.error(f"Error in database_list_all_available_db: {e}")
-                return [
-                    TextContent(
-                        type="text", text=json.dumps({"error": str(e)}, indent=2)
-                    )
-                ]
+                return self._error_content(e)
+
+    def _list_available_databases(self, scan_nested: bool, detailed: bool) -> str:
+        """List available databases (blocking; runs on a database worker)."""
+        result_str = self.db.list_available_databases(scan_nested=scan_nested)
+        result = json.loads(result_str)
+
+        # Apply concise mode filtering
+        if not detailed:
+            result = self._to_concise_list_available(result)
+
+        return json.dumps(result, indent=2)
@@ -0,0 +1,247 @@
+"""
+Bounded worker pool for database tool calls.
+
+Database tools do blocking SQLite I/O and JSON work; run directly in their
+async handlers they would stall the server's event loop, and with it every
+other tool. DatabaseWorkerPool runs them on a small dedicated executor with
+a bounded queue and a deadline per call.
+
+A call that times out or is cancelled is abandoned by its caller. If it is
+still running, the SQLite connections it borrowed through
+thread_safe_db_connection are interrupted, and any later connection request
+of the abandoned call fails, so the worker is freed quickly.
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional, Set
+
+
+class DatabaseQueueFull(RuntimeError):
+    """Raised when the database workers already have too many pending calls."""
+
+
+class DatabaseTimeout(asyncio.TimeoutError):
+    """Raised when a database call exceeds its deadline."""
+
+
+@dataclass
+class _Call:
+    """State shared between a worker thread and the caller of one call."""
+
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    cancelled: bool = False
+    connections: Set[sqlite3.Connection] = field(default_factory=set)
+
+    def cancel(self):
+        with self.lock:
+            self.cancelled = True
+            connections = list(self.connections)
+        for connection in connections:
+            connection.interrupt()
+
+
+# The call running on the current worker thread, if any
+_current = threading.local()
+
+
+@contextmanager
+def interruptible(connection: sqlite3.Connection) -> Iterator[None]:
+    """Let the worker pool interrupt a connection if its call is abandoned.
+
+    Outside of a worker pool call this does nothing.
+
+    Raises:
+        sqlite3.OperationalError: If the current call was already abandoned
+    """
+    call: Optional[_Call] = getattr(_current, "call", None)
+    if call is None:
+        yield
+        return
+    with call.lock:
+        if call.cancelled:
+            raise sqlite3.OperationalError("interrupted: database call was abandoned")
+        call.connections.add(connection)
+    try:
+        yield
+    finally:
+        with call.lock:
+            call.connections.discard(connection)
+
+
+class DatabaseWorkerPool:
+    """Runs blocking database work on a bounded executor, with deadlines.
+
+    At most ``max_pending`` calls may wait or run at once; beyond that
+    ``run`` fails fast with DatabaseQueueFull instead of queueing
+    indefinitely behind slow queries.
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        max_pending: int = 32,
+        timeout_s: Optional[float] = 30.0,
+    ):
+        """Initialize the pool.
+
+        Args:
+            workers: Worker threads
+            max_pending: Maximum queued plus running calls
+            timeout_s: Default deadline per call (None = no deadline)
+        """
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout_s = timeout_s
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Counters are updated from worker threads
+        self.lock = threading.Lock()
+
+        self.queued = 0
+        self.running = 0
+        self.max_queued = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.cancelled = 0
+        self.total_run_s = 0.0
+        self.max_run_s = 0.0
+        self.total_wait_s = 0.0
+        self.max_wait_s = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="instrmcp-db"
+            )
+        return self._executor
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        *args,
+        timeout_s: Optional[float] = None,
+        **kwargs,
+    ) -> Any:
+        """Run a blocking call on a database worker, with a deadline.
+
+        Args:
+            func: Blocking callable
+            *args, **kwargs: Arguments for func
+            timeout_s: Deadline for this call (default: the pool's timeout_s)
+
+        Returns:
+            The result of func
+
+        Raises:
+            DatabaseTimeout: If the call exceeds its deadline
+            DatabaseQueueFull: If max_pending calls are already waiting or running
+        """
+        timeout = timeout_s if timeout_s is not None else self.timeout_s
+        with self.lock:
+            if self.queued + self.running >= self.max_pending:
+                self.rejected += 1
+                raise DatabaseQueueFull(
+                    f"Database worker queue is full ({self.max_pending} pending "
+                    "calls); try again later"
+                )
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+
+        call = _Call()
+        submitted = time.monotonic()
+        # Whether worker() started, or the caller gave up while it was queued
+        state = {"started": False, "abandoned": False}
+
+        def worker():
+            start = time.monotonic()
+            with self.lock:
+                state["started"] = True
+                if not state["abandoned"]:
+                    self.queued -= 1
+                self.running += 1
+                self.total_wait_s += start - submitted
+                self.max_wait_s = max(self.max_wait_s, start - submitted)
+            _current.call = call
+            ok = False
+            try:
+                if call.cancelled:
+                    raise sqlite3.OperationalError(
+                        "interrupted: database call was abandoned"
+                    )
+                result = func(*args, **kwargs)
+                ok = True
+                return result
+            finally:
+                _current.call = None
+                elapsed = time.monotonic() - start
+                with self.lock:
+                    self.running -= 1
+                    self.total_run_s += elapsed
+                    self.max_run_s = max(self.max_run_s, elapsed)
+                    if ok:
+                        self.completed += 1
+                    else:
+                        self.failed += 1
+
+        def abandon(counter: str):
+            call.cancel()
+            with self.lock:
+                setattr(self, counter, getattr(self, counter) + 1)
+                if not state["started"]:
+                    state["abandoned"] = True
+                    self.queued -= 1
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._get_executor(), worker)
+        try:
+            # asyncio.wait (not wait_for) so a TimeoutError raised by the call
+            # itself is not mistaken for the deadline expiring
+            done, _ = await asyncio.wait({future}, timeout=timeout)
+        except asyncio.CancelledError:
+            future.cancel()
+            abandon("cancelled")
+            raise
+        if not done:
+            future.cancel()
+            abandon("timed_out")
+            raise DatabaseTimeout(f"Database call exceeded its {timeout}s deadline")
+        return future.result()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth and latency statistics."""
+        with self.lock:
+            finished = self.completed + self.failed
+            started = finished + self.running
+            return {
+                "workers": self.workers,
+                "timeout_s": self.timeout_s,
+                "queued": self.queued,
+                "running": self.running,
+                "max_queued": self.max_queued,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+                "cancelled": self.cancelled,
+                "mean_run_ms": (
+                    self.total_run_s / finished * 1000 if finished else None
+                ),
+                "max_run_ms": self.max_run_s * 1000,
+                "mean_wait_ms": (
+                    self.total_wait_s / started * 1000 if started else None
+                ),
+                "max_wait_ms": self.max_wait_s * 1000,
+            }
+
+    def shutdown(self):
+        """Stop the executor without waiting for running calls."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,240 @@
+"""
+Versioned cache of structural QCoDeS snapshots.
+
+A snapshot without parameter values only changes when an instrument's
+structure or metadata changes, yet capturing and serializing it is the bulk
+of a station snapshot. SnapshotStore keeps the last structural snapshot of
+each instrument with the version at which it last changed, so clients can
+ask for what changed since a version they already hold, and select subtrees
+with simple JSONPath-style paths.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import time
+import weakref
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Any, Dict, List, Optional, Tuple
+
+from .cache import structure_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Store key of the station-level parts (parameters, components, config).
+# Not a valid Python identifier, so no instrument can use it.
+STATION_PART = "<station>"
+
+# One path segment: [index], [*], ['quoted key'], or a plain (glob) key
+_SEGMENT = re.compile(
+    r"""\.?(?:\[(?P<index>\d+|\*)\]"""
+    r"""|\[(?:'(?P<single>[^']*)'|"(?P<double>[^"]*)")\]"""
+    r"""|(?P<key>[^.\[\]]+))"""
+)
+_PLAIN_KEY = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+@dataclass
+class SnapshotEntry:
+    """Structural snapshot of one instrument (or of the station-level parts)."""
+
+    snapshot: Dict[str, Any]
+    digest: str
+    # Store version at which the content last changed
+    version: int
+    captured_at: float
+    # weakref.ref to the instrument and its structure fingerprint at capture
+    instrument_ref: Any = None
+    fingerprint: Optional[Tuple[int, Tuple[str, ...]]] = None
+
+
+class SnapshotStore:
+    """Structural snapshots keyed by instrument name, with change versions.
+
+    The store version increases whenever a stored snapshot's content changes,
+    an instrument joins the station view or an instrument leaves it. A cached
+    instrument snapshot stays valid while the name is bound to the same
+    instrument object and its structure fingerprint is unchanged.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self.entries: Dict[str, SnapshotEntry] = {}
+        # Instruments in the last station view -> version at which they joined
+        self.members: Dict[str, int] = {}
+        # Instruments that left the station view -> version at which they left
+        self.removed: Dict[str, int] = {}
+        self.hits = 0
+        self.captures = 0
+
+    def get(self, name: str, instrument: Any) -> Optional[SnapshotEntry]:
+        """Get the cached snapshot of an instrument if it is still valid."""
+        entry = self.entries.get(name)
+        if entry is None:
+            return None
+        if (
+            entry.instrument_ref is None
+            or entry.instrument_ref() is not instrument
+            or entry.fingerprint != structure_fingerprint(instrument)
+        ):
+            return None
+        self.hits += 1
+        return entry
+
+    def peek(self, name: str) -> Optional[SnapshotEntry]:
+        """Get the last stored snapshot of an instrument, even if outdated."""
+        return self.entries.get(name)
+
+    def store(
+        self, name: str, snapshot: Dict[str, Any], instrument: Any = None
+    ) -> SnapshotEntry:
+        """Store a freshly captured snapshot, bumping the version if it changed."""
+        digest = _digest(snapshot)
+        previous = self.entries.get(name)
+        if previous is not None and previous.digest == digest:
+            version = previous.version
+        else:
+            self.version += 1
+            version = self.version
+
+        entry = SnapshotEntry(
+            snapshot=snapshot,
+            digest=digest,
+            version=version,
+            captured_at=time.time(),
+            instrument_ref=weakref.ref(instrument) if instrument is not None else None,
+            fingerprint=(
+                structure_fingerprint(instrument) if instrument is not None else None
+            ),
+        )
+        self.entries[name] = entry
+        self.captures += 1
+        return entry
+
+    def set_members(self, names: List[str]):
+        """Record the instruments of the current station view."""
+        current = set(names)
+        joined = [name for name in names if name not in self.members]
+        left = [name for name in self.members if name not in current]
+        if not joined and not left:
+            return
+
+        self.version += 1
+        for name in joined:
+            self.members[name] = self.version
+            self.removed.pop(name, None)
+        for name in left:
+            del self.members[name]
+            self.removed[name] = self.version
+
+    def changes_since(self, version: int) -> Tuple[List[str], List[str]]:
+        """Get station members changed and instruments removed after a version."""
+        changed = []
+        for name, joined in self.members.items():
+            # Members that were never captured have nothing to report yet
+            entry = self.entries.get(name)
+            if entry is not None and max(joined, entry.version) > version:
+                changed.append(name)
+        removed = [name for name, left in self.removed.items() if left > version]
+        return changed, removed
+
+    def invalidate(self, name: Optional[str] = None):
+        """Drop the cached snapshot of one instrument, or of all instruments."""
+        if name is None:
+            self.entries.clear()
+        else:
+            self.entries.pop(name, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get snapshot cache statistics."""
+        return {
+            "version": self.version,
+            "entries": len(self.entries),
+            "members": len(self.members),
+            "hits": self.hits,
+            "captures": self.captures,
+        }
+
+
+def _digest(snapshot: Dict[str, Any]) -> str:
+    """Content digest of a snapshot."""
+    encoded = json.dumps(snapshot, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def parse_path(path: str) -> List[Tuple[str, Any]]:
+    """Parse a JSONPath-style path into (kind, value) segments.
+
+    Supports ``$`` as the root, dotted keys, ``['quoted.keys']``, list indices
+    ``[0]`` and ``*`` / glob keys such as ``ch0*``.
+
+    Raises:
+        ValueError: If the path cannot be parsed
+    """
+    text = path.strip()
+    if text.startswith("$"):
+        text = text[1:]
+
+    segments: List[Tuple[str, Any]] = []
+    position = 0
+    while position < len(text):
+        match = _SEGMENT.match(text, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"Invalid path '{path}' at position {position + 1}")
+        index, key = match.group("index"), match.group("key")
+        quoted = match.group("single")
+        if quoted is None:
+            quoted = match.group("double")
+        if index is not None:
+            segments.append(("glob", "*") if index == "*" else ("index", int(index)))
+        elif quoted is not None:
+            segments.append(("key", quoted))
+        elif any(c in key for c in "*?["):
+            segments.append(("glob", key))
+        else:
+            segments.append(("key", key))
+        position = match.end()
+    return segments
+
+
+def select_path(tree: Any, path: str) -> Dict[str, Any]:
+    """Select the subtrees of a snapshot matching a JSONPath-style path.
+
+    Args:
+        tree: Snapshot (nested dicts and lists)
+        path: Path such as "$.instruments.dac.submodules.ch0*.parameters"
+
+    Returns:
+        Dict mapping each concrete matching path to its subtree
+
+    Raises:
+        ValueError: If the path cannot be parsed
+    """
+    nodes = [("$", tree)]
+    for kind, value in parse_path(path):
+        selected = []
+        for prefix, node in nodes:
+            if isinstance(node, dict):
+                if kind == "glob":
+                    keys = [k for k in node if fnmatchcase(str(k), value)]
+                else:
+                    keys = [str(value)] if str(value) in node else []
+                selected.extend((_join(prefix, k), node[k]) for k in keys)
+            elif isinstance(node, list):
+                if kind == "glob" and value == "*":
+                    positions = range(len(node))
+                elif kind == "index" or (kind == "key" and value.isdigit()):
+                    positions = [int(value)] if int(value) < len(node) else []
+                else:
+                    positions = []
+                selected.extend((f"{prefix}[{i}]", node[i]) for i in positions)
+        nodes = selected
+    return dict(nodes)
+
+
+def _join(prefix: str, key: str) -> str:
+    if _PLAIN_KEY.match(key):
+        return f"{prefix}.{key}"
+    return f"{prefix}['{key}']"
@@ -16,7 +16,11 @@ import time
 import logging
 from typing import Callable, Coroutine, Dict, List, Any, Optional, Union
 
+from instrmcp.utils.instrument_policy import load_policies
 from .cache import ReadCache, RateLimiter, ParameterPoller
+from .history import ParameterHistory
+from .instrument_io import InstrumentIO
+from .warm_start import WarmStartStore
 from .backend.base import SharedState
 from .backend.qcodes import QCodesBackend
 from .backend.notebook import NotebookBackend
@@ -44,9 +48,15 @@ class QCodesReadOnlyTools:
         self.min_interval_s = min_interval_s
 
         # Initialize caching and rate limiting
-        self.cache = ReadCache()
+        self.history = ParameterHistory()
+        self.cache = ReadCache(history=self.history)
         self.rate_limiter = RateLimiter(min_interval_s)
-        self.poller = ParameterPoller(self.cache, self.rate_limiter)
+        self.instrument_io = InstrumentIO()
+        self.warm_start: Optional[WarmStartStore] = None
+        self._apply_instrument_policies()
+        self.poller = ParameterPoller(
+            self.cache, self.rate_limiter, instrument_io=self.instrument_io
+        )
 
         # Initialize current cell capture state
         self.current_cell_content = None
@@ -61,6 +71,8 @@ class QCodesReadOnlyTools:
             rate_limiter=self.rate_limiter,
             poller=self.poller,
             min_interval_s=min_interval_s,
+            instrument_io=self.instrument_io,
+            warm_start=self.warm_start,
         )
 
         # Initialize backends
@@ -85,6 +97,44 @@ class QCodesReadOnlyTools:
 
         logger.debug("QCoDesReadOnlyTools initialized with backend delegation")
 
+    def _apply_instrument_policies(self):
+        """Apply instrument policies and persistence from ~/.instrmcp/instruments.yaml."""
+        try:
+            config = load_policies()
+        except (ImportError, ValueError) as e:
+            logger.warning(f"Ignoring instrument policies: {e}")
+            return
+
+        # Rates and bursts left out of an entry are inherited, so only an
+        # explicit rate_hz: null lifts the limit
+        limiter = self.rate_limiter
+        if config.defaults is not None:
+            limiter.set_default_policy(
+                *config.defaults.rate_and_burst(
+                    limiter.default_rate_hz, limiter.default_burst
+                )
+            )
+        for name, policy in config.instruments.items():
+            if policy.sets_rate():
+                limiter.set_policy(
+                    name,
+                    *policy.rate_and_burst(
+                        limiter.default_rate_hz, limiter.default_burst
+                    ),
+                )
+            if policy.bus is not None:
+                self.instrument_io.assign(name, policy.bus)
+            if policy.read_timeout_s is not None:
+                self.instrument_io.set_timeout(name, policy.read_timeout_s)
+
+        persistence = config.persistence
+        if persistence.enabled:
+            self.warm_start = WarmStartStore(
+                persistence.path,
+                persistence.max_value_age_s,
+                persistence.save_interval_s,
+            )
+
     def _capture_current_cell(self, info):
         """Capture the current cell content before execution.
 
@@ -132,6 +182,12 @@ class QCodesReadOnlyTools:
 
         logger.debug("Kernel marked idle (post_run_cell)")
 
+        # Pick up instruments created or removed by the cell
+        try:
+            self._qcodes.sync_instruments()
+        except Exception as e:
+            logger.debug(f"Instrument discovery sync failed: {e}")
+
     @property
     def measureit_backend(self):
         """Lazy-load MeasureIt backend when first accessed."""
@@ -173,9 +229,48 @@ class QCodesReadOnlyTools:
         """Get parameter values - supports both single parameter and batch queries."""
         return await self._qcodes.get_parameter_values(queries)
 
-    async def get_station_snapshot(self) -> Dict[str, Any]:
-        """Get full station snapshot without parameter values."""
-        return await self._qcodes.get_station_snapshot()
+    async def get_station_snapshot(
+        self,
+        since_version: Optional[int] = None,
+        path: Optional[str] = None,
+        refresh: bool = False,
+        timeout_s: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Get the versioned station snapshot without parameter values."""
+        return await self._qcodes.get_station_snapshot(
+            since_version, path, refresh, timeout_s
+        )
+
+    async def subscribe_parameter(
+        self, instrument_name: str, parameter_name: str, interval_s: float = 1.0
+    ) -> Dict[str, Any]:
+        """Poll a parameter in the background to keep its cached value warm."""
+        return await self._qcodes.subscribe_parameter(
+            instrument_name, parameter_name, interval_s
+        )
+
+    async def unsubscribe_parameter(
+        self, instrument_name: str, parameter_name: str
+    ) -> Dict[str, Any]:
+        """Stop polling a parameter."""
+        return await self._qcodes.unsubscribe_parameter(instrument_name, parameter_name)
+
+    async def get_parameter_history(
+        self,
+        instrument_name: str,
+        parameter_name: str,
+        window_s: Optional[float] = None,
+        method: str = "stats",
+        max_points: int = 200,
+    ) -> Dict[str, Any]:
+        """Summarize recorded reads of a parameter without touching hardware."""
+        return await self._qcodes.get_parameter_history(
+            instrument_name, parameter_name, window_s, method, max_points
+        )
+
+    async def list_subscriptions(self) -> Dict[str, Any]:
+        """List polled parameters with poller and cache statistics."""
+        return await self._qcodes.list_subscriptions()
 
     async def cleanup(self):
         """Clean up resources."""
@@ -325,11 +420,15 @@ class QCodesReadOnlyTools:
         )
 
     async def _get_single_parameter_value(
-        self, instrument_name: str, parameter_name: str, fresh: bool = False
+        self,
+        instrument_name: str,
+        parameter_name: str,
+        fresh: bool = False,
+        max_age_s: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Get a single parameter value with caching (internal method)."""
         return await self._qcodes._get_single_parameter_value(
-            instrument_name, parameter_name, fresh
+            instrument_name, parameter_name, fresh, max_age_s
         )
 
     def _make_cache_key(self, instrument_name: str, parameter_path: str) -> tuple:
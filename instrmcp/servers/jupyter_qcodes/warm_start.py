@@ -0,0 +1,234 @@
+"""
+Warm-start persistence of the QCoDeS read path across kernel restarts.
+
+Optionally saves the last known parameter values, the per-instrument
+parameter index and the background subscriptions to a SQLite file under
+``~/.instrmcp``, so a restarted server can serve cached values and resume
+polling without rediscovering every instrument. Saved state of an instrument
+is only restored once an object of the same class and structure is bound to
+the same name in the namespace (see QCodesBackend._restore_warm_start).
+"""
+
+import json
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Default location of the warm-start file
+DEFAULT_WARM_START_PATH = Path.home() / ".instrmcp" / "warm_start.sqlite"
+
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS instruments (
+    name TEXT PRIMARY KEY,
+    class_name TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    max_depth INTEGER,
+    paths TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS parameter_values (
+    instrument TEXT NOT NULL,
+    parameter TEXT NOT NULL,
+    value TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    PRIMARY KEY (instrument, parameter)
+);
+CREATE TABLE IF NOT EXISTS subscriptions (
+    instrument TEXT NOT NULL,
+    parameter TEXT NOT NULL,
+    interval_s REAL NOT NULL,
+    PRIMARY KEY (instrument, parameter)
+);
+"""
+
+
+@dataclass
+class InstrumentState:
+    """Saved read-path state of one instrument."""
+
+    # Module-qualified class name and structure fingerprint, for validation
+    class_name: str
+    fingerprint: List[Any]
+    # Indexed parameter paths, and the discovery depth they were built with
+    paths: List[str] = field(default_factory=list)
+    max_depth: Optional[int] = None
+    # parameter path -> (value, timestamp)
+    values: Dict[str, Tuple[Any, float]] = field(default_factory=dict)
+    # parameter path -> polling interval in seconds
+    subscriptions: Dict[str, float] = field(default_factory=dict)
+
+
+class WarmStartStore:
+    """SQLite file holding InstrumentState records keyed by instrument name.
+
+    Only JSON-representable values are saved; arrays and other objects are
+    skipped, so they are read from hardware again after a restart.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_value_age_s: Optional[float] = None,
+        save_interval_s: float = 30.0,
+    ):
+        """Initialize the store.
+
+        Args:
+            path: SQLite file (default ~/.instrmcp/warm_start.sqlite)
+            max_value_age_s: Do not restore values older than this (None = any age)
+            save_interval_s: How often the backend saves changed state
+        """
+        self.path = Path(path) if path is not None else DEFAULT_WARM_START_PATH
+        self.max_value_age_s = max_value_age_s
+        self.save_interval_s = save_interval_s
+        self.saves = 0
+        self.last_save: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.loaded_instruments = 0
+        self.restored_instruments = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=5.0)
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def load(self) -> Dict[str, InstrumentState]:
+        """Load saved state; returns an empty dict if there is none or it is invalid."""
+        if not self.path.exists():
+            return {}
+        try:
+            connection = self._connect()
+            try:
+                return self._load(connection)
+            finally:
+                connection.close()
+        except (sqlite3.Error, ValueError) as e:
+            self.last_error = str(e)
+            logger.warning(f"Ignoring warm-start file {self.path}: {e}")
+            return {}
+
+    def _load(self, connection: sqlite3.Connection) -> Dict[str, InstrumentState]:
+        row = connection.execute(
+            "SELECT value FROM meta WHERE key = 'schema_version'"
+        ).fetchone()
+        if row is None or int(row[0]) != _SCHEMA_VERSION:
+            return {}
+
+        states: Dict[str, InstrumentState] = {}
+        for name, class_name, fingerprint, max_depth, paths in connection.execute(
+            "SELECT name, class_name, fingerprint, max_depth, paths FROM instruments"
+        ):
+            states[name] = InstrumentState(
+                class_name=class_name,
+                fingerprint=json.loads(fingerprint),
+                paths=json.loads(paths),
+                max_depth=max_depth,
+            )
+
+        cutoff = (
+            time.time() - self.max_value_age_s
+            if self.max_value_age_s is not None
+            else None
+        )
+        for instrument, parameter, value, timestamp in connection.execute(
+            "SELECT instrument, parameter, value, timestamp FROM parameter_values"
+        ):
+            state = states.get(instrument)
+            if state is not None and (cutoff is None or timestamp >= cutoff):
+                state.values[parameter] = (json.loads(value), timestamp)
+
+        for instrument, parameter, interval_s in connection.execute(
+            "SELECT instrument, parameter, interval_s FROM subscriptions"
+        ):
+            state = states.get(instrument)
+            if state is not None:
+                state.subscriptions[parameter] = interval_s
+
+        self.loaded_instruments = len(states)
+        return states
+
+    def save(self, states: Dict[str, InstrumentState]):
+        """Replace the saved state with the given records, in one transaction."""
+        instruments = []
+        values = []
+        subscriptions = []
+        for name, state in states.items():
+            instruments.append(
+                (
+                    name,
+                    state.class_name,
+                    json.dumps(state.fingerprint),
+                    state.max_depth,
+                    json.dumps(state.paths),
+                )
+            )
+            for parameter, (value, timestamp) in state.values.items():
+                encoded = _encode_value(value)
+                if encoded is not None:
+                    values.append((name, parameter, encoded, timestamp))
+            subscriptions.extend(
+                (name, parameter, interval_s)
+                for parameter, interval_s in state.subscriptions.items()
+            )
+
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    for table in ("instruments", "parameter_values", "subscriptions"):
+                        connection.execute(f"DELETE FROM {table}")
+                    connection.execute(
+                        "INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)",
+                        (str(_SCHEMA_VERSION),),
+                    )
+                    connection.executemany(
+                        "INSERT INTO instruments VALUES (?, ?, ?, ?, ?)", instruments
+                    )
+                    connection.executemany(
+                        "INSERT INTO parameter_values VALUES (?, ?, ?, ?)", values
+                    )
+                    connection.executemany(
+                        "INSERT INTO subscriptions VALUES (?, ?, ?)", subscriptions
+                    )
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            self.last_error = str(e)
+            logger.warning(f"Could not save warm-start state to {self.path}: {e}")
+            return
+
+        self.saves += 1
+        self.last_save = time.time()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get persistence statistics."""
+        return {
+            "path": str(self.path),
+            "saves": self.saves,
+            "last_save": self.last_save,
+            "loaded_instruments": self.loaded_instruments,
+            "restored_instruments": self.restored_instruments,
+            "last_error": self.last_error,
+        }
+
+
+def _encode_value(value: Any) -> Optional[str]:
+    """JSON-encode a value for saving, or None if it should not be saved."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    elif isinstance(value, np.ndarray):
+        return None
+    try:
+        return json.dumps(value)
+    except (TypeError, ValueError):
+        return None
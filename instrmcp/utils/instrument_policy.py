@@ -0,0 +1,163 @@
+"""
+Per-instrument access policies for the QCoDeS read path.
+
+Policies live in ``~/.instrmcp/instruments.yaml`` and tune how often each
+instrument may be read from hardware and which I/O executor it uses, plus
+optional warm-start persistence of the read path.
+Everything is optional; instruments without an entry fall back to
+``defaults``, and without ``defaults`` to the server's ``min_interval_s``
+(one read per interval, no burst). Fields left out of an entry are
+inherited the same way, so an entry with only ``bus`` or
+``read_timeout_s`` keeps the default rate.
+
+Example::
+
+    defaults:
+      rate_hz: 5          # sustained reads per second
+      burst: 1            # reads allowed back-to-back before throttling
+    instruments:
+      lockin:
+        rate_hz: 50
+        burst: 10
+      keithley_gpib:
+        rate_hz: 2
+        bus: GPIB0        # share one I/O worker with other GPIB0 devices
+        read_timeout_s: 30  # slow instrument: allow long reads
+    persistence:
+      enabled: true       # keep cached values, index and subscriptions across
+                          # kernel restarts (~/.instrmcp/warm_start.sqlite)
+
+Only an explicit ``rate_hz: null`` disables rate limiting for that
+instrument (or, under ``defaults``, for every instrument without its own
+rate).
+``yaml.safe_load`` is used for security.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+try:
+    import yaml
+
+    YAML_AVAILABLE = True
+except ImportError:
+    yaml = None  # type: ignore[assignment]
+    YAML_AVAILABLE = False
+
+from instrmcp.utils.logging_config import get_logger
+
+logger = get_logger("instrument_policy")
+
+# User policy config path
+USER_POLICY_PATH = Path.home() / ".instrmcp" / "instruments.yaml"
+
+
+class InstrumentPolicy(BaseModel):
+    """Access policy for one instrument.
+
+    Attributes:
+        rate_hz: Sustained hardware reads per second (None = unlimited);
+            inherited when left out
+        burst: Reads allowed back-to-back before the rate applies;
+            inherited when left out
+        bus: Share one I/O executor with other instruments on this bus
+            (GPIB instruments are grouped by their address automatically)
+        read_timeout_s: Deadline for each hardware call (default 10 s)
+    """
+
+    rate_hz: Optional[float] = Field(default=None, gt=0)
+    burst: int = Field(default=1, ge=1)
+    bus: Optional[str] = None
+    read_timeout_s: Optional[float] = Field(default=None, gt=0)
+
+    def sets_rate(self) -> bool:
+        """Check whether the entry sets rate_hz or burst itself."""
+        return bool(self.model_fields_set & {"rate_hz", "burst"})
+
+    def rate_and_burst(
+        self, rate_hz: Optional[float], burst: int
+    ) -> Tuple[Optional[float], int]:
+        """Get (rate_hz, burst), inheriting the fields left out of the entry.
+
+        Args:
+            rate_hz: Inherited rate (None = unlimited)
+            burst: Inherited burst size
+        """
+        fields = self.model_fields_set
+        return (
+            self.rate_hz if "rate_hz" in fields else rate_hz,
+            self.burst if "burst" in fields else burst,
+        )
+
+
+class PersistenceSettings(BaseModel):
+    """Warm-start persistence of the read path across kernel restarts.
+
+    Attributes:
+        enabled: Save and restore cached values, index and subscriptions
+        path: SQLite file (default ~/.instrmcp/warm_start.sqlite)
+        save_interval_s: How often changed state is saved
+        max_value_age_s: Do not restore values older than this (None = any age)
+    """
+
+    enabled: bool = False
+    path: Optional[Path] = None
+    save_interval_s: float = Field(default=30.0, gt=0)
+    max_value_age_s: Optional[float] = Field(default=86400.0, gt=0)
+
+
+class InstrumentPolicyConfig(BaseModel):
+    """Root configuration model for instrument policies.
+
+    Attributes:
+        version: Schema version for future compatibility
+        defaults: Policy for instruments without their own entry
+        instruments: Policies keyed by instrument name in the namespace
+        persistence: Warm-start persistence settings (off by default)
+    """
+
+    version: int = 1
+    defaults: Optional[InstrumentPolicy] = None
+    instruments: dict[str, InstrumentPolicy] = Field(default_factory=dict)
+    persistence: PersistenceSettings = Field(default_factory=PersistenceSettings)
+
+
+def load_policies(path: Optional[Path] = None) -> InstrumentPolicyConfig:
+    """Load instrument policies.
+
+    Args:
+        path: Path to the policy file. Defaults to ~/.instrmcp/instruments.yaml
+
+    Returns:
+        Parsed policies, or an empty config if the file does not exist
+
+    Raises:
+        ValueError: If YAML parsing or validation fails
+        ImportError: If PyYAML is not installed
+    """
+    if path is None:
+        path = USER_POLICY_PATH
+
+    if not path.exists():
+        logger.debug(f"Instrument policy file not found: {path}, using defaults")
+        return InstrumentPolicyConfig()
+
+    if not YAML_AVAILABLE:
+        raise ImportError(
+            "PyYAML is required for instrument policies. "
+            "Install with: pip install pyyaml"
+        )
+
+    try:
+        with open(path) as f:
+            raw = yaml.safe_load(f)
+        config = InstrumentPolicyConfig.model_validate(raw or {})
+    except Exception as e:
+        raise ValueError(f"Invalid instrument policy config in {path}: {e}") from e
+
+    logger.debug(f"Loaded policies for {len(config.instruments)} instruments")
+    return config
@@ -125,6 +125,11 @@ SAFE_MODE_TOOLS = [
     "qcodes_instrument_info",
     "qcodes_get_parameter_info",
     "qcodes_get_parameter_values",
+    "qcodes_subscribe_parameter",
+    "qcodes_unsubscribe_parameter",
+    "qcodes_list_subscriptions",
+    "qcodes_get_parameter_history",
+    "qcodes_station_snapshot",
 ]
 
 # Additional tools in unsafe mode
@@ -151,6 +156,8 @@ DATABASE_TOOLS = [
     "database_list_all_available_db",
     "database_list_experiments",
     "database_get_dataset_info",
+    "database_get_run_data",
+    "database_get_run_preview",
     "database_get_database_stats",
 ]
 
@@ -0,0 +1,229 @@
+"""
+Unit tests for the pooled read-only SQLite connections.
+
+Tests connection reuse, read-only enforcement, visibility of concurrent
+writes, eviction and waiting for a free connection.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from instrmcp.servers.jupyter_qcodes.options.database import query_tools
+from instrmcp.servers.jupyter_qcodes.options.database.connection_pool import (
+    SQLiteConnectionPool,
+)
+
+
+def _create_database(path, wal=False):
+    conn = sqlite3.connect(str(path))
+    if wal:
+        conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("CREATE TABLE runs (run_id INTEGER PRIMARY KEY, name TEXT)")
+    conn.execute("INSERT INTO runs (name) VALUES ('first')")
+    conn.commit()
+    return conn
+
+
+@pytest.fixture
+def pool():
+    pool = SQLiteConnectionPool(max_connections_per_db=2, wait_timeout_s=1.0)
+    yield pool
+    pool.close_all()
+
+
+class TestSQLiteConnectionPool:
+    """Test SQLiteConnectionPool class."""
+
+    def test_connection_reused(self, pool, tmp_path):
+        """Test a returned connection is handed out again."""
+        db = tmp_path / "data.db"
+        _create_database(db).close()
+
+        with pool.connection(str(db)) as first:
+            assert first.execute("SELECT name FROM runs").fetchone()["name"] == "first"
+        with pool.connection(str(db)) as second:
+            assert second is first
+
+        stats = pool.get_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+
+    def test_connections_are_read_only(self, pool, tmp_path):
+        """Test writes through a pooled connection are refused."""
+        db = tmp_path / "data.db"
+        _create_database(db).close()
+
+        with pytest.raises(sqlite3.OperationalError):
+            with pool.connection(str(db)) as conn:
+                conn.execute("INSERT INTO runs (name) VALUES ('second')")
+
+        # The failed connection is not returned to the pool
+        assert pool.get_stats()["discarded"] == 1
+
+    def test_closed_generator_returns_connection(self, pool, tmp_path):
+        """Test a generator closed while borrowing keeps the connection pooled."""
+        db = tmp_path / "data.db"
+        _create_database(db).close()
+
+        def names():
+            with pool.connection(str(db)) as conn:
+                for row in conn.execute("SELECT name FROM runs").fetchall():
+                    yield row["name"]
+
+        rows = names()
+        assert next(rows) == "first"
+        rows.close()
+
+        stats = pool.get_stats()
+        assert stats["discarded"] == 0
+        assert stats["databases"][str(db.resolve())]["idle"] == 1
+
+    def test_paged_list_experiments_reuses_connection(
+        self, pool, tmp_path, monkeypatch
+    ):
+        """Test a list_experiments page that stops at limit reuses its connection."""
+        db = tmp_path / "experiments.db"
+        conn = sqlite3.connect(str(db))
+        conn.execute(
+            "CREATE TABLE experiments (exp_id INTEGER PRIMARY KEY, name TEXT, "
+            "sample_name TEXT, format_string TEXT, start_time REAL, end_time REAL)"
+        )
+        conn.execute("CREATE TABLE runs (run_id INTEGER PRIMARY KEY, exp_id INTEGER)")
+        for exp_id in range(1, 4):
+            conn.execute(
+                "INSERT INTO experiments (exp_id, name, sample_name) VALUES (?, ?, ?)",
+                (exp_id, f"exp{exp_id}", "sample"),
+            )
+            conn.execute("INSERT INTO runs (exp_id) VALUES (?)", (exp_id,))
+        conn.commit()
+        conn.close()
+        monkeypatch.setattr(query_tools, "QCODES_AVAILABLE", True)
+        monkeypatch.setattr(query_tools, "get_connection_pool", lambda: pool)
+
+        for _ in range(2):
+            result = json.loads(query_tools.list_experiments(str(db), limit=2))
+            assert result["page_count"] == 2
+            assert result["next_after_exp_id"] == 2
+
+        stats = pool.get_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+        assert stats["discarded"] == 0
+
+    def test_missing_database_is_not_created(self, pool, tmp_path):
+        """Test opening a nonexistent file fails instead of creating it."""
+        db = tmp_path / "missing.db"
+
+        with pytest.raises(sqlite3.OperationalError):
+            with pool.connection(str(db)):
+                pass
+        assert not db.exists()
+
+    def test_sees_writes_of_concurrent_wal_writer(self, pool, tmp_path):
+        """Test pooled readers see commits of a writer holding the WAL database."""
+        db = tmp_path / "wal.db"
+        writer = _create_database(db, wal=True)
+        try:
+            with pool.connection(str(db)) as conn:
+                assert conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 1
+
+            writer.execute("INSERT INTO runs (name) VALUES ('second')")
+            writer.commit()
+
+            with pool.connection(str(db)) as conn:
+                assert conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 2
+        finally:
+            writer.close()
+
+    def test_replaced_file_evicts_connections(self, pool, tmp_path):
+        """Test a database file replaced on disk gets fresh connections."""
+        db = tmp_path / "data.db"
+        _create_database(db).close()
+        with pool.connection(str(db)) as old:
+            pass
+
+        replacement = tmp_path / "new.db"
+        conn = _create_database(replacement)
+        conn.execute("INSERT INTO runs (name) VALUES ('second')")
+        conn.commit()
+        conn.close()
+        os.replace(replacement, db)
+
+        with pool.connection(str(db)) as new:
+            assert new is not old
+            assert new.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 2
+        assert pool.get_stats()["evicted_replaced"] == 1
+
+    def test_idle_connections_evicted(self, tmp_path):
+        """Test connections idle longer than idle_timeout_s are closed."""
+        pool = SQLiteConnectionPool(idle_timeout_s=0.0)
+        db = tmp_path / "data.db"
+        _create_database(db).close()
+
+        with pool.connection(str(db)) as first:
+            pass
+        time.sleep(0.01)
+        with pool.connection(str(db)) as second:
+            assert second is not first
+        assert pool.get_stats()["evicted_idle"] == 1
+        pool.close_all()
+
+    def test_close_all_closes_borrowed_connections_on_return(self, pool, tmp_path):
+        """Test close_all closes idle connections and borrowed ones once returned."""
+        db = tmp_path / "data.db"
+        _create_database(db).close()
+
+        with pool.connection(str(db)) as idle:
+            pass
+        with pool.connection(str(db)) as borrowed:
+            pool.close_all()
+            assert borrowed.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 1
+
+        for conn in (idle, borrowed):
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+        with pool.connection(str(db)) as fresh:
+            assert fresh is not borrowed
+
+    def test_waits_for_free_connection(self, pool, tmp_path):
+        """Test callers wait when every connection of a database is in use."""
+        db = tmp_path / "data.db"
+        _create_database(db).close()
+        release = threading.Event()
+
+        def hold():
+            with pool.connection(str(db)):
+                release.wait(5)
+
+        holders = [threading.Thread(target=hold) for _ in range(2)]
+        for thread in holders:
+            thread.start()
+        while pool.get_stats()["misses"] < 2:
+            time.sleep(0.001)
+
+        threading.Timer(0.05, release.set).start()
+        with pool.connection(str(db)) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 1
+        for thread in holders:
+            thread.join()
+
+        stats = pool.get_stats()
+        assert stats["waits"] == 1
+        assert stats["max_wait_ms"] > 0
+
+    def test_wait_times_out(self, tmp_path):
+        """Test waiting for a connection gives up after wait_timeout_s."""
+        pool = SQLiteConnectionPool(max_connections_per_db=1, wait_timeout_s=0.05)
+        db = tmp_path / "data.db"
+        _create_database(db).close()
+
+        with pool.connection(str(db)):
+            with pytest.raises(sqlite3.OperationalError, match="Timed out"):
+                with pool.connection(str(db)):
+                    pass
+        pool.close_all()
@@ -0,0 +1,120 @@
+"""
+Unit tests for the database path resolution cache.
+
+Tests reuse of resolutions, invalidation through directory mtimes, expiry
+and the cache report in resolution_info.
+"""
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from instrmcp.servers.jupyter_qcodes.options.database import path_cache
+from instrmcp.servers.jupyter_qcodes.options.database.path_cache import (
+    PathResolutionCache,
+)
+from instrmcp.servers.jupyter_qcodes.options.database.query_tools import (
+    resolve_database_path,
+)
+
+
+def _age(path, seconds=60):
+    """Move a file or directory's mtime into the past (beyond RACY_S)."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = PathResolutionCache()
+    monkeypatch.setattr(path_cache, "_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def cwd(tmp_path, monkeypatch):
+    """Working directory with one database, resolved via jupyter_cwd."""
+    (tmp_path / "data.db").touch()
+    _age(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("INSTRMCP_DATA_DIR", raising=False)
+    with patch("measureit.get_path", side_effect=ImportError):
+        with patch(
+            "instrmcp.servers.jupyter_qcodes.options.database.query_tools.qc"
+        ) as mock_qc:
+            mock_qc.config.core.db_location = "/nonexistent/qcodes.db"
+            yield tmp_path
+
+
+class TestPathResolutionCache:
+    """Test caching in resolve_database_path."""
+
+    def test_unchanged_resolution_reused(self, cache, cwd):
+        """Test a second resolution is served from the cache."""
+        first_path, first_info = resolve_database_path(None)
+        with patch.object(type(cwd), "glob") as mock_glob:
+            second_path, second_info = resolve_database_path(None)
+
+        assert second_path == first_path == str(cwd / "data.db")
+        assert not first_info["cache"]["hit"]
+        assert second_info["cache"]["hit"]
+        assert second_info["source"] == "jupyter_cwd"
+        mock_glob.assert_not_called()
+        assert cache.get_stats()["hits"] == 1
+
+    def test_new_database_invalidates(self, cache, cwd):
+        """Test adding a database to a searched directory re-resolves."""
+        resolve_database_path(None)
+
+        (cwd / "Example_database.db").touch()
+        path, info = resolve_database_path(None)
+
+        assert path == str(cwd / "Example_database.db")
+        assert not info["cache"]["hit"]
+        assert cache.get_stats()["changed"] == 1
+
+    def test_recently_modified_directory_not_trusted(self, cache, cwd):
+        """Test a directory changed just before resolving is checked again."""
+        (cwd / "other.db").touch()
+        resolve_database_path(None)
+
+        _, info = resolve_database_path(None)
+
+        assert not info["cache"]["hit"]
+
+    def test_expired_entry_re_resolved(self, cwd, monkeypatch):
+        """Test entries older than max_age_s are resolved again."""
+        cache = PathResolutionCache(max_age_s=0.0)
+        monkeypatch.setattr(path_cache, "_cache", cache)
+        resolve_database_path(None)
+        time.sleep(0.01)
+
+        _, info = resolve_database_path(None)
+
+        assert not info["cache"]["hit"]
+        assert cache.get_stats()["expired"] == 1
+
+    def test_inputs_are_part_of_key(self, cache, cwd, tmp_path_factory):
+        """Test a different data directory is not served another's result."""
+        resolve_database_path(None)
+        data_dir = tmp_path_factory.mktemp("data")
+        (data_dir / "Example_database.db").touch()
+
+        path, info = resolve_database_path(None, data_dir=data_dir)
+
+        assert path == str(data_dir / "Example_database.db")
+        assert info["source"] == "data_dir_default"
+        assert not info["cache"]["hit"]
+
+    def test_failed_resolution_not_cached(self, cache, tmp_path):
+        """Test missing databases are looked up again on the next call."""
+        with pytest.raises(FileNotFoundError):
+            resolve_database_path(None, data_dir=tmp_path)
+        (tmp_path / "new.db").touch()
+
+        path, _ = resolve_database_path(None, data_dir=tmp_path)
+
+        assert path == str(tmp_path / "new.db")
+        assert cache.get_stats()["entries"] == 1
@@ -0,0 +1,188 @@
+"""
+Unit tests for decimated run previews.
+
+Tests 1D decimation (streamed min-max and capped LTTB), 2D block means
+over streamed chunks, caching of completed runs and parameter validation of
+get_run_preview.
+"""
+
+import json
+import sqlite3
+
+import numpy as np
+import pytest
+
+from instrmcp.servers.jupyter_qcodes.array_utils import minmax_decimate
+from instrmcp.servers.jupyter_qcodes.options.database import previews
+from instrmcp.servers.jupyter_qcodes.options.database.previews import (
+    PreviewCache,
+    get_run_preview,
+)
+
+
+def _description(setpoints, dependents):
+    paramspecs = [{"name": s, "type": "numeric"} for s in setpoints]
+    paramspecs += [
+        {"name": d, "type": kind, "depends_on": setpoints}
+        for d, kind in dependents.items()
+    ]
+    return json.dumps({"interdependencies": {"paramspecs": paramspecs}})
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "data.db"
+    conn = sqlite3.connect(str(path))
+    conn.execute(
+        "CREATE TABLE runs (run_id INTEGER PRIMARY KEY, result_table_name TEXT, "
+        "guid TEXT, is_completed INTEGER, run_description TEXT)"
+    )
+
+    # Run 1: 1D sweep of 10000 points with a spike
+    conn.execute(
+        "INSERT INTO runs VALUES (1, 'results-1-1', 'guid-1', 1, ?)",
+        (_description(["x"], {"y": "numeric", "trace": "array"}),),
+    )
+    conn.execute(
+        'CREATE TABLE "results-1-1" (id INTEGER PRIMARY KEY, x REAL, y REAL, '
+        "trace BLOB)"
+    )
+    y = np.sin(np.linspace(0, 10, 10000))
+    y[5000] = 50.0
+    conn.executemany(
+        'INSERT INTO "results-1-1" (x, y) VALUES (?, ?)',
+        [(i * 0.1, float(v)) for i, v in enumerate(y)],
+    )
+
+    # Run 2: 2D sweep on a 40 x 30 grid, z = x + 100 * y
+    conn.execute(
+        "INSERT INTO runs VALUES (2, 'results-1-2', 'guid-2', 0, ?)",
+        (_description(["x", "y"], {"z": "numeric"}),),
+    )
+    conn.execute(
+        'CREATE TABLE "results-1-2" (id INTEGER PRIMARY KEY, x REAL, y REAL, z REAL)'
+    )
+    conn.executemany(
+        'INSERT INTO "results-1-2" (x, y, z) VALUES (?, ?, ?)',
+        [(x, y, x + 100.0 * y) for y in range(30) for x in range(40)],
+    )
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch):
+    cache = PreviewCache()
+    monkeypatch.setattr(previews, "_cache", cache)
+    return cache
+
+
+class TestGetRunPreview:
+    """Test get_run_preview function."""
+
+    def test_1d_minmax_keeps_spike(self, db_path):
+        """Test min-max decimation keeps the extremes of a 1D run."""
+        result = json.loads(get_run_preview(1, database_path=db_path, resolution=50))
+
+        assert result["kind"] == "1d"
+        assert result["parameter"] == "y"
+        assert result["points_total"] == 10000
+        assert result["points"] <= 50
+        assert 50.0 in result["y"]
+        assert result["x"][result["y"].index(50.0)] == pytest.approx(500.0)
+
+    def test_1d_minmax_streamed_matches_full_series(self, db_path, monkeypatch):
+        """Test chunked min-max keeps the same points as decimating in memory."""
+        monkeypatch.setattr(previews, "CHUNK_ROWS", 77)
+
+        result = json.loads(get_run_preview(1, database_path=db_path, resolution=50))
+
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute('SELECT x, y FROM "results-1-1" ORDER BY id').fetchall()
+        conn.close()
+        data = np.array(rows)
+        index = np.arange(len(data), dtype=np.float64)
+        kept, _ = minmax_decimate(index, data[:, 1], 50)
+        kept = kept.astype(np.int64)
+        assert result["index"] == kept.tolist()
+        assert result["y"] == data[kept, 1].tolist()
+        assert result["x"] == data[kept, 0].tolist()
+        assert result["range"] == [data[:, 1].min(), 50.0]
+
+    def test_1d_lttb_row_cap(self, db_path, monkeypatch):
+        """Test LTTB falls back to min-max above the row cap and says so."""
+        monkeypatch.setattr(previews, "LTTB_MAX_ROWS", 1000)
+
+        result = json.loads(
+            get_run_preview(1, database_path=db_path, resolution=50, method="lttb")
+        )
+
+        assert result["method"] == "minmax"
+        assert "LTTB is limited to runs of at most 1000 points" in result["warning"]
+        assert 50.0 in result["y"]
+
+    def test_1d_lttb(self, db_path):
+        """Test LTTB returns exactly resolution points including the endpoints."""
+        result = json.loads(
+            get_run_preview(1, database_path=db_path, resolution=50, method="lttb")
+        )
+
+        assert result["points"] == 50
+        assert result["index"][0] == 0
+        assert result["index"][-1] == 9999
+
+    def test_2d_block_mean(self, db_path, monkeypatch):
+        """Test 2D runs are block-averaged over several streamed chunks."""
+        monkeypatch.setattr(previews, "CHUNK_ROWS", 100)
+
+        result = json.loads(get_run_preview(2, database_path=db_path, resolution=10))
+
+        assert result["kind"] == "2d"
+        assert result["points_total"] == 1200
+        assert result["shape"] == [10, 10]
+        values = np.array(result["values"])
+        # Each cell averages 4 x by 3 y setpoints
+        assert result["x"][0] == pytest.approx(1.5)
+        assert result["y"][0] == pytest.approx(1.0)
+        assert values[0, 0] == pytest.approx(101.5)
+        assert result["range"] == [0.0, 2939.0]
+
+    def test_2d_empty_bins_dropped(self, db_path):
+        """Test a grid finer than the sweep keeps one cell per setpoint."""
+        result = json.loads(get_run_preview(2, database_path=db_path, resolution=100))
+
+        assert result["shape"] == [30, 40]
+        assert result["x"] == list(range(40))
+        assert None not in np.array(result["values"]).ravel()
+
+    def test_completed_run_cached(self, db_path, cache):
+        """Test previews of completed runs are served from the cache."""
+        first = json.loads(get_run_preview(1, database_path=db_path))
+        second = json.loads(get_run_preview(1, database_path=db_path))
+
+        assert not first["cached"]
+        assert second["cached"]
+        assert second["y"] == first["y"]
+        assert cache.get_stats()["hits"] == 1
+
+    def test_running_run_not_cached(self, db_path, cache):
+        """Test previews of runs in progress are recomputed."""
+        get_run_preview(2, database_path=db_path)
+        result = json.loads(get_run_preview(2, database_path=db_path))
+
+        assert not result["cached"]
+        assert cache.get_stats()["entries"] == 0
+
+    def test_array_parameter_rejected(self, db_path):
+        """Test array-valued parameters point to database_get_run_data."""
+        result = json.loads(get_run_preview(1, database_path=db_path, param="trace"))
+
+        assert "database_get_run_data" in result["error"]
+        assert result["available_parameters"] == ["y"]
+
+    def test_invalid_method(self, db_path):
+        """Test unknown decimation methods are rejected."""
+        result = json.loads(get_run_preview(1, database_path=db_path, method="mean"))
+
+        assert "Unknown method" in result["error"]
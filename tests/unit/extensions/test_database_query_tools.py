@@ -534,6 +534,50 @@ class TestListExperiments:
         exp2 = next(e for e in result["experiments"] if e["experiment_id"] == 2)
         assert exp2["run_ids"] == "3"
 
+    @pytest.mark.skipif(not QCODES_AVAILABLE, reason="QCodes not available")
+    def test_list_experiments_run_range_and_empty(self, qcodes_test_database):
+        """Test large experiments are summarized and empty ones listed."""
+        conn = sqlite3.connect(qcodes_test_database)
+        conn.execute(
+            "INSERT INTO experiments (exp_id, name, sample_name) "
+            "VALUES (3, 'no_runs', 's3')"
+        )
+        conn.executemany(
+            "INSERT INTO runs (run_id, exp_id, name) VALUES (?, 2, 'r')",
+            [(run_id,) for run_id in range(4, 14)],
+        )
+        conn.commit()
+        conn.close()
+
+        result = json.loads(list_experiments(qcodes_test_database))
+        run_ids = {e["experiment_id"]: e["run_ids"] for e in result["experiments"]}
+
+        assert run_ids == {1: "1,2", 2: "3-13(11)", 3: ""}
+
+    @pytest.mark.skipif(not QCODES_AVAILABLE, reason="QCodes not available")
+    def test_list_experiments_pagination(self, qcodes_test_database):
+        """Test paging through experiments with limit and after_exp_id."""
+        first = json.loads(list_experiments(qcodes_test_database, limit=1))
+        assert [e["experiment_id"] for e in first["experiments"]] == [1]
+        assert first["next_after_exp_id"] == 1
+        # experiment_count stays the database total while paging
+        assert first["experiment_count"] == 2
+        assert first["page_count"] == 1
+
+        second = json.loads(
+            list_experiments(
+                qcodes_test_database, after_exp_id=first["next_after_exp_id"], limit=1
+            )
+        )
+        assert [e["experiment_id"] for e in second["experiments"]] == [2]
+        assert "next_after_exp_id" not in second
+
+    @pytest.mark.skipif(not QCODES_AVAILABLE, reason="QCodes not available")
+    def test_list_experiments_invalid_limit(self, qcodes_test_database):
+        """Test a non-positive limit is rejected."""
+        result = json.loads(list_experiments(qcodes_test_database, limit=0))
+        assert "error" in result
+
 
 class TestGetDatasetInfo:
     """Test get_dataset_info functionality."""
@@ -0,0 +1,103 @@
+"""
+Unit tests for result table row counts.
+
+Tests the MAX(rowid) strategy, caching of completed runs and incremental
+counting of runs still in progress.
+"""
+
+import sqlite3
+
+import pytest
+
+from instrmcp.servers.jupyter_qcodes.options.database.result_counts import (
+    _MAX_ROWID_QUERY,
+    _MIN_ROWID_QUERY,
+    ResultCountCache,
+)
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "data.db"))
+    conn.execute('CREATE TABLE "results-1-1" (id INTEGER PRIMARY KEY, x REAL)')
+    conn.executemany(
+        'INSERT INTO "results-1-1" (x) VALUES (?)', [(i,) for i in range(10)]
+    )
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def _append(conn, rows):
+    conn.executemany(
+        'INSERT INTO "results-1-1" (x) VALUES (?)', [(i,) for i in range(rows)]
+    )
+    conn.commit()
+
+
+class TestResultCountCache:
+    """Test ResultCountCache class."""
+
+    def test_counts_with_max_rowid(self, conn):
+        """Test a table starting at rowid 1 is counted via MAX(rowid)."""
+        cache = ResultCountCache()
+
+        assert cache.count(conn.cursor(), "db", "results-1-1") == 10
+        assert cache.get_stats()["max_rowid_counts"] == 1
+        assert cache.get_stats()["full_counts"] == 0
+
+    def test_completed_run_cached(self, conn):
+        """Test the count of a completed run is not queried again."""
+        cache = ResultCountCache()
+        cache.count(conn.cursor(), "db", "results-1-1", "guid", completed=True)
+        _append(conn, 5)
+
+        assert cache.count(conn.cursor(), "db", "results-1-1", "guid", True) == 10
+        assert cache.get_stats()["hits"] == 1
+
+    def test_running_run_counted_incrementally(self, conn):
+        """Test a run in progress only counts rows added since the last call."""
+        cache = ResultCountCache()
+        cache.count(conn.cursor(), "db", "results-1-1", "guid")
+        _append(conn, 5)
+
+        assert cache.count(conn.cursor(), "db", "results-1-1", "guid") == 15
+        assert cache.get_stats()["incremental_counts"] == 1
+
+    def test_table_not_starting_at_one_fully_counted(self, conn):
+        """Test tables whose rowids do not start at 1 fall back to COUNT(*)."""
+        conn.execute('DELETE FROM "results-1-1" WHERE id <= 3')
+        conn.commit()
+        cache = ResultCountCache()
+
+        assert cache.count(conn.cursor(), "db", "results-1-1") == 7
+        assert cache.get_stats()["full_counts"] == 1
+
+    def test_empty_missing_and_invalid_tables(self, conn):
+        """Test empty, missing and unsafe table names."""
+        conn.execute('CREATE TABLE "results-2-1" (id INTEGER PRIMARY KEY)')
+        cache = ResultCountCache()
+
+        assert cache.count(conn.cursor(), "db", "results-2-1") == 0
+        assert cache.count(conn.cursor(), "db", "results-9-9") is None
+        assert cache.count(conn.cursor(), "db", 'x"; DROP TABLE t; --') is None
+        assert cache.count(conn.cursor(), "db", None) is None
+
+    def test_entries_bounded(self, conn):
+        """Test the least recently used runs are forgotten."""
+        cache = ResultCountCache(max_entries=2)
+        for guid in ("a", "b", "c"):
+            cache.count(conn.cursor(), "db", "results-1-1", guid, completed=True)
+
+        assert cache.get_stats()["entries"] == 2
+
+    @pytest.mark.parametrize("query", [_MAX_ROWID_QUERY, _MIN_ROWID_QUERY])
+    def test_rowid_bounds_use_btree_lookup(self, conn, query):
+        """Test MIN/MAX(rowid) are B-tree searches, not table scans."""
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN " + query.format(table="results-1-1")
+        ).fetchall()
+        details = " ".join(row[-1] for row in plan)
+
+        assert "SEARCH" in details
+        assert "SCAN" not in details
@@ -0,0 +1,192 @@
+"""
+Unit tests for paginated result table reads.
+
+Tests bulk decoding of QCoDeS array blobs, row pagination, parameter
+selection and error reporting of get_run_data.
+"""
+
+import io
+import json
+import sqlite3
+
+import numpy as np
+import pytest
+
+from instrmcp.servers.jupyter_qcodes.options.database.identifiers import (
+    is_valid_table_name,
+    quote_identifier,
+)
+from instrmcp.servers.jupyter_qcodes.options.database.run_data import (
+    decode_npy_blobs,
+    get_run_data,
+)
+
+
+def _npy(array):
+    """Encode an array the way QCoDeS stores array values."""
+    stream = io.BytesIO()
+    np.lib.format.write_array(stream, np.asarray(array), version=(3, 0))
+    return stream.getvalue()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "data.db"
+    conn = sqlite3.connect(str(path))
+    conn.execute(
+        "CREATE TABLE runs (run_id INTEGER PRIMARY KEY, result_table_name TEXT, "
+        "guid TEXT, is_completed INTEGER, run_description TEXT)"
+    )
+    description = {
+        "interdependencies": {
+            "paramspecs": [
+                {"name": "x", "type": "numeric"},
+                {"name": "trace", "type": "array", "depends_on": ["x"]},
+                {"name": "label", "type": "text"},
+            ]
+        }
+    }
+    conn.execute(
+        "INSERT INTO runs VALUES (1, 'results-1-1', 'guid-1', 1, ?)",
+        (json.dumps(description),),
+    )
+    conn.execute(
+        'CREATE TABLE "results-1-1" (id INTEGER PRIMARY KEY, x REAL, '
+        "trace BLOB, label TEXT)"
+    )
+    conn.executemany(
+        'INSERT INTO "results-1-1" (x, trace, label) VALUES (?, ?, ?)',
+        [(float(i), _npy(np.arange(4) + i), f"p{i}") for i in range(10)],
+    )
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+class TestDecodeNpyBlobs:
+    """Test decode_npy_blobs function."""
+
+    def test_same_shape_stacked(self):
+        """Test blobs with one header decode to a stacked array."""
+        array, ragged = decode_npy_blobs([_npy([1.0, 2.0]), _npy([3.0, 4.0])])
+
+        assert not ragged
+        np.testing.assert_array_equal(array, [[1.0, 2.0], [3.0, 4.0]])
+
+    def test_single_blob_not_copied(self):
+        """Test a single blob is returned as a view of its buffer."""
+        array, _ = decode_npy_blobs([_npy(np.arange(3.0))])
+
+        assert not array.flags.owndata
+        np.testing.assert_array_equal(array, [[0.0, 1.0, 2.0]])
+
+    def test_complex_values(self):
+        """Test complex scalars (stored as 0-d arrays) are decoded."""
+        array, _ = decode_npy_blobs([_npy(np.complex128(1 + 2j))] * 3)
+
+        assert array.shape == (3,)
+        assert array[0] == 1 + 2j
+
+    def test_ragged_concatenated(self):
+        """Test values of different shapes are flattened and concatenated."""
+        array, ragged = decode_npy_blobs([_npy([1, 2]), _npy([3, 4, 5])])
+
+        assert ragged
+        np.testing.assert_array_equal(array, [1, 2, 3, 4, 5])
+
+    def test_rejects_non_npy(self):
+        """Test non-.npy values raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_npy_blobs([b"not an array"])
+
+
+class TestGetRunData:
+    """Test get_run_data function."""
+
+    def test_reads_all_columns(self, db_path):
+        """Test every parameter column is returned with the run's row count."""
+        result = json.loads(get_run_data(1, database_path=db_path, mode="full"))
+
+        assert result["total_rows"] == 10
+        assert result["rows"] == 10
+        assert result["next_after_row"] is None
+        assert result["parameters"] == {
+            "x": "numeric",
+            "trace": "array",
+            "label": "text",
+        }
+        assert result["columns"]["x"]["values"] == list(range(10))
+        assert result["columns"]["trace"]["values"][9] == [9, 10, 11, 12]
+        assert result["columns"]["label"]["values"][0] == "p0"
+
+    def test_pagination(self, db_path):
+        """Test pages follow each other through next_after_row."""
+        first = json.loads(
+            get_run_data(1, database_path=db_path, params=["x"], limit=4, mode="full")
+        )
+        second = json.loads(
+            get_run_data(
+                1,
+                database_path=db_path,
+                params=["x"],
+                after_row=first["next_after_row"],
+                limit=4,
+                mode="full",
+            )
+        )
+
+        assert first["columns"]["x"]["values"] == [0, 1, 2, 3]
+        assert first["row_ids"] == [1, 4]
+        assert second["columns"]["x"]["values"] == [4, 5, 6, 7]
+        assert list(second["columns"]) == ["x"]
+
+    def test_summary_mode(self, db_path):
+        """Test array columns are summarized by default."""
+        result = json.loads(get_run_data(1, database_path=db_path))
+
+        summary = result["columns"]["trace"]["values"]
+        assert summary["shape"] == [10, 4]
+        assert summary["max"] == 12
+
+    def test_unknown_parameter(self, db_path):
+        """Test unknown parameters list the available ones."""
+        result = json.loads(get_run_data(1, database_path=db_path, params=["y"]))
+
+        assert "error" in result
+        assert result["available_parameters"] == ["x", "trace", "label"]
+
+    def test_unknown_run(self, db_path):
+        """Test a missing run is reported."""
+        result = json.loads(get_run_data(99, database_path=db_path))
+
+        assert "not found" in result["error"]
+
+    def test_invalid_limit(self, db_path):
+        """Test limits outside 1..MAX_ROW_LIMIT are rejected."""
+        result = json.loads(get_run_data(1, database_path=db_path, limit=0))
+
+        assert "limit" in result["error"]
+
+
+class TestIdentifiers:
+    """Test the table name check and identifier quoting used in queries."""
+
+    @pytest.mark.parametrize(
+        "name, valid",
+        [
+            ("results-1-12", True),
+            ("_results", True),
+            ("", False),
+            (None, False),
+            ('results"; DROP TABLE runs; --', False),
+            ("1-results", False),
+        ],
+    )
+    def test_is_valid_table_name(self, name, valid):
+        """Test only QCoDeS-style result table names are accepted."""
+        assert is_valid_table_name(name) is valid
+
+    def test_quote_identifier(self):
+        """Test embedded quotes are doubled."""
+        assert quote_identifier("x") == '"x"'
+        assert quote_identifier('a"b') == '"a""b"'
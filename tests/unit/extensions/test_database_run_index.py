@@ -0,0 +1,186 @@
+"""
+Unit tests for the incremental run-metadata index.
+
+Tests parsing of run metadata, incremental refreshes, persistence of the
+sidecar index and rebuilds after the database file is replaced.
+"""
+
+import json
+import os
+import sqlite3
+
+import pytest
+
+from instrmcp.servers.jupyter_qcodes.options.database.internal import (
+    code_suggestion,
+)
+from instrmcp.servers.jupyter_qcodes.options.database.internal.run_index import (
+    RunIndex,
+)
+
+
+def _create_database(path):
+    conn = sqlite3.connect(str(path))
+    conn.execute(
+        "CREATE TABLE experiments (exp_id INTEGER PRIMARY KEY, name TEXT, "
+        "sample_name TEXT)"
+    )
+    conn.execute(
+        "CREATE TABLE runs (run_id INTEGER PRIMARY KEY, exp_id INTEGER, guid TEXT, "
+        "is_completed INTEGER, run_description TEXT, measureit TEXT)"
+    )
+    conn.execute("INSERT INTO experiments VALUES (1, 'exp', 'sample')")
+    conn.commit()
+    return conn
+
+
+def _add_run(conn, run_id, sweep_class="Sweep1D", completed=True, launched_by=None):
+    description = {
+        "interdependencies": {
+            "paramspecs": [
+                {"name": "x"},
+                {"name": "y", "depends_on": ["x"]},
+            ]
+        }
+    }
+    measureit = {"class": sweep_class, "attributes": {"launched_by": launched_by}}
+    conn.execute(
+        "INSERT INTO runs VALUES (?, 1, ?, ?, ?, ?)",
+        (
+            run_id,
+            f"guid-{run_id}",
+            int(completed),
+            json.dumps(description),
+            json.dumps(measureit),
+        ),
+    )
+    conn.commit()
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = tmp_path / "data.db"
+    conn = _create_database(path)
+    _add_run(conn, 1)
+    _add_run(conn, 2, sweep_class="Sweep2D")
+    yield path, conn
+    conn.close()
+
+
+@pytest.fixture
+def index(tmp_path):
+    return RunIndex(path=tmp_path / "index" / "run_index.sqlite")
+
+
+class TestRunIndex:
+    """Test RunIndex class."""
+
+    def test_parses_run_metadata(self, index, database):
+        """Test the indexed fields of each run."""
+        path, _ = database
+
+        runs = index.get_runs(str(path))
+
+        assert [r.run_id for r in runs] == [1, 2]
+        assert runs[0].setpoints == ["x"]
+        assert runs[0].dependents == ["y"]
+        assert runs[1].measureit == {"class": "Sweep2D"}
+        assert runs[0].guid == "guid-1"
+
+    def test_unchanged_database_served_from_memory(self, index, database):
+        """Test repeated calls do not read the database again."""
+        path, _ = database
+        index.get_runs(str(path))
+        index.get_runs(str(path))
+
+        stats = index.get_stats()
+        assert stats["hits"] == 1
+        assert stats["parsed_runs"] == 2
+
+    def test_only_new_runs_parsed(self, index, database):
+        """Test new runs are added incrementally."""
+        path, conn = database
+        index.get_runs(str(path))
+
+        _add_run(conn, 3, launched_by="SweepQueue")
+        runs = index.get_runs(str(path))
+
+        assert [r.run_id for r in runs] == [1, 2, 3]
+        assert runs[2].launched_by == "SweepQueue"
+        assert index.get_stats()["parsed_runs"] == 3
+
+    def test_incomplete_runs_reread(self, index, database):
+        """Test runs in progress are parsed again until completed."""
+        path, conn = database
+        _add_run(conn, 3, completed=False)
+        index.get_runs(str(path))
+
+        conn.execute(
+            "UPDATE runs SET is_completed = 1, measureit = ? WHERE run_id = 3",
+            (json.dumps({"class": "Sweep0D"}),),
+        )
+        conn.commit()
+        runs = index.get_runs(str(path))
+
+        assert runs[2].measureit == {"class": "Sweep0D"}
+        assert runs[2].is_completed
+
+    def test_stale_incomplete_run_does_not_reparse_later_runs(self, index, database):
+        """Test a run never marked completed only re-reads itself."""
+        path, conn = database
+        _add_run(conn, 3, completed=False)
+        for run_id in range(4, 24):
+            _add_run(conn, run_id)
+        index.get_runs(str(path))
+        parsed = index.get_stats()["parsed_runs"]
+
+        _add_run(conn, 24)
+        runs = index.get_runs(str(path))
+
+        assert [r.run_id for r in runs] == list(range(1, 25))
+        # The incomplete run 3 and the new run 24, not runs 4-23 again
+        assert index.get_stats()["parsed_runs"] == parsed + 2
+
+    def test_persisted_index_reused(self, index, database):
+        """Test a new index instance loads the sidecar file."""
+        path, conn = database
+        index.get_runs(str(path))
+        _add_run(conn, 3)
+
+        restarted = RunIndex(path=index.path)
+        runs = restarted.get_runs(str(path))
+
+        assert [r.run_id for r in runs] == [1, 2, 3]
+        assert restarted.get_stats()["parsed_runs"] == 1
+        assert restarted.get_stats()["rebuilds"] == 0
+
+    def test_replaced_database_rebuilt(self, index, database, tmp_path):
+        """Test a different file at the same path is indexed from scratch."""
+        path, _ = database
+        index.get_runs(str(path))
+
+        replacement = tmp_path / "other.db"
+        conn = _create_database(replacement)
+        _add_run(conn, 1, sweep_class="Sweep0D")
+        conn.close()
+        os.replace(replacement, path)
+
+        runs = index.get_runs(str(path))
+        assert [r.measureit for r in runs] == [{"class": "Sweep0D"}]
+        assert index.get_stats()["rebuilds"] == 2
+
+
+class TestSweepGroupsFromIndex:
+    """Test sweep analysis on top of the run index."""
+
+    def test_analyze_sweep_groups(self, index, database, monkeypatch):
+        """Test groups are built from indexed runs."""
+        path, conn = database
+        _add_run(conn, 3, sweep_class="Sweep2D")
+        monkeypatch.setattr(code_suggestion, "get_run_index", lambda: index)
+
+        groups = code_suggestion.analyze_sweep_groups(str(path))
+
+        by_type = {g.group_type: g.run_ids for g in groups}
+        assert by_type["sweep2d_parent"] == [2, 3]
+        assert by_type["single"] == [1]
@@ -0,0 +1,127 @@
+"""
+Unit tests for the database worker pool.
+
+Tests running blocking calls off the event loop, deadlines, interruption of
+abandoned SQLite queries and queue limits.
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from instrmcp.servers.jupyter_qcodes.options.database.query_tools import (
+    thread_safe_db_connection,
+)
+from instrmcp.servers.jupyter_qcodes.options.database.worker_pool import (
+    DatabaseQueueFull,
+    DatabaseTimeout,
+    DatabaseWorkerPool,
+)
+
+# Takes far longer than any test deadline unless interrupted
+_SLOW_QUERY = """
+    WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n)
+    SELECT COUNT(*) FROM n
+"""
+
+
+@pytest.fixture
+def pool():
+    pool = DatabaseWorkerPool(workers=2, max_pending=4, timeout_s=5.0)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "data.db"
+    sqlite3.connect(str(path)).close()
+    return str(path)
+
+
+class TestDatabaseWorkerPool:
+    """Test DatabaseWorkerPool class."""
+
+    @pytest.mark.asyncio
+    async def test_runs_off_the_event_loop(self, pool):
+        """Test blocking calls run on a worker thread and return their result."""
+        loop_thread = threading.get_ident()
+
+        result = await pool.run(lambda x: (x * 2, threading.get_ident()), 21)
+
+        assert result[0] == 42
+        assert result[1] != loop_thread
+        assert pool.get_stats()["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self, pool):
+        """Test other coroutines run while a database call blocks."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.ensure_future(ticker())
+        await pool.run(time.sleep, 0.2)
+        task.cancel()
+
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_timeout_interrupts_query(self, pool, db_path):
+        """Test a call past its deadline fails and its query is interrupted."""
+
+        def slow():
+            with thread_safe_db_connection(db_path) as conn:
+                return conn.execute(_SLOW_QUERY).fetchone()
+
+        with pytest.raises(DatabaseTimeout):
+            await pool.run(slow, timeout_s=0.1)
+
+        # The worker is released promptly instead of running the query forever
+        deadline = time.monotonic() + 5
+        while pool.get_stats()["running"] and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        stats = pool.get_stats()
+        assert stats["running"] == 0
+        assert stats["timed_out"] == 1
+        assert stats["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_call_errors_propagate(self, pool):
+        """Test exceptions raised by the call reach the caller."""
+
+        def fail():
+            raise ValueError("bad query")
+
+        with pytest.raises(ValueError, match="bad query"):
+            await pool.run(fail)
+        assert pool.get_stats()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_queue_full_rejects(self):
+        """Test calls beyond max_pending fail fast."""
+        pool = DatabaseWorkerPool(workers=1, max_pending=1)
+        release = threading.Event()
+        try:
+            first = asyncio.ensure_future(pool.run(release.wait, 5))
+            await asyncio.sleep(0.05)
+
+            with pytest.raises(DatabaseQueueFull):
+                await pool.run(lambda: None)
+            release.set()
+            await first
+        finally:
+            release.set()
+            pool.shutdown()
+
+        stats = pool.get_stats()
+        assert stats["rejected"] == 1
+        assert stats["queued"] == 0
+        assert stats["max_wait_ms"] >= 0
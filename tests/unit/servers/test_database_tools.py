@@ -6,12 +6,16 @@ Tests DatabaseToolRegistrar for registering database query tools with FastMCP.
 
 import pytest
 import json
+import time
 from unittest.mock import MagicMock
 from mcp.types import TextContent
 
 from instrmcp.servers.jupyter_qcodes.options.database.tools import (
     DatabaseToolRegistrar,
 )
+from instrmcp.servers.jupyter_qcodes.options.database.worker_pool import (
+    DatabaseWorkerPool,
+)
 
 
 class TestDatabaseToolRegistrar:
@@ -62,6 +66,8 @@ class TestDatabaseToolRegistrar:
         expected_tools = [
             "database_list_experiments",
             "database_get_dataset_info",
+            "database_get_run_data",
+            "database_get_run_preview",
             "database_get_database_stats",
         ]
 
@@ -105,8 +111,39 @@ class TestDatabaseToolRegistrar:
         mock_db_integration.list_experiments.assert_called_once_with(
             database_path=None,
             scan_nested=False,
+            after_exp_id=None,
+            limit=None,
+        )
+
+    @pytest.mark.asyncio
+    async def test_list_experiments_truncated_keeps_cursor(
+        self, registrar, mock_db_integration, mock_mcp_server
+    ):
+        """Test the truncated concise listing still carries the paging cursor."""
+        mock_db_integration.list_experiments.return_value = json.dumps(
+            {
+                "database_path": "/path/to/database.db",
+                "experiments": [
+                    {"experiment_id": i, "name": f"exp{i}", "run_ids": str(i)}
+                    for i in range(1, 13)
+                ],
+                "experiment_count": 12,
+                "next_after_exp_id": 12,
+            }
         )
 
+        registrar.register_all()
+        list_exp_func = mock_mcp_server._tools["database_list_experiments"]
+        result = await list_exp_func(limit=12)
+
+        response_data = json.loads(result[0].text)
+        assert "experiments" not in response_data
+        assert "warning" in response_data
+        assert response_data["next_after_exp_id"] == 12
+        assert response_data["first_exp_id"] == 1
+        assert response_data["last_exp_id"] == 12
+        assert response_data["count"] == 12
+
     @pytest.mark.asyncio
     async def test_list_experiments_custom_path(
         self, registrar, mock_db_integration, mock_mcp_server
@@ -123,6 +160,8 @@ class TestDatabaseToolRegistrar:
         mock_db_integration.list_experiments.assert_called_once_with(
             database_path=custom_path,
             scan_nested=False,
+            after_exp_id=None,
+            limit=None,
         )
 
     @pytest.mark.asyncio
@@ -396,3 +435,80 @@ class TestDatabaseToolRegistrar:
         registrar = DatabaseToolRegistrar(mock_mcp_server, mock_db_integration)
         assert registrar.mcp is mock_mcp_server
         assert registrar.db is mock_db_integration
+
+    @pytest.mark.asyncio
+    async def test_detailed_stats_include_worker_metrics(
+        self, registrar, mock_db_integration, mock_mcp_server
+    ):
+        """Test detailed database stats report the database worker pool."""
+        mock_db_integration.get_database_stats.return_value = json.dumps(
+            {"dataset_count": 0}
+        )
+
+        registrar.register_all()
+        get_stats_func = mock_mcp_server._tools["database_get_database_stats"]
+        result = json.loads((await get_stats_func(detailed=True))[0].text)
+
+        assert result["dataset_count"] == 0
+        assert result["database_workers"]["completed"] == 1
+        assert result["database_workers"]["queued"] == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_database_call_times_out(
+        self, mock_mcp_server, mock_db_integration
+    ):
+        """Test database calls past their deadline return a timeout error."""
+        registrar = DatabaseToolRegistrar(
+            mock_mcp_server,
+            mock_db_integration,
+            workers=DatabaseWorkerPool(timeout_s=0.05),
+        )
+        mock_db_integration.get_database_stats.side_effect = lambda **_: time.sleep(0.5)
+
+        registrar.register_all()
+        get_stats_func = mock_mcp_server._tools["database_get_database_stats"]
+        result = json.loads((await get_stats_func())[0].text)
+
+        assert result["error_type"] == "timeout"
+        registrar.workers.shutdown()
+
+
+class TestServerDatabaseCleanup:
+    """Test the server owns and releases the database tools' resources."""
+
+    @pytest.fixture
+    def server(self):
+        from instrmcp.servers.jupyter_qcodes.mcp_server import JupyterMCPServer
+
+        ipython = MagicMock()
+        ipython.user_ns = {}
+        del ipython.events
+        return JupyterMCPServer(ipython, enabled_options={"database"})
+
+    def test_stop_shuts_down_worker_pool(self, server):
+        """Test stopping the server shuts down the pool passed to the registrar."""
+        workers = server.database_workers
+        workers._get_executor()
+
+        assert server.stop_sync()
+
+        assert isinstance(workers, DatabaseWorkerPool)
+        assert workers._executor is None
+
+    def test_stop_closes_pooled_connections(self, server, tmp_path):
+        """Test stopping the server closes the pooled database connections."""
+        import sqlite3
+
+        from instrmcp.servers.jupyter_qcodes.options.database import (
+            get_connection_pool,
+        )
+
+        db = tmp_path / "data.db"
+        sqlite3.connect(str(db)).close()
+        with get_connection_pool().connection(str(db)) as conn:
+            pass
+
+        assert server.stop_sync()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
@@ -0,0 +1,1036 @@
+"""
+Unit tests for the QCodes backend read path.
+
+Tests batch parameter reads, single-flight coalescing, the parameter path
+index, glob pattern queries, array results, the QCoDeS driver cache,
+versioned station snapshots, background subscriptions, parameter history and
+warm-start persistence in QCodesBackend. Reads use a mocked live read or tiny real qcodes
+instruments, so no hardware is required.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+import pytest_asyncio
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from instrmcp.servers.jupyter_qcodes.backend.base import SharedState
+from instrmcp.servers.jupyter_qcodes.backend.qcodes import QCodesBackend
+from instrmcp.servers.jupyter_qcodes.tools import QCodesReadOnlyTools
+from instrmcp.servers.jupyter_qcodes.warm_start import WarmStartStore
+
+
+def _make_state(namespace):
+    return SharedState(
+        ipython=MagicMock(),
+        namespace=namespace,
+        cache=MagicMock(),
+        rate_limiter=MagicMock(),
+        poller=MagicMock(),
+    )
+
+
+def _make_dac(channels: int = 2):
+    from qcodes.instrument import Instrument, InstrumentChannel
+
+    inst = Instrument("test_dac")
+    for i in range(1, channels + 1):
+        channel = InstrumentChannel(inst, f"ch0{i}")
+        channel.add_parameter("voltage", get_cmd=lambda i=i: float(i), set_cmd=None)
+        inst.add_submodule(f"ch0{i}", channel)
+    inst.add_parameter("mode", get_cmd=lambda: "dc", set_cmd=None)
+    return inst
+
+
+@pytest.fixture
+def dac():
+    """Tiny real qcodes instrument with two channels."""
+    from qcodes.instrument import Instrument
+
+    Instrument.close_all()
+    inst = _make_dac()
+    yield inst
+    inst.close()
+
+
+@pytest_asyncio.fixture
+async def tools():
+    """Create a QCodesReadOnlyTools instance with a slow fake live read."""
+    mock_ipython = MagicMock()
+    mock_ipython.user_ns = {}
+    del mock_ipython.events
+
+    tools = QCodesReadOnlyTools(mock_ipython, min_interval_s=0.0)
+    tools.live_reads = []
+
+    async def fake_live_read(instrument_name, parameter_name):
+        tools.live_reads.append((instrument_name, parameter_name))
+        await asyncio.sleep(0.1)
+        return f"{instrument_name}.{parameter_name}"
+
+    tools._qcodes._read_parameter_live = fake_live_read
+    return tools
+
+
+class TestBatchParameterValues:
+    """Test instrument-grouped batch reads in get_parameter_values."""
+
+    @pytest.mark.asyncio
+    async def test_batch_results_in_request_order(self, tools):
+        """Test results come back in request order across instruments."""
+        queries = [
+            {"instrument": "dac", "parameter": "ch01.voltage"},
+            {"instrument": "dmm", "parameter": "volt"},
+            {"instrument": "dac", "parameter": "ch02.voltage"},
+            {"instrument": "vna", "parameter": "trace"},
+        ]
+
+        results = await tools.get_parameter_values(queries)
+
+        assert [r["query"] for r in results] == queries
+        assert [r["value"] for r in results] == [
+            "dac.ch01.voltage",
+            "dmm.volt",
+            "dac.ch02.voltage",
+            "vna.trace",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_different_instruments_read_concurrently(self, tools):
+        """Test a cross-instrument batch takes about as long as one read."""
+        queries = [
+            {"instrument": name, "parameter": "value"}
+            for name in ("dac", "dmm", "vna", "lockin")
+        ]
+
+        start = time.perf_counter()
+        results = await tools.get_parameter_values(queries)
+        elapsed = time.perf_counter() - start
+
+        assert all(r["source"] == "live" for r in results)
+        assert elapsed < 0.3, f"Expected concurrent reads, took {elapsed:.3f}s"
+
+    @pytest.mark.asyncio
+    async def test_same_instrument_reads_serialized(self, tools):
+        """Test reads on one instrument are serialized in request order."""
+        queries = [
+            {"instrument": "dac", "parameter": f"ch0{i}.voltage"} for i in range(1, 4)
+        ]
+
+        start = time.perf_counter()
+        await tools.get_parameter_values(queries)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed >= 0.29, f"Expected serialized reads, took {elapsed:.3f}s"
+        assert tools.live_reads == [
+            ("dac", "ch01.voltage"),
+            ("dac", "ch02.voltage"),
+            ("dac", "ch03.voltage"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_malformed_query_reports_error_in_place(self, tools):
+        """Test a malformed query yields an error result at its position."""
+        queries = [
+            {"instrument": "dac", "parameter": "ch01.voltage"},
+            {"parameter": "missing_instrument"},
+        ]
+
+        results = await tools.get_parameter_values(queries)
+
+        assert results[0]["source"] == "live"
+        assert results[1]["source"] == "error"
+        assert results[1]["query"] == queries[1]
+
+
+class TestPatternQueries:
+    """Test glob pattern expansion in get_parameter_values."""
+
+    @pytest_asyncio.fixture
+    async def pattern_tools(self, dac):
+        from qcodes.instrument import Instrument
+
+        fridge = Instrument("test_fridge")
+        fridge.add_parameter("temperature", get_cmd=lambda: 0.01, set_cmd=None)
+        ipython = MagicMock()
+        ipython.user_ns = {"dac": dac, "fridge": fridge, "x": 1}
+        del ipython.events
+        tools = QCodesReadOnlyTools(ipython, min_interval_s=0.0)
+        yield tools
+        await tools.cleanup()
+        fridge.close()
+
+    @pytest.mark.asyncio
+    async def test_parameter_glob_expands_in_index_order(self, pattern_tools):
+        """Test a parameter glob expands to every matching channel."""
+        results = await pattern_tools.get_parameter_values(
+            {"instrument": "dac", "parameter": "ch*.voltage", "fresh": True}
+        )
+
+        assert [r["query"]["parameter"] for r in results] == [
+            "ch01.voltage",
+            "ch02.voltage",
+        ]
+        assert [r["value"] for r in results] == [1.0, 2.0]
+        assert all(r["query"]["pattern"] == "dac.ch*.voltage" for r in results)
+        assert all(r["query"]["fresh"] is True for r in results)
+
+    @pytest.mark.asyncio
+    async def test_pattern_key_matches_across_instruments(self, pattern_tools):
+        """Test {"pattern": "*.temperature"} finds the parameter on any instrument."""
+        results = await pattern_tools.get_parameter_values(
+            [{"pattern": "*.temperature"}, {"instrument": "dac", "parameter": "mode"}]
+        )
+
+        assert [(r["query"]["instrument"], r["value"]) for r in results] == [
+            ("fridge", 0.01),
+            ("dac", "dc"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unmatched_pattern_reports_error_in_place(self, pattern_tools):
+        """Test a pattern matching nothing yields one error result."""
+        results = await pattern_tools.get_parameter_values(
+            [{"pattern": "dac.ch*.current"}, {"instrument": "dac", "parameter": "mode"}]
+        )
+
+        assert results[0]["source"] == "error"
+        assert "dac.ch*.current" in results[0]["error"]
+        assert results[1]["value"] == "dc"
+
+    @pytest.mark.asyncio
+    async def test_expansion_uses_cached_index(self, pattern_tools, monkeypatch):
+        """Test repeated pattern queries do not rediscover parameters."""
+        backend = pattern_tools._qcodes
+        await backend.get_parameter_values({"pattern": "dac.*"})
+
+        def fail(*args, **kwargs):
+            raise AssertionError("parameter discovery should be cached")
+
+        monkeypatch.setattr(backend, "_build_parameter_index", fail)
+        results = await backend.get_parameter_values({"pattern": "dac.*"})
+
+        assert sorted(r["query"]["parameter"] for r in results) == [
+            "ch01.voltage",
+            "ch02.voltage",
+            "mode",
+        ]
+
+
+class TestArrayResults:
+    """Test array-valued parameters in get_parameter_values."""
+
+    @pytest.mark.asyncio
+    async def test_trace_summarized_unless_requested(self):
+        """Test a 100k-point trace is summarized, with full data on request."""
+        from qcodes.instrument import Instrument
+
+        vna = Instrument("test_vna")
+        vna.add_parameter(
+            "trace", get_cmd=lambda: np.linspace(0, 1, 100_000), set_cmd=None
+        )
+        ipython = MagicMock()
+        ipython.user_ns = {"vna": vna}
+        del ipython.events
+        tools = QCodesReadOnlyTools(ipython, min_interval_s=0.0)
+        try:
+            summary, full, bad = await tools.get_parameter_values(
+                [
+                    {"instrument": "vna", "parameter": "trace"},
+                    {"instrument": "vna", "parameter": "trace", "array": "full"},
+                    {"instrument": "vna", "parameter": "trace", "array": "csv"},
+                ]
+            )
+        finally:
+            await tools.cleanup()
+            vna.close()
+
+        assert summary["value"]["shape"] == [100_000]
+        assert summary["value"]["encoding"] == "summary"
+        assert len(full["value"]) == 100_000
+        assert bad["source"] == "error"
+
+
+class TestSingleFlightReads:
+    """Test coalescing of concurrent identical live reads."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fresh_reads_share_one_hardware_read(self, tools):
+        """Test concurrent fresh reads of one parameter hit hardware once."""
+        results = await asyncio.gather(
+            *(
+                tools._get_single_parameter_value("dac", "ch01.voltage", fresh=True)
+                for _ in range(3)
+            )
+        )
+
+        assert tools.live_reads == [("dac", "ch01.voltage")]
+        sources = sorted(r["source"] for r in results)
+        assert sources == ["coalesced", "coalesced", "live"]
+        assert len({r["timestamp"] for r in results}) == 1
+        assert all(r["value"] == "dac.ch01.voltage" for r in results)
+
+        stats = await tools.cache.get_stats()
+        assert stats["coalesced_reads"] == 2
+
+    @pytest.mark.asyncio
+    async def test_different_parameters_are_not_coalesced(self, tools):
+        """Test reads of different parameters each go to hardware."""
+        await asyncio.gather(
+            tools._get_single_parameter_value("dac", "ch01.voltage", fresh=True),
+            tools._get_single_parameter_value("dac", "ch02.voltage", fresh=True),
+        )
+
+        assert len(tools.live_reads) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_read_propagates_to_followers(self, tools):
+        """Test attached callers see the error of the shared read."""
+
+        async def failing_read(instrument_name, parameter_name):
+            tools.live_reads.append((instrument_name, parameter_name))
+            await asyncio.sleep(0.05)
+            raise RuntimeError("VISA timeout")
+
+        tools._qcodes._read_parameter_live = failing_read
+
+        results = await asyncio.gather(
+            tools._get_single_parameter_value("dmm", "volt", fresh=True),
+            tools._get_single_parameter_value("dmm", "volt", fresh=True),
+            return_exceptions=True,
+        )
+
+        assert len(tools.live_reads) == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert tools._qcodes._inflight == {}
+
+
+class TestParameterIndex:
+    """Test the per-instrument parameter path index."""
+
+    def test_resolves_hierarchical_paths(self, dac):
+        """Test direct and channel parameters resolve to their objects."""
+        backend = QCodesBackend(_make_state({"dac": dac}))
+
+        assert backend._get_parameter("dac", "ch01.voltage") is dac.ch01.voltage
+        assert backend._get_parameter("dac", "mode") is dac.mode
+
+    def test_index_built_once(self, dac, monkeypatch):
+        """Test discovery runs once for repeated lookups."""
+        backend = QCodesBackend(_make_state({"dac": dac}))
+        calls = []
+        original = backend._discover_parameters_recursive
+
+        def counting_discover(obj, *args, **kwargs):
+            if not args and "prefix" not in kwargs:
+                calls.append(obj)
+            return original(obj, *args, **kwargs)
+
+        monkeypatch.setattr(
+            backend, "_discover_parameters_recursive", counting_discover
+        )
+
+        for _ in range(5):
+            backend._get_parameter("dac", "ch02.voltage")
+
+        assert len(calls) == 1
+
+    def test_index_invalidated_when_submodule_added(self, dac):
+        """Test adding a channel rebuilds the index."""
+        from qcodes.instrument import InstrumentChannel
+
+        backend = QCodesBackend(_make_state({"dac": dac}))
+        backend._get_parameter("dac", "ch01.voltage")
+
+        channel = InstrumentChannel(dac, "ch03")
+        channel.add_parameter("voltage", get_cmd=lambda: 3.0, set_cmd=None)
+        dac.add_submodule("ch03", channel)
+
+        assert backend._get_parameter("dac", "ch03.voltage") is channel.voltage
+        assert "ch03.voltage" in backend._param_index.entries["dac"].parameters
+
+    def test_index_invalidated_when_namespace_rebound(self, dac):
+        """Test rebinding the namespace name to another instrument."""
+        from qcodes.instrument import Instrument
+
+        namespace = {"dac": dac}
+        backend = QCodesBackend(_make_state(namespace))
+        backend._get_parameter("dac", "mode")
+
+        other = Instrument("other_dac")
+        other.add_parameter("mode", get_cmd=lambda: "ac", set_cmd=None)
+        try:
+            namespace["dac"] = other
+            assert backend._get_parameter("dac", "mode") is other.mode
+        finally:
+            other.close()
+
+    def test_unindexed_parameter_falls_back_to_walk(self, dac):
+        """Test IDN (excluded from discovery) still resolves."""
+        backend = QCodesBackend(_make_state({"dac": dac}))
+
+        assert backend._get_parameter("dac", "IDN") is dac.IDN
+
+    def test_channel_list_channels_indexed(self, dac):
+        """Test channels only reachable through a channel list are discovered."""
+        from qcodes.instrument import ChannelList, InstrumentChannel
+
+        channels = ChannelList(dac, "outputs", InstrumentChannel)
+        for name in ("A", "B"):
+            channel = InstrumentChannel(dac, name)
+            channel.add_parameter("level", get_cmd=lambda: 0.5, set_cmd=None)
+            channels.append(channel)
+        dac.add_submodule("outputs", channels.to_channel_tuple())
+        backend = QCodesBackend(_make_state({"dac": dac}))
+
+        assert backend._get_parameter("dac", "outputs.B.level") is channels[1].level
+        indexed = backend._param_index.entries["dac"].parameters
+        assert "outputs.A.level" in indexed
+        assert "ch01.voltage" in indexed
+
+    def test_channel_attribute_outside_submodules_indexed(self, dac):
+        """Test a channel kept under an arbitrary attribute name is discovered."""
+        from qcodes.instrument import InstrumentChannel
+
+        probe = InstrumentChannel(dac, "probe")
+        probe.add_parameter("current", get_cmd=lambda: 1e-9, set_cmd=None)
+        dac.lockin_probe = probe
+        backend = QCodesBackend(_make_state({"dac": dac}))
+
+        backend._get_parameter("dac", "mode")
+
+        indexed = backend._param_index.entries["dac"].parameters
+        assert indexed["lockin_probe.current"] is probe.current
+
+    def test_missing_channel_lists_available(self, dac):
+        """Test error message for unknown channel names the indexed channels."""
+        backend = QCodesBackend(_make_state({"dac": dac}))
+
+        with pytest.raises(ValueError, match="ch01"):
+            backend._get_parameter("dac", "ch09.voltage")
+
+
+class TestInstrumentIO:
+    """Test routing of hardware calls to instrument executors."""
+
+    @pytest.mark.asyncio
+    async def test_live_read_runs_on_instrument_executor(self, dac):
+        """Test live reads use the instrument's executor, not the default pool."""
+        backend = QCodesBackend(_make_state({"dac": dac}))
+        try:
+            value = await backend._read_parameter_live("dac", "ch02.voltage")
+            stats = backend.instrument_io.get_stats()
+        finally:
+            backend.instrument_io.shutdown()
+
+        assert value == 2.0
+        assert stats["dac"]["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_blocked_discovery_keeps_loop_responsive(self, dac, monkeypatch):
+        """Test index discovery for a live read runs off the event loop."""
+        backend = QCodesBackend(_make_state({"dac": dac}))
+        release = threading.Event()
+        original = backend._discover_parameters_recursive
+
+        def blocking_discover(*args, **kwargs):
+            release.wait(5)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(
+            backend, "_discover_parameters_recursive", blocking_discover
+        )
+
+        try:
+            read = asyncio.create_task(
+                backend._read_parameter_live("dac", "ch02.voltage")
+            )
+            # The loop keeps running other work while discovery is blocked
+            await asyncio.wait_for(asyncio.sleep(0.05), timeout=1.0)
+            assert not read.done()
+
+            release.set()
+            value = await asyncio.wait_for(read, timeout=5.0)
+        finally:
+            release.set()
+            backend.instrument_io.shutdown()
+
+        assert value == 2.0
+
+    def test_gpib_instruments_share_bus_executor(self, dac):
+        """Test GPIB instruments are assigned to their bus group."""
+        dac._address = "GPIB0::5::INSTR"
+        backend = QCodesBackend(_make_state({"dac": dac}))
+
+        backend._assign_io_group("dac")
+
+        assert backend.instrument_io.group_for("dac") == "GPIB0"
+
+
+class TestCircuitBreaker:
+    """Test reads while an instrument's circuit breaker is open."""
+
+    @staticmethod
+    def _open_breaker(tools, instrument_name):
+        io = tools.instrument_io
+        for _ in range(io.failure_threshold - 1):
+            io._record_failure(instrument_name, TimeoutError("VI_ERROR_TMO"), None)
+        io.reset_timeout_s = 60.0
+        io._record_failure(instrument_name, TimeoutError("VI_ERROR_TMO"), None)
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_serves_stale_cache(self, tools):
+        """Test reads return the cached value immediately, marked stale."""
+        await tools.cache.set(("smu", "current"), 1e-9, time.time() - 30)
+        self._open_breaker(tools, "smu")
+
+        try:
+            result = await tools._get_single_parameter_value(
+                "smu", "current", fresh=True
+            )
+        finally:
+            tools.instrument_io.shutdown()
+
+        assert tools.live_reads == []
+        assert result["value"] == 1e-9
+        assert result["stale"] is True
+        assert result["circuit"]["state"] == "open"
+        assert "VI_ERROR_TMO" in result["message"]
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_without_cache_raises(self, tools):
+        """Test reads without a cached value fail fast."""
+        from instrmcp.servers.jupyter_qcodes.instrument_io import (
+            InstrumentUnavailable,
+        )
+
+        self._open_breaker(tools, "smu")
+        try:
+            with pytest.raises(InstrumentUnavailable, match="circuit open"):
+                await tools._get_single_parameter_value("smu", "current")
+        finally:
+            tools.instrument_io.shutdown()
+
+        assert tools.live_reads == []
+
+
+class TestCachedDiscovery:
+    """Test cached instrument discovery for list_instruments."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_listing_served_from_cache(self, dac, monkeypatch):
+        """Test discovery runs once across repeated listings."""
+        backend = QCodesBackend(_make_state({"dac": dac}))
+        builds = []
+        original = backend._build_parameter_index
+
+        def counting_build(*args, **kwargs):
+            builds.append(args[0])
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(backend, "_build_parameter_index", counting_build)
+
+        first = await backend.list_instruments()
+        second = await backend.list_instruments()
+
+        assert first == second
+        assert builds == ["dac"]
+        assert first[0]["all_parameters"] == ["mode", "ch01.voltage", "ch02.voltage"]
+        assert first[0]["channel_parameters"] == {
+            "ch01": ["ch01.voltage"],
+            "ch02": ["ch02.voltage"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_structure_change_triggers_rediscovery(self, dac):
+        """Test adding a parameter refreshes the cached summary."""
+        backend = QCodesBackend(_make_state({"dac": dac}))
+        await backend.list_instruments()
+
+        dac.add_parameter("output", get_cmd=lambda: 1, set_cmd=None)
+        listing = await backend.list_instruments()
+
+        assert "output" in listing[0]["parameters"]
+
+    @pytest.mark.asyncio
+    async def test_sync_instruments_tracks_added_and_removed(self, dac):
+        """Test post_run_cell reconciliation of the instrument roster."""
+        from qcodes.instrument import Instrument
+
+        namespace = {"dac": dac, "x": 1}
+        backend = QCodesBackend(_make_state(namespace))
+        await backend.list_instruments()
+        assert "dac" in backend._param_index.entries
+
+        other = Instrument("test_dmm")
+        try:
+            namespace["dmm"] = other
+            del namespace["dac"]
+
+            changes = backend.sync_instruments()
+
+            assert changes == {"added": ["dmm"], "removed": ["dac"]}
+            assert "dac" not in backend._param_index.entries
+            names = [i["name"] for i in await backend.list_instruments()]
+            assert names == ["dmm"]
+        finally:
+            other.close()
+
+    def test_post_run_cell_syncs_instruments(self, dac):
+        """Test the post_run_cell hook refreshes the instrument roster."""
+        ipython = MagicMock()
+        ipython.user_ns = {}
+        tools = QCodesReadOnlyTools(ipython)
+
+        ipython.user_ns["dac"] = dac
+        tools._mark_cell_complete(None)
+
+        assert tools._qcodes._instrument_names == ["dac"]
+
+
+class TestStationSnapshot:
+    """Test the versioned structural station snapshot."""
+
+    @pytest.fixture
+    def station_backend(self, dac):
+        from qcodes.station import Station
+
+        station = Station(dac)
+        backend = QCodesBackend(_make_state({"dac": dac, "station": station}))
+        yield backend, station
+        backend.instrument_io.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_snapshot_is_value_free_and_cached(self, station_backend):
+        """Test instruments are captured once and served without values."""
+        backend, _ = station_backend
+
+        first = await backend.get_station_snapshot()
+        second = await backend.get_station_snapshot()
+
+        voltage = first["snapshot"]["instruments"]["test_dac"]["submodules"]["ch01"][
+            "parameters"
+        ]["voltage"]
+        assert "value" not in voltage
+        assert first["station"] == "station"
+        assert first["version"] == second["version"]
+        # test_dac once; the small station-level parts on every call
+        assert backend._snapshots.captures == 3
+        assert backend._snapshots.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_since_version_returns_only_changes(self, station_backend, dac):
+        """Test delta snapshots include only instruments changed after a version."""
+        backend, _ = station_backend
+        version = (await backend.get_station_snapshot())["version"]
+
+        unchanged = await backend.get_station_snapshot(since_version=version)
+        dac.mode.label = "Mode switch"
+        changed = await backend.get_station_snapshot(
+            since_version=version, refresh=True
+        )
+
+        assert unchanged["full"] is False
+        assert unchanged["snapshot"] == {"instruments": {}}
+        assert list(changed["snapshot"]["instruments"]) == ["test_dac"]
+        assert changed["version"] > version
+
+    @pytest.mark.asyncio
+    async def test_structure_change_recaptures(self, station_backend, dac):
+        """Test adding a parameter invalidates the cached instrument snapshot."""
+        backend, _ = station_backend
+        version = (await backend.get_station_snapshot())["version"]
+
+        dac.add_parameter("offset", get_cmd=lambda: 0.0, set_cmd=None)
+        result = await backend.get_station_snapshot(
+            since_version=version, path="instruments.*.parameters.offset.name"
+        )
+
+        assert result["matches"] == {
+            "$.instruments.test_dac.parameters.offset.name": "offset"
+        }
+
+    @pytest.mark.asyncio
+    async def test_removed_instruments_are_reported(self, station_backend):
+        """Test instruments leaving the station are listed as removed."""
+        backend, station = station_backend
+        version = (await backend.get_station_snapshot())["version"]
+
+        station.remove_component("test_dac")
+        result = await backend.get_station_snapshot(since_version=version)
+
+        assert result["removed"] == ["test_dac"]
+
+    @pytest.mark.asyncio
+    async def test_slow_and_failing_instruments_are_isolated(
+        self, station_backend, monkeypatch
+    ):
+        """Test per-instrument captures run in parallel with their own status."""
+        from qcodes.instrument import Instrument
+
+        backend, station = station_backend
+        slow = Instrument("test_slow")
+        broken = Instrument("test_broken")
+        monkeypatch.setattr(
+            slow, "snapshot", lambda update=False: time.sleep(0.5) or {}
+        )
+
+        def fail(update=False):
+            raise RuntimeError("bus error")
+
+        monkeypatch.setattr(broken, "snapshot", fail)
+        station.add_component(slow)
+        station.add_component(broken)
+        try:
+            start = time.perf_counter()
+            result = await backend.get_station_snapshot(timeout_s=0.2)
+            elapsed = time.perf_counter() - start
+        finally:
+            slow.close()
+            broken.close()
+
+        assert elapsed < 0.45, f"Expected bounded latency, took {elapsed:.3f}s"
+        assert result["status"]["test_dac"]["status"] == "ok"
+        assert result["status"]["test_slow"]["status"] == "timeout"
+        assert result["status"]["test_broken"] == {
+            "status": "error",
+            "error": "bus error",
+            "elapsed_ms": result["status"]["test_broken"]["elapsed_ms"],
+            "stale": False,
+        }
+        assert list(result["snapshot"]["instruments"]) == ["test_dac"]
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_serves_stale_snapshot(
+        self, station_backend, dac, monkeypatch
+    ):
+        """Test a failing instrument keeps its last snapshot, marked stale."""
+        backend, _ = station_backend
+        await backend.get_station_snapshot()
+
+        def fail(update=False):
+            raise RuntimeError("bus error")
+
+        monkeypatch.setattr(dac, "snapshot", fail)
+        result = await backend.get_station_snapshot(refresh=True)
+
+        assert result["status"]["test_dac"]["status"] == "error"
+        assert result["status"]["test_dac"]["stale"] is True
+        assert "test_dac" in result["snapshot"]["instruments"]
+
+    @pytest.mark.asyncio
+    async def test_without_station_covers_namespace(self, dac):
+        """Test the snapshot falls back to namespace instruments."""
+        backend = QCodesBackend(_make_state({"dac": dac}))
+
+        result = await backend.get_station_snapshot()
+        backend.instrument_io.shutdown()
+
+        assert result["station"] is None
+        assert list(result["snapshot"]["instruments"]) == ["dac"]
+
+    @pytest.mark.asyncio
+    async def test_instrument_info_reuses_structural_snapshot(self, dac):
+        """Test instrument_info serves the cached snapshot without mutating it."""
+        backend = QCodesBackend(_make_state({"dac": dac}))
+
+        first = await backend.instrument_info("dac")
+        second = await backend.instrument_info("dac")
+        backend.instrument_io.shutdown()
+
+        assert backend._snapshots.hits == 1
+        assert "IDN" not in second["parameters"]
+        assert "IDN" in backend._snapshots.entries["dac"].snapshot["parameters"]
+        assert first["hierarchy_info"] == second["hierarchy_info"]
+
+
+class TestDriverCache:
+    """Test reads served from the parameters' own QCoDeS cache."""
+
+    @pytest_asyncio.fixture
+    async def dac_tools(self, dac):
+        ipython = MagicMock()
+        ipython.user_ns = {"dac": dac}
+        del ipython.events
+        tools = QCodesReadOnlyTools(ipython, min_interval_s=0.0)
+        yield tools
+        await tools.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_recent_driver_value_served_without_hardware(self, dac_tools, dac):
+        """Test a value set elsewhere in the kernel is reused within max_age_s."""
+        dac.ch01.voltage.cache.set(5.0)
+
+        result = await dac_tools._get_single_parameter_value(
+            "dac", "ch01.voltage", max_age_s=10.0
+        )
+        again = await dac_tools._get_single_parameter_value(
+            "dac", "ch01.voltage", max_age_s=10.0
+        )
+
+        assert result["source"] == "driver_cache"
+        assert result["value"] == 5.0
+        # Adopted into the read cache, which now agrees with the driver
+        assert again["source"] == "cache"
+        assert again["value"] == 5.0
+
+    @pytest.mark.asyncio
+    async def test_newer_driver_value_supersedes_read_cache(self, dac_tools, dac):
+        """Test the newer of the two caches wins."""
+        first = await dac_tools._get_single_parameter_value(
+            "dac", "ch01.voltage", fresh=True
+        )
+        dac.ch01.voltage.cache.set(7.0)
+
+        result = await dac_tools._get_single_parameter_value(
+            "dac", "ch01.voltage", max_age_s=10.0
+        )
+
+        assert first["value"] == 1.0
+        assert result["source"] == "driver_cache"
+        assert result["value"] == 7.0
+
+    @pytest.mark.asyncio
+    async def test_old_driver_value_triggers_live_read(self, dac_tools, dac):
+        """Test driver values older than max_age_s are not used."""
+        dac.ch01.voltage.cache.set(5.0)
+        await asyncio.sleep(0.1)
+
+        result = await dac_tools._get_single_parameter_value(
+            "dac", "ch01.voltage", max_age_s=0.05
+        )
+
+        assert result["source"] == "live"
+        assert result["value"] == 1.0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("valid_checks_age", [True, False])
+    async def test_driver_value_past_max_val_age_triggers_live_read(
+        self, dac_tools, dac, monkeypatch, valid_checks_age
+    ):
+        """Test driver values older than the parameter's max_val_age are not used."""
+        param = dac.ch01.voltage
+        param.cache.set(5.0)
+        param.cache._max_val_age = 0.05
+        if not valid_checks_age:
+            # QCoDeS versions whose cache.valid ignores max_val_age
+            monkeypatch.setattr(
+                type(param.cache), "valid", property(lambda c: c._marked_valid)
+            )
+        await asyncio.sleep(0.1)
+
+        entry = await dac_tools._qcodes._driver_cache_entry("dac", "ch01.voltage")
+        result = await dac_tools._get_single_parameter_value(
+            "dac", "ch01.voltage", max_age_s=10.0
+        )
+
+        assert entry is None
+        assert result["source"] == "live"
+        assert result["value"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_driver_cache_ignored_without_age_limit(self, dac_tools, dac):
+        """Test reads without max_age_s or TTL keep their previous behavior."""
+        dac.ch01.voltage.cache.set(5.0)
+
+        result = await dac_tools._get_single_parameter_value("dac", "ch01.voltage")
+
+        assert result["source"] == "live"
+
+
+class TestSubscriptions:
+    """Test background parameter subscriptions through the tools facade."""
+
+    @pytest.mark.asyncio
+    async def test_subscription_keeps_cache_warm(self, dac):
+        """Test a subscribed parameter is served from cache afterwards."""
+        ipython = MagicMock()
+        ipython.user_ns = {"dac": dac}
+        del ipython.events
+        tools = QCodesReadOnlyTools(ipython, min_interval_s=0.0)
+
+        try:
+            result = await tools.subscribe_parameter("dac", "ch01.voltage", 10.0)
+            assert result["subscribed"] is True
+            await asyncio.sleep(0.1)
+
+            value = await tools._get_single_parameter_value(
+                "dac", "ch01.voltage", max_age_s=5.0
+            )
+            listing = await tools.list_subscriptions()
+        finally:
+            await tools.cleanup()
+
+        assert value["source"] == "cache"
+        assert value["value"] == 1.0
+        assert listing["count"] == 1
+        assert listing["subscriptions"][0]["polls"] == 1
+        assert listing["cache"]["size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_subscribe_unknown_parameter_fails_fast(self, dac):
+        """Test subscribing to a missing parameter raises immediately."""
+        backend = QCodesBackend(_make_state({"dac": dac}))
+
+        with pytest.raises(ValueError):
+            await backend.subscribe_parameter("dac", "nope", 1.0)
+        backend.poller.subscribe.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_reports_whether_subscribed(self, tools):
+        """Test unsubscribing an unknown parameter is harmless."""
+        result = await tools.unsubscribe_parameter("dac", "ch01.voltage")
+
+        assert result["unsubscribed"] is False
+
+
+class TestWarmStart:
+    """Test restoring read-path state after a restart."""
+
+    @staticmethod
+    def _tools(namespace, path, monkeypatch):
+        from instrmcp.servers.jupyter_qcodes import tools as tools_module
+        from instrmcp.utils.instrument_policy import InstrumentPolicyConfig
+
+        config = InstrumentPolicyConfig(persistence={"enabled": True, "path": path})
+        monkeypatch.setattr(tools_module, "load_policies", lambda: config)
+        ipython = MagicMock()
+        ipython.user_ns = namespace
+        del ipython.events
+        return QCodesReadOnlyTools(ipython, min_interval_s=0.0)
+
+    async def _run_first_session(self, dac, path, monkeypatch):
+        tools = self._tools({"dac": dac}, path, monkeypatch)
+        await tools.get_parameter_values(
+            {"instrument": "dac", "parameter": "ch01.voltage", "fresh": True}
+        )
+        await tools.subscribe_parameter("dac", "ch02.voltage", 30.0)
+        await tools.list_instruments()
+        await tools.cleanup()
+        dac.close()
+
+    @pytest.mark.asyncio
+    async def test_restart_restores_values_index_and_subscriptions(
+        self, dac, tmp_path, monkeypatch
+    ):
+        """Test a new server serves saved values without hardware or discovery."""
+        path = tmp_path / "warm.sqlite"
+        await self._run_first_session(dac, path, monkeypatch)
+
+        new_dac = _make_dac()
+        tools = self._tools({"dac": new_dac}, path, monkeypatch)
+        backend = tools._qcodes
+
+        def fail(*args, **kwargs):
+            raise AssertionError("should be restored, not rediscovered")
+
+        monkeypatch.setattr(backend, "_build_parameter_index", fail)
+        try:
+            result = await tools.get_parameter_values(
+                {"instrument": "dac", "parameter": "ch01.voltage"}
+            )
+            listing = await tools.list_instruments()
+            subscriptions = await tools.list_subscriptions()
+        finally:
+            await tools.cleanup()
+            new_dac.close()
+
+        assert result["source"] == "restored"
+        assert result["stale"] is True
+        assert result["value"] == 1.0
+        assert listing[0]["parameter_count"] == 3
+        assert [s["parameter"] for s in subscriptions["subscriptions"]] == [
+            "ch02.voltage"
+        ]
+        assert subscriptions["warm_start"]["restored_instruments"] == 1
+
+    @pytest.mark.asyncio
+    async def test_restored_values_are_old_and_not_history(
+        self, dac, tmp_path, monkeypatch
+    ):
+        """Test restored values keep their read time and stay out of history."""
+        path = tmp_path / "warm.sqlite"
+        await self._run_first_session(dac, path, monkeypatch)
+        saved = WarmStartStore(path).load()["dac"].values["ch01.voltage"][1]
+        time.sleep(0.05)
+
+        new_dac = _make_dac()
+        tools = self._tools({"dac": new_dac}, path, monkeypatch)
+        query = {"instrument": "dac", "parameter": "ch01.voltage"}
+        try:
+            restored = await tools.get_parameter_values(query)
+            with pytest.raises(ValueError, match="qcodes_subscribe_parameter"):
+                await tools.get_parameter_history("dac", "ch01.voltage")
+            read = await tools.get_parameter_values({**query, "max_age_s": 0.01})
+            cached = await tools.get_parameter_values(query)
+        finally:
+            await tools.cleanup()
+            new_dac.close()
+
+        assert restored["source"] == "restored"
+        assert restored["stale"] is True
+        assert restored["timestamp"] == saved
+        assert restored["age_seconds"] >= 0.05
+        assert read["source"] == "live"
+        assert cached["source"] == "cache"
+        assert cached["stale"] is False
+
+    @pytest.mark.asyncio
+    async def test_changed_instrument_is_not_restored(self, dac, tmp_path, monkeypatch):
+        """Test saved state is discarded when the instrument's structure differs."""
+        path = tmp_path / "warm.sqlite"
+        await self._run_first_session(dac, path, monkeypatch)
+
+        new_dac = _make_dac(channels=3)
+        tools = self._tools({"dac": new_dac}, path, monkeypatch)
+        try:
+            subscriptions = await tools.list_subscriptions()
+        finally:
+            await tools.cleanup()
+            new_dac.close()
+
+        assert subscriptions["count"] == 0
+        assert subscriptions["cache"]["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_state_kept_until_instrument_is_recreated(
+        self, dac, tmp_path, monkeypatch
+    ):
+        """Test a session without the instrument does not erase its saved state."""
+        path = tmp_path / "warm.sqlite"
+        await self._run_first_session(dac, path, monkeypatch)
+
+        idle = self._tools({}, path, monkeypatch)
+        await idle.list_subscriptions()
+        await idle.cleanup()
+
+        assert "dac" in idle.warm_start.load()
+
+
+class TestParameterHistory:
+    """Test history queries through the tools facade."""
+
+    @pytest.mark.asyncio
+    async def test_live_reads_are_recorded(self, tools):
+        """Test history is served from recorded reads, not hardware."""
+        tools._qcodes._read_parameter_live = None
+        for value in (1.0, 2.0, 3.0):
+            await tools.cache.set(("fridge", "mxc_temperature"), value)
+
+        result = await tools.get_parameter_history(
+            "fridge", "mxc_temperature", method="lttb"
+        )
+
+        assert result["count"] == 3
+        assert result["mean"] == 2.0
+        assert [point[1] for point in result["series"]] == [1.0, 2.0, 3.0]
+
+    @pytest.mark.asyncio
+    async def test_missing_history_suggests_subscription(self, tools):
+        """Test the error for a parameter without recorded reads."""
+        with pytest.raises(ValueError, match="qcodes_subscribe_parameter"):
+            await tools.get_parameter_history("fridge", "mxc_temperature")
@@ -39,6 +39,11 @@ class TestQCodesToolRegistrar:
         tools = MagicMock()
         tools.instrument_info = AsyncMock()
         tools.get_parameter_values = AsyncMock()
+        tools.subscribe_parameter = AsyncMock()
+        tools.unsubscribe_parameter = AsyncMock()
+        tools.list_subscriptions = AsyncMock()
+        tools.get_parameter_history = AsyncMock()
+        tools.get_station_snapshot = AsyncMock()
         return tools
 
     @pytest.fixture
@@ -162,6 +167,60 @@ class TestQCodesToolRegistrar:
         assert response_data == mock_result
         mock_tools.get_parameter_values.assert_called_once_with(queries)
 
+    @pytest.mark.asyncio
+    async def test_get_parameter_values_concise_keeps_stale_markers(
+        self, registrar, mock_tools, mock_mcp_server
+    ):
+        """Test concise mode keeps the markers of a stale cached value."""
+        query = {"instrument": "mock_dac", "parameter": "ch01.voltage"}
+        mock_tools.get_parameter_values.return_value = {
+            "query": query,
+            "value": 3.14,
+            "timestamp": 1234567890,
+            "source": "cache",
+            "stale": True,
+            "circuit": {"state": "open", "last_error": "VISA timeout"},
+            "message": "Instrument 'mock_dac' is unavailable",
+        }
+
+        registrar.register_all()
+        get_values_func = mock_mcp_server._tools["qcodes_get_parameter_values"]
+        result = await get_values_func(queries=json.dumps(query))
+
+        response_data = json.loads(result[0].text)
+        assert response_data == {
+            "instrument": "mock_dac",
+            "parameter": "ch01.voltage",
+            "value": 3.14,
+            "stale": True,
+            "circuit": "open",
+            "message": "Instrument 'mock_dac' is unavailable",
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_parameter_values_concise_fresh_value(
+        self, registrar, mock_tools, mock_mcp_server
+    ):
+        """Test concise mode of a fresh value has no stale markers."""
+        query = {"instrument": "mock_dac", "parameter": "ch01.voltage"}
+        mock_tools.get_parameter_values.return_value = {
+            "query": query,
+            "value": 3.14,
+            "source": "live",
+            "stale": False,
+        }
+
+        registrar.register_all()
+        get_values_func = mock_mcp_server._tools["qcodes_get_parameter_values"]
+        result = await get_values_func(queries=json.dumps(query))
+
+        response_data = json.loads(result[0].text)
+        assert response_data == {
+            "instrument": "mock_dac",
+            "parameter": "ch01.voltage",
+            "value": 3.14,
+        }
+
     @pytest.mark.asyncio
     async def test_get_parameter_values_invalid_json(
         self, registrar, mock_tools, mock_mcp_server
@@ -230,3 +289,132 @@ class TestQCodesToolRegistrar:
         for tool_name in expected_tools:
             assert tool_name in mock_mcp_server._tools
             assert callable(mock_mcp_server._tools[tool_name])
+
+    @pytest.mark.asyncio
+    async def test_subscribe_parameter(self, registrar, mock_tools, mock_mcp_server):
+        """Test subscribing to a parameter."""
+        mock_tools.subscribe_parameter.return_value = {
+            "subscribed": True,
+            "instrument": "fridge",
+            "parameter": "mxc_temperature",
+            "interval_s": 5.0,
+        }
+
+        registrar.register_all()
+        subscribe_func = mock_mcp_server._tools["qcodes_subscribe_parameter"]
+        result = await subscribe_func(
+            instrument="fridge", parameter="mxc_temperature", interval_s=5.0
+        )
+
+        response_data = json.loads(result[0].text)
+        assert response_data["subscribed"] is True
+        mock_tools.subscribe_parameter.assert_called_once_with(
+            "fridge", "mxc_temperature", 5.0
+        )
+
+    @pytest.mark.asyncio
+    async def test_subscribe_parameter_error(
+        self, registrar, mock_tools, mock_mcp_server
+    ):
+        """Test subscribing to an unknown parameter reports the error."""
+        mock_tools.subscribe_parameter.side_effect = ValueError(
+            "Instrument 'fridge' not found in namespace"
+        )
+
+        registrar.register_all()
+        subscribe_func = mock_mcp_server._tools["qcodes_subscribe_parameter"]
+        result = await subscribe_func(instrument="fridge", parameter="t")
+
+        response_data = json.loads(result[0].text)
+        assert "not found" in response_data["error"]
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_parameter(self, registrar, mock_tools, mock_mcp_server):
+        """Test unsubscribing from a parameter."""
+        mock_tools.unsubscribe_parameter.return_value = {"unsubscribed": True}
+
+        registrar.register_all()
+        unsubscribe_func = mock_mcp_server._tools["qcodes_unsubscribe_parameter"]
+        result = await unsubscribe_func(instrument="fridge", parameter="t")
+
+        assert json.loads(result[0].text) == {"unsubscribed": True}
+        mock_tools.unsubscribe_parameter.assert_called_once_with("fridge", "t")
+
+    @pytest.mark.asyncio
+    async def test_list_subscriptions_concise_and_detailed(
+        self, registrar, mock_tools, mock_mcp_server
+    ):
+        """Test concise mode drops poller and cache statistics."""
+        mock_tools.list_subscriptions.return_value = {
+            "subscriptions": [
+                {
+                    "instrument": "fridge",
+                    "parameter": "t",
+                    "interval_s": 5.0,
+                    "next_read_in_s": 1.2,
+                    "last_read": 1234567890.0,
+                    "polls": 3,
+                    "errors": 0,
+                    "consecutive_failures": 0,
+                    "last_error": None,
+                }
+            ],
+            "count": 1,
+            "poller": {"batch_reads": 3, "overruns": 0, "active_tasks": 1},
+            "cache": {"size": 1, "hits": 2},
+        }
+
+        registrar.register_all()
+        list_func = mock_mcp_server._tools["qcodes_list_subscriptions"]
+
+        concise = json.loads((await list_func())[0].text)
+        assert concise == {
+            "subscriptions": [
+                {
+                    "instrument": "fridge",
+                    "parameter": "t",
+                    "interval_s": 5.0,
+                    "last_error": None,
+                }
+            ],
+            "count": 1,
+        }
+
+        detailed = json.loads((await list_func(detailed=True))[0].text)
+        assert detailed["cache"]["hits"] == 2
+        assert detailed["poller"]["batch_reads"] == 3
+
+    @pytest.mark.asyncio
+    async def test_get_parameter_history(self, registrar, mock_tools, mock_mcp_server):
+        """Test history queries pass window and decimation options."""
+        mock_tools.get_parameter_history.return_value = {"count": 3, "mean": 2.0}
+
+        registrar.register_all()
+        history_func = mock_mcp_server._tools["qcodes_get_parameter_history"]
+        result = await history_func(
+            instrument="fridge",
+            parameter="mxc_temperature",
+            window_s=3600,
+            method="minmax",
+        )
+
+        assert json.loads(result[0].text) == {"count": 3, "mean": 2.0}
+        mock_tools.get_parameter_history.assert_called_once_with(
+            "fridge", "mxc_temperature", 3600, "minmax", 200
+        )
+
+    @pytest.mark.asyncio
+    async def test_station_snapshot_passes_version_and_path(
+        self, registrar, mock_tools, mock_mcp_server
+    ):
+        """Test station snapshot forwards delta and selection options."""
+        mock_tools.get_station_snapshot.return_value = {"version": 4, "matches": {}}
+
+        registrar.register_all()
+        snapshot_func = mock_mcp_server._tools["qcodes_station_snapshot"]
+        result = await snapshot_func(since_version=3, path="instruments.*")
+
+        assert json.loads(result[0].text) == {"version": 4, "matches": {}}
+        mock_tools.get_station_snapshot.assert_called_once_with(
+            3, "instruments.*", False, None
+        )
@@ -10,10 +10,14 @@ import pytest_asyncio
 import asyncio
 import time
 from instrmcp.servers.jupyter_qcodes.cache import (
+    PRIORITY_INTERACTIVE,
+    PRIORITY_POLL,
     ReadCache,
     RateLimiter,
     ParameterPoller,
+    Subscription,
 )
+from instrmcp.servers.jupyter_qcodes.instrument_io import InstrumentIO
 
 
 class TestReadCache:
@@ -23,7 +27,7 @@ class TestReadCache:
     async def test_cache_initialization(self):
         """Test cache is initialized empty."""
         cache = ReadCache()
-        stats = await cache.get_stats()
+        stats = await cache.get_stats(include_keys=True)
         assert stats["size"] == 0
         assert stats["keys"] == []
 
@@ -92,7 +96,7 @@ class TestReadCache:
         t2 = time.time()
         await cache.set(("inst2", "param2"), 2.0, t2)
 
-        stats = await cache.get_stats()
+        stats = await cache.get_stats(include_keys=True)
         assert stats["size"] == 2
         assert len(stats["keys"]) == 2
         assert stats["oldest_timestamp"] == pytest.approx(t1, rel=0.01)
@@ -122,6 +126,173 @@ class TestReadCache:
         assert result is not None
         assert result[0] in [1, 2, 3]
 
+    @pytest.mark.asyncio
+    async def test_restored_entry_marked_until_replaced(self):
+        """Test warm-start values are marked restored and kept out of history."""
+        from instrmcp.servers.jupyter_qcodes.history import ParameterHistory
+
+        history = ParameterHistory()
+        cache = ReadCache(history=history)
+        key = ("inst", "param")
+        saved = time.time() - 60
+
+        await cache.set(key, 1.0, saved, restored=True)
+
+        assert cache.is_restored(key)
+        assert cache.peek(key) == (1.0, saved)
+        assert await cache.get(key, max_age_s=30) is None
+        assert key not in history.series
+        assert (await cache.get_stats())["restored"] == 1
+
+        await cache.set(key, 2.0)
+
+        assert not cache.is_restored(key)
+        assert key in history.series
+
+
+class TestReadCacheBudgets:
+    """Test LRU eviction, TTLs and max-age reads in ReadCache."""
+
+    @pytest.mark.asyncio
+    async def test_entry_budget_evicts_least_recently_used(self):
+        """Test the oldest-used entry is evicted when over the entry budget."""
+        cache = ReadCache(max_entries=2)
+        await cache.set(("inst", "a"), 1)
+        await cache.set(("inst", "b"), 2)
+
+        # Touch "a" so "b" becomes least recently used
+        await cache.get(("inst", "a"))
+        await cache.set(("inst", "c"), 3)
+
+        assert cache.peek(("inst", "b")) is None
+        assert cache.peek(("inst", "a")) is not None
+        stats = await cache.get_stats()
+        assert stats["size"] == 2
+        assert stats["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_byte_budget_evicts_large_arrays(self):
+        """Test array-valued entries are evicted by the byte budget."""
+        import numpy as np
+
+        cache = ReadCache(max_bytes=20_000)
+        trace = np.zeros(1000)  # 8000 bytes each
+        await cache.set(("vna", "trace1"), trace)
+        await cache.set(("vna", "trace2"), trace)
+        await cache.set(("vna", "trace3"), trace)
+
+        stats = await cache.get_stats()
+        assert stats["size"] == 2
+        assert stats["bytes"] <= 20_000
+        assert cache.peek(("vna", "trace1")) is None
+
+    @pytest.mark.asyncio
+    async def test_value_larger_than_budget_not_cached(self):
+        """Test a single value exceeding the byte budget is skipped."""
+        import numpy as np
+
+        cache = ReadCache(max_bytes=100)
+        await cache.set(("vna", "trace"), np.zeros(1000))
+
+        assert cache.peek(("vna", "trace")) is None
+        assert (await cache.get_stats())["bytes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_max_age_reports_old_entries_as_miss(self):
+        """Test get with max_age_s ignores older entries but keeps them."""
+        cache = ReadCache()
+        key = ("fridge", "mc_temperature")
+        await cache.set(key, 0.012, time.time() - 10)
+
+        assert await cache.get(key, max_age_s=5) is None
+        assert (await cache.get(key, max_age_s=60))[0] == 0.012
+        assert cache.peek(key)[0] == 0.012
+
+        stats = await cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["expired"] == 1
+
+    @pytest.mark.asyncio
+    async def test_parameter_ttl_overrides_instrument_ttl(self):
+        """Test TTL resolution order: parameter, instrument, default."""
+        cache = ReadCache(default_ttl_s=100)
+        cache.set_ttl("dmm", 1.0)
+        cache.set_ttl("dmm", 30.0, parameter_name="volt")
+
+        await cache.set(("dmm", "volt"), 1.5, time.time() - 10)
+        await cache.set(("dmm", "curr"), 0.1, time.time() - 10)
+        await cache.set(("dac", "ch01.voltage"), 0.0, time.time() - 10)
+
+        assert await cache.get(("dmm", "volt")) is not None
+        assert await cache.get(("dmm", "curr")) is None
+        assert await cache.get(("dac", "ch01.voltage")) is not None
+
+        cache.clear_ttl("dmm")
+        assert await cache.get(("dmm", "curr")) is not None
+
+
+class TestReadCacheIncrementalStats:
+    """Test incrementally maintained statistics and the lock-free read path."""
+
+    @pytest.mark.asyncio
+    async def test_stats_exclude_keys_by_default(self):
+        """Test get_stats does not list keys unless asked."""
+        cache = ReadCache()
+        await cache.set(("inst", "param"), 1.0)
+
+        assert "keys" not in await cache.get_stats()
+
+    @pytest.mark.asyncio
+    async def test_oldest_and_newest_track_overwrites_and_evictions(self):
+        """Test timestamps stay correct as entries are replaced and evicted."""
+        cache = ReadCache(max_entries=2)
+        await cache.set(("inst", "a"), 1, 100.0)
+        await cache.set(("inst", "b"), 2, 200.0)
+
+        stats = await cache.get_stats()
+        assert stats["oldest_timestamp"] == 100.0
+        assert stats["newest_timestamp"] == 200.0
+
+        # Overwrite the oldest entry with a newer timestamp
+        await cache.set(("inst", "a"), 3, 300.0)
+        stats = await cache.get_stats()
+        assert stats["oldest_timestamp"] == 200.0
+        assert stats["newest_timestamp"] == 300.0
+
+        # Evict "b" (least recently used) by inserting a third entry
+        await cache.set(("inst", "c"), 4, 50.0)
+        stats = await cache.get_stats()
+        assert stats["oldest_timestamp"] == 50.0
+        assert stats["newest_timestamp"] == 300.0
+
+        await cache.clear()
+        stats = await cache.get_stats()
+        assert stats["oldest_timestamp"] == 0
+        assert stats["bytes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_heaps_stay_bounded_under_overwrites(self):
+        """Test superseded heap items are compacted."""
+        cache = ReadCache()
+        for i in range(1000):
+            await cache.set(("inst", "param"), i, float(i))
+
+        assert len(cache._oldest_heap) <= ReadCache._HEAP_COMPACT_FACTOR * 17
+        stats = await cache.get_stats()
+        assert stats["oldest_timestamp"] == stats["newest_timestamp"] == 999.0
+
+    @pytest.mark.asyncio
+    async def test_get_does_not_take_writer_lock(self):
+        """Test reads succeed while the writer lock is held."""
+        cache = ReadCache()
+        await cache.set(("inst", "param"), 1.0)
+
+        with cache.lock:
+            result = await asyncio.wait_for(cache.get(("inst", "param")), 1.0)
+
+        assert result[0] == 1.0
+
 
 class TestRateLimiter:
     """Test RateLimiter class for instrument access rate limiting."""
@@ -206,6 +377,181 @@ class TestRateLimiter:
         assert isinstance(lock1, asyncio.Lock)
 
 
+class TestTokenBucketRateLimiter:
+    """Test token-bucket policies and fair queuing in RateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_burst_allows_back_to_back_reads(self):
+        """Test a burst of reads passes without waiting, then throttles."""
+        limiter = RateLimiter(min_interval_s=1.0)
+        limiter.set_policy("lockin", rate_hz=20.0, burst=3)
+
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire("lockin")
+            await limiter.record_access("lockin")
+        assert time.monotonic() - start < 0.03
+        assert await limiter.can_access("lockin") is False
+
+        await limiter.acquire("lockin")
+        assert time.monotonic() - start >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_default_policy_matches_min_interval(self):
+        """Test instruments without a policy get one read per interval."""
+        limiter = RateLimiter(min_interval_s=0.05)
+        limiter.set_policy("lockin", rate_hz=None)
+
+        await limiter.acquire("dmm")
+        start = time.monotonic()
+        await limiter.acquire("dmm")
+        assert time.monotonic() - start >= 0.04
+
+        # Unlimited instrument never waits
+        for _ in range(10):
+            await limiter.acquire("lockin")
+        assert await limiter.can_access("lockin") is True
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquires_are_spaced(self):
+        """Test concurrent callers cannot pass the limiter together."""
+        limiter = RateLimiter(min_interval_s=0.05)
+        grants = []
+
+        async def reader():
+            await limiter.acquire("inst1")
+            grants.append(time.monotonic())
+
+        await asyncio.gather(*(reader() for _ in range(3)))
+
+        gaps = [b - a for a, b in zip(grants, grants[1:])]
+        assert all(gap >= 0.04 for gap in gaps), gaps
+
+    @pytest.mark.asyncio
+    async def test_interactive_reads_served_before_polls(self):
+        """Test queued interactive reads overtake queued poll reads."""
+        limiter = RateLimiter(min_interval_s=0.03)
+        await limiter.acquire("inst1")
+        order = []
+
+        async def reader(label, priority):
+            await limiter.acquire("inst1", priority)
+            order.append(label)
+
+        polls = [
+            asyncio.create_task(reader(f"poll{i}", PRIORITY_POLL)) for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(reader("agent", PRIORITY_INTERACTIVE))
+        await asyncio.gather(*polls, interactive)
+
+        assert order == ["agent", "poll0", "poll1", "poll2"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        """Test a cancelled acquire does not block later callers."""
+        limiter = RateLimiter(min_interval_s=0.05)
+        await limiter.acquire("inst1")
+
+        waiter = asyncio.create_task(limiter.acquire("inst1"))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert limiter.buckets["inst1"].waiters == []
+        await asyncio.wait_for(limiter.acquire("inst1"), 0.2)
+
+    @pytest.mark.asyncio
+    async def test_stats_report_queue_and_wait_histograms(self):
+        """Test queue depth and wait-time histograms are recorded."""
+        limiter = RateLimiter(min_interval_s=0.02)
+        await asyncio.gather(*(limiter.acquire("inst1") for _ in range(3)))
+
+        stats = limiter.get_stats()["inst1"]
+        assert stats["grants"] == 3
+        assert stats["rate_hz"] == pytest.approx(50.0)
+        assert stats["max_queue_depth"] == 2
+        assert sum(stats["wait_time_ms"].values()) == 3
+        assert stats["wait_time_ms"]["<=1"] == 1
+        assert sum(stats["queue_depth_on_arrival"].values()) == 3
+
+    @pytest.mark.asyncio
+    async def test_tools_apply_policy_file(self, tmp_path, monkeypatch):
+        """Test QCodesReadOnlyTools applies ~/.instrmcp/instruments.yaml."""
+        from unittest.mock import MagicMock
+        from instrmcp.servers.jupyter_qcodes import tools as tools_module
+        from instrmcp.utils import instrument_policy
+
+        path = tmp_path / "instruments.yaml"
+        path.write_text("instruments:\n  lockin:\n    rate_hz: 50\n    burst: 4\n")
+        monkeypatch.setattr(instrument_policy, "USER_POLICY_PATH", path)
+
+        mock_ipython = MagicMock()
+        mock_ipython.user_ns = {}
+        del mock_ipython.events
+        tools = tools_module.QCodesReadOnlyTools(mock_ipython)
+
+        assert tools.rate_limiter.policies["lockin"] == (50.0, 4)
+
+    @pytest.mark.parametrize(
+        "policy_file, instrument, expected",
+        [
+            # defaults with only burst keep the server's rate
+            ("defaults:\n  burst: 3\n", "dmm", (5.0, 3)),
+            # an entry without rate_hz keeps the default rate
+            ("instruments:\n  dmm:\n    bus: GPIB0\n", "dmm", (5.0, 1)),
+            (
+                "defaults:\n  rate_hz: 2\n  burst: 2\n"
+                "instruments:\n  dmm:\n    burst: 4\n",
+                "dmm",
+                (2.0, 4),
+            ),
+            # only an explicit null is unlimited
+            ("instruments:\n  dmm:\n    rate_hz: null\n", "dmm", (float("inf"), 1)),
+        ],
+    )
+    def test_tools_policy_inherits_left_out_rate(
+        self, tmp_path, monkeypatch, policy_file, instrument, expected
+    ):
+        """Test policy entries without rate_hz do not lift the rate limit."""
+        from unittest.mock import MagicMock
+        from instrmcp.servers.jupyter_qcodes import tools as tools_module
+        from instrmcp.utils import instrument_policy
+
+        path = tmp_path / "instruments.yaml"
+        path.write_text(policy_file)
+        monkeypatch.setattr(instrument_policy, "USER_POLICY_PATH", path)
+
+        mock_ipython = MagicMock()
+        mock_ipython.user_ns = {}
+        del mock_ipython.events
+        tools = tools_module.QCodesReadOnlyTools(mock_ipython, min_interval_s=0.2)
+
+        bucket = tools.rate_limiter._bucket(instrument)
+        assert (bucket.rate_hz, bucket.burst) == expected
+
+    def test_slow_instrument_timeout_keeps_default_rate(self, tmp_path, monkeypatch):
+        """Test an entry with only read_timeout_s sets the deadline, not the rate."""
+        from unittest.mock import MagicMock
+        from instrmcp.servers.jupyter_qcodes import tools as tools_module
+        from instrmcp.utils import instrument_policy
+
+        path = tmp_path / "instruments.yaml"
+        path.write_text("instruments:\n  keithley:\n    read_timeout_s: 30\n")
+        monkeypatch.setattr(instrument_policy, "USER_POLICY_PATH", path)
+
+        mock_ipython = MagicMock()
+        mock_ipython.user_ns = {}
+        del mock_ipython.events
+        tools = tools_module.QCodesReadOnlyTools(mock_ipython, min_interval_s=0.2)
+
+        bucket = tools.rate_limiter._bucket("keithley")
+        assert tools.instrument_io.get_timeout("keithley") == 30
+        assert (bucket.rate_hz, bucket.burst) == (5.0, 1)
+        assert "keithley" not in tools.rate_limiter.policies
+
+
 class TestParameterPoller:
     """Test ParameterPoller class for background parameter polling."""
 
@@ -220,7 +566,7 @@ class TestParameterPoller:
         assert poller.cache == cache
         assert poller.rate_limiter == limiter
         assert poller.subscriptions == {}
-        assert poller.tasks == {}
+        assert poller._scheduler is None
 
     @pytest.mark.asyncio
     async def test_poller_get_subscriptions(self):
@@ -249,13 +595,13 @@ class TestParameterPoller:
         await poller.subscribe("inst1", "param1", 0.1, mock_get_func)
 
         assert ("inst1", "param1") in poller.subscriptions
-        assert ("inst1", "param1") in poller.tasks
+        assert poller.running is True
 
         # Unsubscribe
         await poller.unsubscribe("inst1", "param1")
 
         assert ("inst1", "param1") not in poller.subscriptions
-        assert ("inst1", "param1") not in poller.tasks
+        await poller.stop_all()
 
     @pytest.mark.asyncio
     async def test_poller_stop_all(self):
@@ -272,14 +618,187 @@ class TestParameterPoller:
         await poller.subscribe("inst1", "param1", 0.1, mock_get_func)
         await poller.subscribe("inst2", "param2", 0.1, mock_get_func)
 
-        assert len(poller.tasks) == 2
+        assert poller.get_subscriptions()["active_tasks"] >= 1
 
         # Stop all
         await poller.stop_all()
 
-        assert len(poller.tasks) == 0
+        assert poller.get_subscriptions()["active_tasks"] == 0
+        assert poller.subscriptions == {}
         assert poller.running is False
 
+    @pytest.mark.asyncio
+    async def test_poller_batches_parameters_per_instrument(self):
+        """Test due parameters on one instrument are read in one batch."""
+        cache = ReadCache()
+        limiter = RateLimiter(min_interval_s=0.0)
+        poller = ParameterPoller(cache, limiter)
+        reads = []
+
+        def mock_get_func(inst, param):
+            reads.append((inst, param))
+            return 1.0
+
+        try:
+            for param in ("a", "b", "c"):
+                await poller.subscribe("inst1", param, 10.0, mock_get_func)
+            await poller.subscribe("inst2", "x", 10.0, mock_get_func)
+            await asyncio.sleep(0.1)
+        finally:
+            await poller.stop_all()
+
+        assert sorted(reads) == [
+            ("inst1", "a"),
+            ("inst1", "b"),
+            ("inst1", "c"),
+            ("inst2", "x"),
+        ]
+        # One batch per instrument
+        assert poller.batch_reads == 2
+        assert (await cache.get(("inst1", "b")))[0] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_poller_keeps_fixed_cadence(self):
+        """Test a subscription is polled repeatedly at its interval."""
+        cache = ReadCache()
+        limiter = RateLimiter(min_interval_s=0.0)
+        poller = ParameterPoller(cache, limiter)
+        reads = []
+
+        def mock_get_func(inst, param):
+            reads.append(time.monotonic())
+            return 1.0
+
+        try:
+            await poller.subscribe("inst1", "param1", 0.05, mock_get_func)
+            await asyncio.sleep(0.28)
+        finally:
+            await poller.stop_all()
+
+        assert 4 <= len(reads) <= 7
+
+    @pytest.mark.asyncio
+    async def test_poller_backs_off_on_errors(self):
+        """Test failing reads are retried with growing delays."""
+        cache = ReadCache()
+        limiter = RateLimiter(min_interval_s=0.0)
+        poller = ParameterPoller(cache, limiter, jitter=0.0)
+
+        def failing_get_func(inst, param):
+            raise RuntimeError("VISA timeout")
+
+        try:
+            await poller.subscribe("inst1", "param1", 0.05, failing_get_func)
+            await asyncio.sleep(0.28)
+            status = poller.get_subscriptions()
+        finally:
+            await poller.stop_all()
+
+        # Without backoff this would be ~6 reads; with it 0, 0.1, 0.3 (+0.4)
+        detail = status["details"][0]
+        assert 2 <= detail["errors"] <= 3
+        assert detail["consecutive_failures"] == detail["errors"]
+        assert "VISA timeout" in detail["last_error"]
+
+    @pytest.mark.asyncio
+    async def test_poller_instrument_faults_open_breaker(self):
+        """Test batches failing with instrument faults count toward the breaker."""
+        io = InstrumentIO(failure_threshold=2, reset_timeout_s=60.0)
+        poller = ParameterPoller(
+            ReadCache(), RateLimiter(min_interval_s=0.0), jitter=0.0, instrument_io=io
+        )
+
+        def failing_get_func(inst, param):
+            raise ConnectionError("VISA resource not found")
+
+        try:
+            await poller.subscribe("inst1", "param1", 0.02, failing_get_func)
+            await poller.subscribe("inst1", "param2", 0.02, failing_get_func)
+            await asyncio.sleep(0.15)
+            status = poller.get_subscriptions()
+        finally:
+            await poller.stop_all()
+            io.shutdown()
+
+        assert not io.is_available("inst1")
+        assert "VISA resource not found" in status["details"][0]["last_error"]
+
+    @pytest.mark.asyncio
+    async def test_failed_poll_settles_its_token(self):
+        """Test a failing poll does not give a later live read a free token."""
+        io = InstrumentIO(timeout_s=0.05)
+        limiter = RateLimiter(min_interval_s=0.2)
+        poller = ParameterPoller(ReadCache(), limiter, jitter=0.0, instrument_io=io)
+
+        def hanging_get_func(inst, param):
+            time.sleep(0.2)
+
+        try:
+            await poller.subscribe("inst1", "param1", 10.0, hanging_get_func)
+            await asyncio.sleep(0.1)
+            sub = poller.subscriptions[("inst1", "param1")]
+            assert sub.errors == 1
+            assert limiter.buckets["inst1"].outstanding == 0
+
+            # Once the token has refilled, a live read takes it
+            await asyncio.sleep(0.2)
+            assert await limiter.can_access("inst1")
+            await limiter.record_access("inst1")
+            assert not await limiter.can_access("inst1")
+        finally:
+            await poller.stop_all()
+            io.shutdown()
+
+    def test_poller_read_all_keeps_partial_failures(self):
+        """Test a batch with a successful read, or non-fault errors, does not raise."""
+
+        def read(inst, param):
+            if param == "ok":
+                return 1.0
+            raise ConnectionError("VISA timeout")
+
+        subs = [Subscription("inst1", p, 1.0, read, 0.0) for p in ("ok", "bad")]
+        results = ParameterPoller._read_all(subs)
+        assert [ok for ok, _, _ in results] == [True, False]
+
+        def invalid(inst, param):
+            raise ValueError("bad value")
+
+        results = ParameterPoller._read_all(
+            [Subscription("inst1", "p", 1.0, invalid, 0.0)]
+        )
+        assert results[0][0] is False
+
+        with pytest.raises(ConnectionError):
+            ParameterPoller._read_all(subs[1:])
+
+    @pytest.mark.asyncio
+    async def test_poller_resubscribe_replaces_interval(self):
+        """Test subscribing twice keeps one subscription with the new interval."""
+        cache = ReadCache()
+        limiter = RateLimiter(min_interval_s=0.0)
+        poller = ParameterPoller(cache, limiter)
+
+        def mock_get_func(inst, param):
+            return 1.0
+
+        try:
+            await poller.subscribe("inst1", "param1", 1.0, mock_get_func)
+            await poller.subscribe("inst1", "param1", 2.0, mock_get_func)
+            status = poller.get_subscriptions()
+        finally:
+            await poller.stop_all()
+
+        assert status["intervals"] == {("inst1", "param1"): 2.0}
+
+    @pytest.mark.asyncio
+    async def test_poller_rejects_non_positive_interval(self):
+        """Test interval validation."""
+        poller = ParameterPoller(ReadCache(), RateLimiter())
+
+        with pytest.raises(ValueError):
+            await poller.subscribe("inst1", "param1", 0, lambda i, p: 1.0)
+
 
 class TestGetSingleParameterValueRateLimiting:
     """Test _get_single_parameter_value method rate limiting behavior.
@@ -308,6 +827,18 @@ class TestGetSingleParameterValueRateLimiting:
 
         return tools
 
+    @pytest.mark.asyncio
+    async def test_failed_live_read_settles_its_token(self, mock_tools):
+        """Test a live read that raises does not leave its token outstanding."""
+        mock_tools._qcodes._read_parameter_live.side_effect = ConnectionError(
+            "VISA timeout"
+        )
+
+        with pytest.raises(ConnectionError):
+            await mock_tools._get_single_parameter_value("inst1", "voltage")
+
+        assert mock_tools.rate_limiter.buckets["inst1"].outstanding == 0
+
     @pytest.mark.asyncio
     async def test_first_read_with_recent_access_no_cache(self, mock_tools):
         """Test first read with recent access (no cache) waits before reading.
@@ -383,12 +914,27 @@ class TestGetSingleParameterValueRateLimiting:
         assert result["source"] == "cache"
         assert result["stale"] is True
         assert result["rate_limited"] is True
-        assert "Rate limited" in result["message"]
+        assert result["message"] == "Rate limited (10 reads/s, burst 1)"
+        assert result["rate_limit"] == {"rate_hz": 10.0, "burst": 1}
         assert result["age_seconds"] == pytest.approx(5.0, abs=0.1)
 
         # _read_parameter_live should NOT have been called
         mock_tools._qcodes._read_parameter_live.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_rate_limited_message_reports_instrument_policy(self, mock_tools):
+        """Test the rate-limited message names the instrument's own bucket."""
+        mock_tools.rate_limiter.set_policy("lockin", rate_hz=2.5, burst=3)
+        await mock_tools.cache.set(("lockin", "x"), 1.0)
+        for _ in range(3):
+            await mock_tools.rate_limiter.record_access("lockin")
+
+        result = await mock_tools._get_single_parameter_value("lockin", "x", fresh=True)
+
+        assert result["rate_limited"] is True
+        assert result["message"] == "Rate limited (2.5 reads/s, burst 3)"
+        assert result["rate_limit"] == {"rate_hz": 2.5, "burst": 3}
+
     @pytest.mark.asyncio
     async def test_fresh_true_no_cache_honors_rate_limiting(self, mock_tools):
         """Test fresh=True with no cache still honors rate limiting.
@@ -541,6 +1087,25 @@ class TestGetSingleParameterValueRateLimiting:
         # _read_parameter_live should have been called
         mock_tools._qcodes._read_parameter_live.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_max_age_triggers_live_read_for_old_entry(self, mock_tools):
+        """Test max_age_s forces a live read only when the entry is older."""
+        key = mock_tools._make_cache_key("inst1", "voltage")
+        await mock_tools.cache.set(key, 1.0, time.time() - 10.0)
+
+        recent = await mock_tools._get_single_parameter_value(
+            "inst1", "voltage", max_age_s=60.0
+        )
+        assert recent["source"] == "cache"
+        mock_tools._qcodes._read_parameter_live.assert_not_called()
+
+        old = await mock_tools._get_single_parameter_value(
+            "inst1", "voltage", max_age_s=5.0
+        )
+        assert old["source"] == "live"
+        assert old["value"] == 42.0
+        mock_tools._qcodes._read_parameter_live.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_cache_key_generation(self, mock_tools):
         """Test cache key generation for different parameter paths."""
@@ -0,0 +1,267 @@
+"""
+Unit tests for history.py and array_utils.py modules.
+
+Tests the per-parameter ring buffers, history queries, the LTTB and
+min-max decimation helpers and the array result encoding.
+"""
+
+import base64
+import json
+import time
+
+import numpy as np
+import pytest
+
+from instrmcp.servers.jupyter_qcodes.array_utils import (
+    encode_value,
+    lttb,
+    minmax_decimate,
+)
+from instrmcp.servers.jupyter_qcodes.cache import ReadCache
+from instrmcp.servers.jupyter_qcodes.history import ParameterHistory, RingBuffer
+
+
+class TestRingBuffer:
+    """Test RingBuffer class."""
+
+    def test_returns_points_in_insertion_order_after_wrap(self):
+        """Test the oldest points are overwritten once full."""
+        buffer = RingBuffer(4)
+        for i in range(6):
+            buffer.append(float(i), float(i * 10))
+
+        timestamps, values = buffer.arrays()
+
+        assert timestamps.tolist() == [2.0, 3.0, 4.0, 5.0]
+        assert values.tolist() == [20.0, 30.0, 40.0, 50.0]
+        assert buffer.nbytes == 4 * 16
+
+
+class TestParameterHistory:
+    """Test ParameterHistory class."""
+
+    def test_records_only_real_numbers(self):
+        """Test strings and arrays are skipped, numpy scalars recorded."""
+        history = ParameterHistory(capacity=8)
+        key = ("dmm", "volt")
+        history.record(key, 1.5, 1.0)
+        history.record(key, np.float32(2.5), 2.0)
+        history.record(key, "dc", 3.0)
+        history.record(key, np.arange(3), 4.0)
+
+        assert history.query(key)["count"] == 2
+        assert history.skipped == 2
+
+    def test_booleans_not_recorded(self):
+        """Test on/off values are skipped although bool is a Real."""
+        history = ParameterHistory(capacity=8)
+        key = ("switch", "state")
+        history.record(key, True, 1.0)
+        history.record(key, np.bool_(False), 2.0)
+
+        assert key not in history.series
+        assert history.skipped == 2
+
+    def test_infinite_values_left_out_of_stats(self):
+        """Test infinities are kept in the series but not in the statistics."""
+        history = ParameterHistory()
+        key = ("inst", "p")
+        for ts, value in enumerate([1.0, np.inf, 3.0, -np.inf]):
+            history.record(key, value, float(ts))
+
+        result = history.query(key, method="minmax", max_points=10)
+
+        assert result["count"] == 4
+        assert result["min"] == 1.0
+        assert result["max"] == 3.0
+        assert result["mean"] == 2.0
+        assert result["last"] is None
+        assert [point[1] for point in result["series"]] == [1.0, None, 3.0, None]
+        json.dumps(result, allow_nan=False)
+
+    def test_memory_bounded_per_parameter_and_series(self):
+        """Test capacity and max_series bound the memory use."""
+        history = ParameterHistory(capacity=16, max_series=2)
+        for name in ("a", "b", "c"):
+            for i in range(100):
+                history.record(("inst", name), i, float(i))
+
+        assert list(history.series) == [("inst", "b"), ("inst", "c")]
+        stats = history.get_stats()
+        assert stats["bytes"] == 2 * 16 * 16
+        assert history.query(("inst", "c"))["count"] == 16
+
+    def test_query_window_and_stats(self):
+        """Test window selection and summary statistics."""
+        history = ParameterHistory()
+        key = ("fridge", "mxc_temperature")
+        now = time.time()
+        for i, value in enumerate([10.0, 12.0, 14.0, 16.0]):
+            history.record(key, value, now - 30 + i * 10)
+
+        result = history.query(key, window_s=15)
+
+        assert result["count"] == 2
+        assert result["min"] == 14.0
+        assert result["max"] == 16.0
+        assert result["mean"] == 15.0
+        assert result["last"] == 16.0
+        assert "series" not in result
+
+    def test_query_sorts_out_of_order_points(self):
+        """Test points recorded slightly out of order are sorted."""
+        history = ParameterHistory()
+        key = ("inst", "p")
+        for ts in (1.0, 3.0, 2.0):
+            history.record(key, ts, ts)
+
+        result = history.query(key, method="minmax", max_points=10)
+
+        assert [point[0] for point in result["series"]] == [1.0, 2.0, 3.0]
+
+    def test_query_errors(self):
+        """Test unknown parameters and methods."""
+        history = ParameterHistory()
+        with pytest.raises(KeyError):
+            history.query(("inst", "missing"))
+
+        history.record(("inst", "p"), 1.0, 1.0)
+        with pytest.raises(ValueError, match="Unknown method"):
+            history.query(("inst", "p"), method="fft")
+
+    @pytest.mark.asyncio
+    async def test_cache_set_records_history(self):
+        """Test values stored in ReadCache are recorded."""
+        history = ParameterHistory()
+        cache = ReadCache(history=history)
+
+        await cache.set(("inst", "p"), 1.0, 10.0)
+        await cache.set(("inst", "p"), 2.0, 11.0)
+
+        assert history.query(("inst", "p"))["count"] == 2
+
+
+class TestDecimation:
+    """Test LTTB and min-max decimation."""
+
+    def test_minmax_keeps_spike_and_bounds_points(self):
+        """Test a single spike survives min-max decimation."""
+        x = np.arange(10000, dtype=np.float64)
+        y = np.zeros_like(x)
+        y[4321] = 100.0
+        y[777] = -50.0
+
+        dx, dy = minmax_decimate(x, y, 100)
+
+        assert len(dx) <= 100
+        assert 100.0 in dy and -50.0 in dy
+        assert np.all(np.diff(dx) > 0)
+
+    def test_minmax_ignores_nan(self):
+        """Test NaN is not picked as a bucket extreme."""
+        x = np.arange(100, dtype=np.float64)
+        y = np.sin(x)
+        y[::3] = np.nan
+
+        _, dy = minmax_decimate(x, y, 10)
+
+        assert not np.isnan(dy).any()
+
+    def test_lttb_keeps_endpoints_and_peak(self):
+        """Test LTTB keeps first/last points and a sharp peak."""
+        x = np.arange(5000, dtype=np.float64)
+        y = np.sin(x / 500.0)
+        y[2500] = 10.0
+
+        dx, dy = lttb(x, y, 50)
+
+        assert len(dx) == 50
+        assert dx[0] == 0 and dx[-1] == 4999
+        assert 10.0 in dy
+        assert np.all(np.diff(dx) > 0)
+
+    def test_short_series_returned_unchanged(self):
+        """Test series within the budget are not decimated."""
+        x = np.arange(5, dtype=np.float64)
+
+        assert lttb(x, x, 10)[0].tolist() == x.tolist()
+        assert minmax_decimate(x, x, 10)[0].tolist() == x.tolist()
+
+
+class TestEncodeValue:
+    """Test array-aware encoding of parameter values."""
+
+    def test_small_arrays_and_scalars_inline(self):
+        """Test short arrays become lists and NumPy scalars Python scalars."""
+        assert encode_value(np.arange(3.0)) == [0.0, 1.0, 2.0]
+        assert encode_value(np.array([1 + 2j])) == [[1.0, 2.0]]
+        assert encode_value(np.int64(7)) == 7
+        assert encode_value("dc") == "dc"
+
+    def test_large_array_summarized_by_default(self):
+        """Test a long trace is reduced to shape, dtype and statistics."""
+        trace = np.linspace(0.0, 1.0, 100_000)
+        trace[5] = np.nan
+
+        encoded = encode_value(trace)
+
+        assert encoded["shape"] == [100_000]
+        assert encoded["dtype"] == "<f8"
+        assert encoded["nan_count"] == 1
+        assert encoded["min"] == 0.0
+        assert encoded["max"] == 1.0
+        assert "data" not in encoded
+        json.dumps(encoded, allow_nan=False)
+
+    def test_infinite_values_left_out_of_summary(self):
+        """Test infinities are counted, not used in the statistics."""
+        trace = np.linspace(0.0, 1.0, 1000)
+        trace[3] = np.inf
+        trace[7] = -np.inf
+        trace[9] = np.nan
+
+        encoded = encode_value(trace)
+
+        assert encoded["inf_count"] == 2
+        assert encoded["nan_count"] == 1
+        assert encoded["min"] == 0.0
+        assert encoded["max"] == 1.0
+        json.dumps(encoded, allow_nan=False)
+
+    def test_preview_keeps_spikes(self):
+        """Test the preview is decimated but keeps the extremes."""
+        trace = np.zeros(10_000)
+        trace[4321] = 5.0
+
+        preview = encode_value(trace, "preview", max_points=100)["preview"]
+
+        assert len(preview["values"]) <= 100
+        assert 4321 in preview["index"]
+        assert max(preview["values"]) == 5.0
+
+    def test_base64_round_trip(self):
+        """Test the base64 buffer decodes back to the array."""
+        array = np.arange(200, dtype=np.float32).reshape(10, 20)[:, ::2]
+
+        encoded = encode_value(array, "base64")
+        decoded = np.frombuffer(
+            base64.b64decode(encoded["data"]), dtype=encoded["dtype"]
+        ).reshape(encoded["shape"])
+
+        np.testing.assert_array_equal(decoded, array)
+
+    def test_npy_export(self, tmp_path, monkeypatch):
+        """Test the npy mode writes a loadable temporary file."""
+        from instrmcp.servers.jupyter_qcodes import array_utils
+
+        monkeypatch.setattr(array_utils, "ARRAY_EXPORT_DIR", tmp_path)
+        array = np.arange(1000, dtype=np.int16)
+
+        encoded = encode_value(array, "npy")
+
+        np.testing.assert_array_equal(np.load(encoded["path"]), array)
+
+    def test_unknown_mode_rejected(self):
+        """Test an unknown mode raises."""
+        with pytest.raises(ValueError):
+            encode_value(np.arange(100), "csv")
@@ -0,0 +1,235 @@
+"""
+Unit tests for instrument_io.py module.
+
+Tests the per-instrument executors, bus grouping, queue bounds, deadlines,
+circuit breakers and statistics used for blocking hardware calls.
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from instrmcp.servers.jupyter_qcodes.instrument_io import (
+    InstrumentIO,
+    InstrumentQueueFull,
+    InstrumentTimeout,
+    InstrumentUnavailable,
+    detect_bus,
+    is_instrument_fault,
+)
+
+
+@pytest.fixture
+def io():
+    instrument_io = InstrumentIO(max_pending=4)
+    yield instrument_io
+    instrument_io.shutdown()
+
+
+class TestInstrumentIO:
+    """Test InstrumentIO class."""
+
+    @pytest.mark.asyncio
+    async def test_run_returns_result_on_named_thread(self, io):
+        """Test calls run on the instrument's own executor thread."""
+        name = await io.run("dmm", lambda: threading.current_thread().name)
+
+        assert name.startswith("instrmcp-io-dmm")
+        assert io.get_stats()["dmm"]["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_hung_instrument_does_not_block_others(self, io):
+        """Test a slow instrument does not delay another instrument."""
+        release = threading.Event()
+        slow = asyncio.ensure_future(io.run("vna", release.wait, 2.0))
+        await asyncio.sleep(0.01)
+
+        start = time.monotonic()
+        assert await io.run("dmm", lambda: 42) == 42
+        assert time.monotonic() - start < 0.5
+
+        release.set()
+        await slow
+
+    @pytest.mark.asyncio
+    async def test_bus_group_serializes_instruments(self, io):
+        """Test instruments assigned to one bus share a single worker."""
+        io.assign("dmm1", "GPIB0")
+        io.assign("dmm2", "GPIB0")
+
+        threads = await asyncio.gather(
+            io.run("dmm1", lambda: threading.current_thread().ident),
+            io.run("dmm2", lambda: threading.current_thread().ident),
+        )
+
+        assert threads[0] == threads[1]
+        assert sorted(io.get_stats()["GPIB0"]["instruments"]) == ["dmm1", "dmm2"]
+
+    @pytest.mark.asyncio
+    async def test_queue_bound_rejects_excess_calls(self, io):
+        """Test calls beyond max_pending fail fast."""
+        release = threading.Event()
+        pending = [
+            asyncio.ensure_future(io.run("vna", release.wait, 2.0)) for _ in range(4)
+        ]
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(InstrumentQueueFull, match="vna"):
+            await io.run("vna", lambda: None)
+
+        stats = io.get_stats()["vna"]
+        assert stats["running"] == 1
+        assert stats["queued"] == 3
+        assert stats["rejected"] == 1
+
+        release.set()
+        await asyncio.gather(*pending)
+        assert io.get_stats()["vna"]["queued"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_queued_call_releases_slot(self, io):
+        """Test cancelling a queued call frees its queue slot."""
+        release = threading.Event()
+        running = asyncio.ensure_future(io.run("vna", release.wait, 2.0))
+        await asyncio.sleep(0.01)
+        queued = asyncio.ensure_future(io.run("vna", lambda: None))
+        await asyncio.sleep(0.01)
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        assert io.get_stats()["vna"]["queued"] == 0
+
+        release.set()
+        await running
+
+    @pytest.mark.asyncio
+    async def test_failures_are_counted(self, io):
+        """Test exceptions propagate and count as failed."""
+
+        def fail():
+            raise RuntimeError("VISA timeout")
+
+        with pytest.raises(RuntimeError, match="VISA timeout"):
+            await io.run("dmm", fail)
+
+        assert io.get_stats()["dmm"]["failed"] == 1
+
+
+class TestDeadlinesAndCircuitBreaker:
+    """Test per-call deadlines and the per-instrument circuit breaker."""
+
+    @pytest.fixture
+    def fast_io(self):
+        instrument_io = InstrumentIO(
+            timeout_s=0.2, failure_threshold=2, reset_timeout_s=0.05
+        )
+        yield instrument_io
+        instrument_io.shutdown()
+
+    @staticmethod
+    def _visa_timeout():
+        raise TimeoutError("VI_ERROR_TMO")
+
+    @pytest.mark.asyncio
+    async def test_deadline_bounds_hung_call(self, fast_io):
+        """Test a hung call fails at its deadline."""
+        release = threading.Event()
+        start = time.monotonic()
+
+        with pytest.raises(InstrumentTimeout):
+            await fast_io.run("smu", release.wait, 2.0)
+
+        assert time.monotonic() - start < 1.0
+        release.set()
+
+    @pytest.mark.asyncio
+    async def test_per_instrument_deadline(self, fast_io):
+        """Test set_timeout overrides the default deadline."""
+        fast_io.set_timeout("vna", 1.0)
+
+        assert await fast_io.run("vna", time.sleep, 0.1) is None
+        assert fast_io.get_timeout("smu") == 0.2
+
+    @pytest.mark.asyncio
+    async def test_breaker_opens_and_short_circuits(self, fast_io):
+        """Test repeated faults open the breaker and later calls fail fast."""
+        fast_io.reset_timeout_s = 10.0
+        for _ in range(2):
+            with pytest.raises(TimeoutError):
+                await fast_io.run("smu", self._visa_timeout)
+
+        called = []
+        with pytest.raises(InstrumentUnavailable) as excinfo:
+            await fast_io.run("smu", lambda: called.append(1))
+
+        assert called == []
+        assert excinfo.value.breaker["state"] == "open"
+        assert fast_io.is_available("dmm") is True
+        stats = fast_io.get_breaker_stats()["smu"]
+        assert stats["trips"] == 1
+        assert stats["short_circuited"] == 1
+        assert "VI_ERROR_TMO" in stats["last_error"]
+
+    @pytest.mark.asyncio
+    async def test_non_fault_errors_do_not_open_breaker(self, fast_io):
+        """Test driver errors from a responsive instrument are not counted."""
+
+        def bad_response():
+            raise ValueError("could not convert 'OVLD' to float")
+
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                await fast_io.run("smu", bad_response)
+
+        assert fast_io.is_available("smu") is True
+
+    @pytest.mark.asyncio
+    async def test_probe_closes_breaker_after_recovery(self, fast_io):
+        """Test the half-open probe closes the breaker once calls succeed."""
+        healthy = threading.Event()
+
+        def read():
+            if not healthy.is_set():
+                raise TimeoutError("VI_ERROR_TMO")
+            return 1.0
+
+        for _ in range(2):
+            with pytest.raises(TimeoutError):
+                await fast_io.run("smu", read)
+        assert fast_io.is_available("smu") is False
+
+        # First probe fails and backs off, the next one succeeds
+        await asyncio.sleep(0.08)
+        assert fast_io.breaker_state("smu")["trips"] == 2
+        healthy.set()
+        await asyncio.sleep(0.2)
+
+        assert fast_io.is_available("smu") is True
+        assert await fast_io.run("smu", read) == 1.0
+
+    def test_fault_classification(self):
+        """Test which errors count as instrument faults."""
+        assert is_instrument_fault(TimeoutError())
+        assert is_instrument_fault(ConnectionResetError())
+        assert is_instrument_fault(InstrumentTimeout())
+        assert not is_instrument_fault(ValueError())
+        assert not is_instrument_fault(KeyError())
+
+
+class TestDetectBus:
+    """Test detect_bus function."""
+
+    def test_gpib_address(self):
+        """Test GPIB instruments are grouped by board."""
+        assert detect_bus(SimpleNamespace(_address="GPIB0::12::INSTR")) == "GPIB0"
+        handle = SimpleNamespace(resource_name="gpib1::3::INSTR")
+        assert detect_bus(SimpleNamespace(visa_handle=handle)) == "GPIB1"
+
+    def test_other_interfaces_not_grouped(self):
+        """Test network and USB instruments get their own executor."""
+        assert detect_bus(SimpleNamespace(_address="TCPIP0::10.0.0.2::INSTR")) is None
+        assert detect_bus(object()) is None
@@ -0,0 +1,94 @@
+"""
+Unit tests for instrument_policy.py module.
+
+Tests loading and validation of per-instrument access policies.
+"""
+
+import pytest
+
+from instrmcp.utils.instrument_policy import (
+    InstrumentPolicy,
+    InstrumentPolicyConfig,
+    load_policies,
+)
+
+
+class TestInstrumentPolicy:
+    """Test InstrumentPolicy Pydantic model."""
+
+    def test_defaults(self):
+        """Test an empty policy inherits its rate and burst."""
+        policy = InstrumentPolicy()
+        assert policy.rate_hz is None
+        assert policy.burst == 1
+        assert not policy.sets_rate()
+        assert policy.rate_and_burst(5.0, 3) == (5.0, 3)
+
+    def test_explicit_null_rate_is_unlimited(self):
+        """Test only an explicit rate_hz: null lifts the inherited rate."""
+        policy = InstrumentPolicy.model_validate({"rate_hz": None})
+        assert policy.sets_rate()
+        assert policy.rate_and_burst(5.0, 3) == (None, 3)
+
+    def test_rejects_non_positive_values(self):
+        """Test rate and burst validation."""
+        with pytest.raises(ValueError):
+            InstrumentPolicy(rate_hz=0)
+        with pytest.raises(ValueError):
+            InstrumentPolicy(burst=0)
+
+
+class TestLoadPolicies:
+    """Test load_policies function."""
+
+    def test_missing_file_returns_empty_config(self, tmp_path):
+        """Test a missing policy file is not an error."""
+        config = load_policies(tmp_path / "instruments.yaml")
+        assert config == InstrumentPolicyConfig()
+
+    def test_load_valid_file(self, tmp_path):
+        """Test loading defaults and per-instrument policies."""
+        path = tmp_path / "instruments.yaml"
+        path.write_text(
+            "defaults:\n"
+            "  rate_hz: 5\n"
+            "instruments:\n"
+            "  lockin:\n"
+            "    rate_hz: 50\n"
+            "    burst: 10\n"
+            "  dac:\n"
+            "    rate_hz: null\n"
+            "    bus: GPIB0\n"
+        )
+
+        config = load_policies(path)
+
+        assert config.defaults.rate_hz == 5
+        assert config.instruments["lockin"].burst == 10
+        assert config.instruments["dac"].rate_hz is None
+        assert config.instruments["dac"].bus == "GPIB0"
+
+    def test_invalid_file_raises_value_error(self, tmp_path):
+        """Test validation errors name the file."""
+        path = tmp_path / "instruments.yaml"
+        path.write_text("instruments:\n  lockin:\n    burst: -1\n")
+
+        with pytest.raises(ValueError, match="instruments.yaml"):
+            load_policies(path)
+
+    def test_persistence_disabled_by_default(self, tmp_path):
+        """Test warm-start persistence is opt-in and configurable."""
+        path = tmp_path / "instruments.yaml"
+        path.write_text(
+            "persistence:\n"
+            "  enabled: true\n"
+            f"  path: {tmp_path / 'warm.sqlite'}\n"
+            "  save_interval_s: 5\n"
+        )
+
+        config = load_policies(path)
+
+        assert InstrumentPolicyConfig().persistence.enabled is False
+        assert config.persistence.enabled is True
+        assert config.persistence.path == tmp_path / "warm.sqlite"
+        assert config.persistence.save_interval_s == 5
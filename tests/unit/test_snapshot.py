@@ -0,0 +1,122 @@
+"""
+Unit tests for snapshot.py module.
+
+Tests the versioned structural snapshot store and JSONPath-style subtree
+selection.
+"""
+
+import pytest
+
+from instrmcp.servers.jupyter_qcodes.snapshot import (
+    SnapshotStore,
+    parse_path,
+    select_path,
+)
+
+
+class _Instrument:
+    """Stand-in with the attributes used by structure_fingerprint."""
+
+    def __init__(self):
+        self.parameters = {"voltage": object()}
+        self.submodules = {}
+
+
+class TestSnapshotStore:
+    """Test SnapshotStore class."""
+
+    def test_version_only_bumps_on_content_change(self):
+        """Test storing an identical snapshot keeps its version."""
+        store = SnapshotStore()
+        inst = _Instrument()
+
+        first = store.store("dac", {"name": "dac"}, inst)
+        again = store.store("dac", {"name": "dac"}, inst)
+        changed = store.store("dac", {"name": "dac", "label": "DAC"}, inst)
+
+        assert first.version == again.version == 1
+        assert changed.version == store.version == 2
+
+    def test_entry_invalidated_by_rebinding_or_structure_change(self):
+        """Test cached entries are tied to the object and its structure."""
+        store = SnapshotStore()
+        inst = _Instrument()
+        store.store("dac", {"name": "dac"}, inst)
+
+        assert store.get("dac", inst) is not None
+        assert store.get("dac", _Instrument()) is None
+        inst.submodules["ch01"] = object()
+        assert store.get("dac", inst) is None
+
+    def test_changes_since_tracks_changed_joined_and_removed(self):
+        """Test delta queries report changes after a given version."""
+        store = SnapshotStore()
+        for name in ("dac", "dmm"):
+            store.store(name, {"name": name}, _Instrument())
+        store.set_members(["dac", "dmm"])
+        baseline = store.version
+
+        store.store("dac", {"name": "dac", "label": "new"}, _Instrument())
+        store.store("vna", {"name": "vna"}, _Instrument())
+        store.set_members(["dac", "vna"])
+
+        changed, removed = store.changes_since(baseline)
+        assert sorted(changed) == ["dac", "vna"]
+        assert removed == ["dmm"]
+        assert store.changes_since(store.version) == ([], [])
+
+
+class TestSelectPath:
+    """Test JSONPath-style selection."""
+
+    @pytest.fixture
+    def tree(self):
+        return {
+            "instruments": {
+                "dac": {
+                    "submodules": {
+                        "ch01": {"parameters": {"voltage": {"unit": "V"}}},
+                        "ch02": {"parameters": {"voltage": {"unit": "mV"}}},
+                    }
+                },
+                "my.dev": {"parameters": {"x": {"unit": "A"}}},
+            },
+            "default_measurement": ["dac", "dmm"],
+        }
+
+    def test_exact_path(self, tree):
+        """Test a plain dotted path selects one subtree."""
+        result = select_path(tree, "$.instruments.dac.submodules.ch01")
+
+        assert result == {
+            "$.instruments.dac.submodules.ch01": {
+                "parameters": {"voltage": {"unit": "V"}}
+            }
+        }
+
+    def test_glob_segments(self, tree):
+        """Test * and glob keys fan out to every match."""
+        result = select_path(tree, "instruments.dac.submodules.ch0*.parameters.*.unit")
+
+        assert result == {
+            "$.instruments.dac.submodules.ch01.parameters.voltage.unit": "V",
+            "$.instruments.dac.submodules.ch02.parameters.voltage.unit": "mV",
+        }
+
+    def test_quoted_keys_and_indices(self, tree):
+        """Test quoted keys and list indices."""
+        assert select_path(tree, "instruments['my.dev'].parameters.x.unit") == {
+            "$.instruments['my.dev'].parameters.x.unit": "A"
+        }
+        assert select_path(tree, "default_measurement[1]") == {
+            "$.default_measurement[1]": "dmm"
+        }
+
+    def test_missing_path_matches_nothing(self, tree):
+        """Test an unknown key yields no matches rather than an error."""
+        assert select_path(tree, "instruments.vna") == {}
+
+    def test_invalid_path_raises(self):
+        """Test malformed paths are rejected."""
+        with pytest.raises(ValueError):
+            parse_path("instruments..dac")
@@ -0,0 +1,90 @@
+"""
+Unit tests for warm_start.py module.
+
+Tests saving and loading of warm-start state in the SQLite store.
+"""
+
+import time
+
+import numpy as np
+
+from instrmcp.servers.jupyter_qcodes.warm_start import InstrumentState, WarmStartStore
+
+
+def _state(**kwargs):
+    return InstrumentState(
+        class_name="qcodes.instrument.instrument.Instrument",
+        fingerprint=[1, ["ch01"]],
+        **kwargs,
+    )
+
+
+class TestWarmStartStore:
+    """Test WarmStartStore class."""
+
+    def test_missing_file_loads_empty(self, tmp_path):
+        """Test a store without a file has nothing to restore."""
+        assert WarmStartStore(tmp_path / "warm.sqlite").load() == {}
+
+    def test_round_trip(self, tmp_path):
+        """Test index, values and subscriptions survive a save and load."""
+        store = WarmStartStore(tmp_path / "warm.sqlite")
+        now = time.time()
+        store.save(
+            {
+                "dac": _state(
+                    paths=["mode", "ch01.voltage"],
+                    max_depth=4,
+                    values={"ch01.voltage": (1.5, now), "mode": ("dc", now)},
+                    subscriptions={"ch01.voltage": 2.0},
+                )
+            }
+        )
+
+        loaded = WarmStartStore(tmp_path / "warm.sqlite").load()
+
+        assert loaded["dac"] == _state(
+            paths=["mode", "ch01.voltage"],
+            max_depth=4,
+            values={"ch01.voltage": (1.5, now), "mode": ("dc", now)},
+            subscriptions={"ch01.voltage": 2.0},
+        )
+
+    def test_skips_arrays_and_unserializable_values(self, tmp_path):
+        """Test only JSON-representable values are saved."""
+        store = WarmStartStore(tmp_path / "warm.sqlite")
+        now = time.time()
+        store.save(
+            {
+                "vna": _state(
+                    values={
+                        "trace": (np.arange(10.0), now),
+                        "power": (np.float64(-10.0), now),
+                        "handle": (object(), now),
+                    }
+                )
+            }
+        )
+
+        assert store.load()["vna"].values == {"power": (-10.0, now)}
+
+    def test_old_values_are_not_restored(self, tmp_path):
+        """Test max_value_age_s drops values older than the limit."""
+        path = tmp_path / "warm.sqlite"
+        now = time.time()
+        WarmStartStore(path).save(
+            {"dmm": _state(values={"volt": (1.0, now - 600), "curr": (2.0, now)})}
+        )
+
+        loaded = WarmStartStore(path, max_value_age_s=60).load()
+
+        assert loaded["dmm"].values == {"curr": (2.0, now)}
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        """Test an unreadable file does not prevent startup."""
+        path = tmp_path / "warm.sqlite"
+        path.write_bytes(b"not a database")
+        store = WarmStartStore(path)
+
+        assert store.load() == {}
+        assert store.last_error is not None
@@ -76,6 +76,51 @@ TOOL_SCHEMAS = {
         },
         "required": ["queries"],
     },
+    "qcodes_subscribe_parameter": {
+        "type": "object",
+        "properties": {
+            "instrument": _prop("string"),
+            "parameter": _prop("string"),
+            "interval_s": _prop("number", default=1.0),
+        },
+        "required": ["instrument", "parameter"],
+    },
+    "qcodes_unsubscribe_parameter": {
+        "type": "object",
+        "properties": {
+            "instrument": _prop("string"),
+            "parameter": _prop("string"),
+        },
+        "required": ["instrument", "parameter"],
+    },
+    "qcodes_list_subscriptions": {
+        "type": "object",
+        "properties": {
+            "detailed": _prop("boolean", default=False),
+        },
+        "required": [],
+    },
+    "qcodes_get_parameter_history": {
+        "type": "object",
+        "properties": {
+            "instrument": _prop("string"),
+            "parameter": _prop("string"),
+            "window_s": _prop("number", default=None, nullable=True),
+            "method": _prop("string", default="stats"),
+            "max_points": _prop("integer", default=200),
+        },
+        "required": ["instrument", "parameter"],
+    },
+    "qcodes_station_snapshot": {
+        "type": "object",
+        "properties": {
+            "since_version": _prop("integer", default=None, nullable=True),
+            "path": _prop("string", default=None, nullable=True),
+            "refresh": _prop("boolean", default=False),
+            "timeout_s": _prop("number", default=None, nullable=True),
+        },
+        "required": [],
+    },
     # --- Notebook tools (read-only) ---
     "notebook_list_variables": {
         "type": "object",
@@ -204,6 +249,8 @@ TOOL_SCHEMAS = {
             "database_path": _prop("string", default=None, nullable=True),
             "detailed": _prop("boolean", default=False),
             "scan_nested": _prop("boolean", default=False),
+            "after_exp_id": _prop("integer", default=None, nullable=True),
+            "limit": _prop("integer", default=None, nullable=True),
         },
         "required": [],
     },
@@ -217,6 +264,30 @@ TOOL_SCHEMAS = {
         },
         "required": ["id"],
     },
+    "database_get_run_data": {
+        "type": "object",
+        "properties": {
+            "id": _prop("integer"),
+            "database_path": _prop("string", default=None, nullable=True),
+            "params": _prop("array", default=None, nullable=True),
+            "after_row": _prop("integer", default=0),
+            "limit": _prop("integer", default=1000),
+            "mode": _prop("string", default="summary"),
+            "max_points": _prop("integer", default=200),
+        },
+        "required": ["id"],
+    },
+    "database_get_run_preview": {
+        "type": "object",
+        "properties": {
+            "id": _prop("integer"),
+            "database_path": _prop("string", default=None, nullable=True),
+            "param": _prop("string", default=None, nullable=True),
+            "resolution": _prop("integer", default=64),
+            "method": _prop("string", default="minmax"),
+        },
+        "required": ["id"],
+    },
     "database_get_database_stats": {
         "type": "object",
         "properties": {